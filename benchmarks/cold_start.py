@@ -0,0 +1,50 @@
+"""
+Cold start budget: the time to import hdwallet.main (what `python -m hdwallet.main` pays before the start menu)
+measured with -X importtime in fresh interpreters. Exits with 1 when the median goes over the budget.
+
+    python benchmarks/cold_start.py [budget_ms] [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS = float(os.environ.get("COLD_START_BUDGET_MS", 50))
+RUNS = 7
+TARGET = "hdwallet.main"
+
+
+def measure() -> dict:
+    """
+    {module: (self_us, cumulative_us)} for one fresh import of TARGET
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stderr
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main(budget_ms: float = BUDGET_MS, runs: int = RUNS) -> int:
+    samples = [measure() for _ in range(runs)]
+    median_ms = statistics.median(sample[TARGET][1] for sample in samples) / 1000
+    print(f"import {TARGET}: median {median_ms:.1f} ms over {runs} runs, budget {budget_ms:.1f} ms")
+    print("heaviest modules by self time in the last run:")
+    for module, (self_us, _) in sorted(samples[-1].items(), key=lambda item: -item[1][0])[:10]:
+        print(f"  {self_us / 1000:6.1f} ms  {module}")
+    if median_ms > budget_ms:
+        print("over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(float(arg) for arg in sys.argv[1:2]), *(int(arg) for arg in sys.argv[2:3])))
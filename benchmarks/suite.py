@@ -0,0 +1,247 @@
+"""
+Offline benchmarks of the wallet hot paths against a stub NETWORK_API, for wallets of 10, 1k and 10k addresses.
+
+Every size runs in fresh interpreters started in an empty directory, so the caches are cold: repeatedly for the
+timings and thread counts, once more under tracemalloc for the peak memory (tracemalloc slows allocation heavy
+code down, its timings would not be comparable). Peak memory is the Python heap of the main process, the derivation
+process pool is not included.
+
+    python benchmarks/suite.py [--sizes 10,1000,10000] [--repeat 3] [--output results.json] [--compare baseline.json]
+
+The JSON written by --output can be given to --compare of a later run, which exits with 1 when a case got
+slower or bigger than the threshold allows.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIZES = (10, 1000, 10000)
+SEED = bytes(range(64))
+PATH = "m/44'/236'/0'"
+CHAIN_HEIGHT = 800000
+METRICS = ("seconds", "peak_kib")
+WORKER_OUTPUT = "results.json"
+
+
+def gap_limit(size: int) -> int:
+    # a quarter of each chain stays unused, the rest has history and unspents
+    return max(1, min(20, size // 4))
+
+
+class StubNetwork:
+    """
+    Answers like WhatsOnChain without a network: used addresses have one transaction and two unspents
+    """
+
+    def __init__(self, used_addresses: List[str]):
+        self._used = set(used_addresses)
+
+    def install(self, api):
+        # instance attributes shadow the methods for every module holding the NETWORK_API singleton
+        for name in ("get_chain_height", "get_history", "get_transactions", "get_transaction", "get_unspents"):
+            setattr(api, name, getattr(self, name))
+
+    @staticmethod
+    def _txid(address: str) -> str:
+        return address.encode().hex().ljust(64, "0")[:64]
+
+    def get_chain_height(self) -> int:
+        return CHAIN_HEIGHT
+
+    def get_history(self, address: str) -> List[dict]:
+        return [{"tx_hash": self._txid(address), "height": CHAIN_HEIGHT - 100}] if address in self._used else []
+
+    def get_transactions(self, address: str) -> List[str]:
+        return [entry["tx_hash"] for entry in self.get_history(address)]
+
+    def get_transaction(self, txid: str):
+        from bitsv.network.transaction import Transaction
+        return Transaction(txid, [], [])
+
+    def get_unspents(self, address: str):
+        from bitsv.network.meta import Unspent
+        if address not in self._used:
+            return []
+        return [Unspent(1000 + txindex, 101, self._txid(address), txindex) for txindex in range(2)]
+
+
+@contextmanager
+def measure(results: List[dict], case: str, trace: bool):
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    yield
+    result = {"case": case}
+    if trace:
+        result["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    else:
+        result["seconds"] = time.perf_counter() - start
+        result["threads"] = threading.active_count()
+    results.append(result)
+
+
+def run_cases(size: int, trace: bool) -> List[dict]:
+    from bip_utils import Bip32Secp256k1
+
+    from hdwallet.core.derivation import derive_keys
+    from hdwallet.core.key import Key
+    from hdwallet.core.network import NETWORK_API
+    from hdwallet.core.wallet import Wallet
+    from hdwallet.storage.unspents import USP_STORE
+
+    results = []
+    master = Bip32Secp256k1.FromSeedAndPath(SEED, PATH)
+    per_chain = size // 2
+
+    with measure(results, "derive_cold", trace):
+        chains = [derive_keys(master.ChildKey(change), 0, per_chain) for change in (0, 1)]
+    with measure(results, "derive_warm", trace):
+        chains = [derive_keys(master.ChildKey(change), 0, per_chain) for change in (0, 1)]
+
+    public_keys = [key.public_key for chain in chains for key in chain]
+    with measure(results, "key_init", trace):
+        for public_key in public_keys:
+            key = Key(public_key)
+            key.address, key.scriptcode
+
+    addresses = [key.address for chain in chains for key in chain]
+    stub = StubNetwork([key.address for chain in chains for key in chain[:per_chain - gap_limit(size)]])
+    stub.install(NETWORK_API)
+
+    with measure(results, "wallet_init", trace):
+        wallet = Wallet.from_seed(SEED, PATH)
+    with measure(results, "discover", trace):
+        wallet.discover()
+    with measure(results, "refresh_transactions", trace):
+        wallet.refresh_transactions()
+    with measure(results, "refresh_unspents", trace):
+        wallet.refresh_unspents()
+
+    unspents = {address: stub.get_unspents(address) for address in addresses}
+    with measure(results, "dump_unspents", trace):
+        USP_STORE.replace_many(unspents)
+    with measure(results, "load_unspents", trace):
+        USP_STORE.load_many(addresses)
+    reopened = Wallet.from_seed(SEED, PATH)
+    reopened.discover()
+    with measure(results, "balances", trace):
+        reopened.receive_addresses_and_balances, reopened.change_addresses_and_balances
+
+    for result in results:
+        result["size"] = size
+    return results
+
+
+def run_size(size: int, trace: bool) -> List[dict]:
+    env = dict(os.environ, PYTHONPATH=ROOT, GAP_LIMIT=str(gap_limit(size)), RATE_LIMIT="0", TASK_RETRIES="0")
+    with tempfile.TemporaryDirectory() as directory:
+        # the caches live under the working directory, an empty one makes them cold
+        command = [sys.executable, os.path.abspath(__file__), "--worker", str(size)] + (["--trace"] if trace else [])
+        # the wallet prints its progress, the results come back in a file
+        subprocess.run(command, cwd=directory, env=env, stdout=subprocess.DEVNULL, check=True)
+        with open(os.path.join(directory, WORKER_OUTPUT)) as output:
+            return json.load(output)
+
+
+def run(sizes, repeat: int) -> dict:
+    """
+    Median seconds of repeat timed runs, peak memory of one traced run
+    """
+    results = []
+    for size in sizes:
+        timed = [run_size(size, False) for _ in range(repeat)]
+        traced = run_size(size, True)
+        for samples, traced_result in zip(zip(*timed), traced):
+            seconds = statistics.median(sample["seconds"] for sample in samples)
+            results.append({**samples[0], "seconds": seconds, "peak_kib": traced_result["peak_kib"]})
+    return {"meta": meta(), "results": results}
+
+
+def meta() -> dict:
+    try:
+        revision = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        revision = ""
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "revision": revision,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def by_case(report: dict) -> Dict[tuple, dict]:
+    return {(result["case"], result["size"]): result for result in report["results"]}
+
+
+def print_report(report: dict):
+    print(f"{'case':<22}{'size':>7}{'seconds':>11}{'peak KiB':>11}{'threads':>9}")
+    for result in report["results"]:
+        print(f"{result['case']:<22}{result['size']:>7}{result['seconds']:>11.4f}"
+              f"{result['peak_kib']:>11.0f}{result['threads']:>9}")
+
+
+def compare(baseline: dict, report: dict, threshold: float) -> int:
+    """
+    Print the ratios against the baseline, return the number of regressions beyond threshold
+    """
+    regressions = 0
+    old = by_case(baseline)
+    print(f"\n{'case':<22}{'size':>7}" + "".join(f"{metric:>16}" for metric in METRICS))
+    for key, result in by_case(report).items():
+        if key not in old:
+            continue
+        cells = []
+        for metric in METRICS:
+            ratio = result[metric] / old[key][metric] if old[key][metric] else 1.0
+            regressed = ratio > 1 + threshold
+            regressions += regressed
+            cells.append(f"{ratio:>14.2f}x{'!' if regressed else ' '}")
+        print(f"{key[0]:<22}{key[1]:>7}" + "".join(cells))
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="offline benchmarks of the wallet hot paths")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma separated wallet sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size, the median is reported")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="tolerated slowdown or growth, 0.1 is 10%%")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        with open(WORKER_OUTPUT, "w") as output:
+            json.dump(run_cases(args.worker, args.trace), output)
+        return 0
+
+    report = run([int(size) for size in args.sizes.split(",")], args.repeat)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            return 1 if compare(json.load(baseline), report, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
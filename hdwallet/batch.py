@@ -0,0 +1,205 @@
+"""
+Non-interactive mode: refresh many wallets concurrently and stream what is found as JSON lines.
+
+Wallets are read one per line, either as JSON ({"xpub": ...}, {"xprv": ...}, {"seed": hex, "path": ...} or
+{"mnemonic": ..., "passphrase": ..., "path": ...}, each with an optional "id") or as a bare xpub, xprv,
+hex seed or mnemonic with the path (and passphrase) following tab separated.
+
+Every line written is one JSON object with the wallet id (the given one or the input line number) and a type:
+"address", "unspent" and "transaction" records of each address, then a "wallet" summary, or an "error".
+
+The watch command takes one such wallet line and writes a "change" record whenever a balance changes.
+"""
+import asyncio
+import json
+import sys
+from typing import IO, Iterator, Optional, Tuple
+
+from hdwallet.configs import BATCH_JOBS, DISCOVERY_PATHS
+from hdwallet.inputs import Inputs, RECOVER_TYPES
+
+
+DEFAULT_PATH = DISCOVERY_PATHS[0].format(account=0)
+RECORD_TYPES = ("address", "unspent", "transaction")
+
+
+def parse_wallet(line: str) -> dict:
+    """
+    raise ValueError on a line that is no wallet
+    """
+    if line.startswith("{"):
+        spec = json.loads(line)
+        if not isinstance(spec, dict):
+            raise ValueError("a JSON wallet must be an object")
+    else:
+        secret, *rest = line.split("\t")
+        for input_type in RECOVER_TYPES:
+            if input_type.criterion(secret):
+                spec = dict(zip(("path", "passphrase"), rest), **{input_type.name.lower(): secret})
+                break
+        else:
+            raise ValueError("neither an xpub, an xprv, a hex seed nor a valid mnemonic")
+    for input_type in RECOVER_TYPES:
+        name = input_type.name.lower()
+        if name in spec and not input_type.criterion(spec[name]):
+            raise ValueError(f"invalid {name}")
+    if "path" in spec and not Inputs.PATH.criterion(spec["path"]):
+        raise ValueError("invalid path")
+    return spec
+
+
+def open_wallet(spec: dict):
+    from hdwallet.core.wallet import Wallet
+
+    if "xpub" in spec:
+        return Wallet.from_xpub(spec["xpub"])
+    if "xprv" in spec:
+        return Wallet.from_xprv(spec["xprv"])
+    if "seed" in spec:
+        return Wallet.from_seed(bytes.fromhex(spec["seed"]), spec.get("path", DEFAULT_PATH))
+    if "mnemonic" in spec:
+        return Wallet.from_mnemonic(spec["mnemonic"], spec.get("passphrase", ""), spec.get("path", DEFAULT_PATH))
+    raise ValueError("no xpub, xprv, seed or mnemonic given")
+
+
+def wallet_records(wallet_id, wallet, record_types) -> Iterator[dict]:
+    """
+    The records of one refreshed wallet, generated address by address
+    """
+    total, used = 0, 0
+    for chain, keys in (("receive", wallet.receive_keys), ("change", wallet.change_keys)):
+        for index, key in enumerate(keys):
+            balance, transactions = key.balance, key.transactions
+            total += balance
+            used += bool(transactions)
+            if "address" in record_types:
+                yield {"wallet": wallet_id, "type": "address", "chain": chain, "index": index,
+                       "address": key.address, "balance": balance, "transactions": len(transactions)}
+            if "unspent" in record_types:
+                for unspent in key.unspents:
+                    yield {"wallet": wallet_id, "type": "unspent", "address": key.address, **unspent.to_dict()}
+            if "transaction" in record_types:
+                for tx in transactions:
+                    yield {"wallet": wallet_id, "type": "transaction", "address": key.address, "txid": tx.txid,
+                           "inputs": [{"txid": tx_in.txid, "index": tx_in.index} for tx_in in tx.inputs],
+                           "outputs": [{"scriptpubkey": tx_out.scriptpubkey, "amount": tx_out.amount}
+                                       for tx_out in tx.outputs]}
+    yield {"wallet": wallet_id, "type": "wallet", "xpub": wallet.xpub, "balance": total, "used_addresses": used,
+           "addresses": len(wallet.receive_keys) + len(wallet.change_keys)}
+
+
+def read_wallets(source: IO[str]) -> Iterator[Tuple[object, Optional[dict], Optional[str]]]:
+    """
+    (wallet id, spec or None, error or None) of every non-empty line
+    """
+    for number, line in enumerate(source, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            spec = parse_wallet(line)
+        except ValueError as e:
+            yield number, None, str(e)
+        else:
+            yield spec.get("id", number), spec, None
+
+
+async def run_batch(source: IO[str], output: IO[str], jobs: int = BATCH_JOBS, record_types=RECORD_TYPES) -> int:
+    """
+    Refresh the wallets read from source, at most `jobs` at a time over one shared network session,
+    and write each wallet's records as soon as it is done. Returns the number of wallets that failed.
+    """
+    from hdwallet.core.async_network import AsyncWhatsOnChain
+
+    slots = asyncio.Semaphore(jobs)
+    failures = 0
+
+    def write(records):
+        for record in records:
+            output.write(json.dumps(record, default=str) + "\n")
+        output.flush()
+
+    async def process(wallet_id, spec):
+        nonlocal failures
+        try:
+            wallet = open_wallet(spec)
+            await wallet.async_refresh_transactions(api)
+            await wallet.async_refresh_unspents(api)
+            write(wallet_records(wallet_id, wallet, record_types))
+        except Exception as e:
+            failures += 1
+            write([{"wallet": wallet_id, "type": "error", "error": f"{type(e).__name__}: {e}"}])
+        finally:
+            slots.release()
+
+    async with AsyncWhatsOnChain() as api:
+        tasks = set()
+        # the input is read no faster than wallets get processed, so it can be any size
+        for wallet_id, spec, error in read_wallets(source):
+            if error:
+                failures += 1
+                write([{"wallet": wallet_id, "type": "error", "error": error}])
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(process(wallet_id, spec))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+    return failures
+
+
+def add_watch_parser(commands):
+    parser = commands.add_parser("watch", help="poll a wallet for balance changes, output JSON lines",
+                                 description="Poll a wallet adaptively and write a JSON line per change")
+    parser.add_argument("wallet", help="a wallet line as read by the batch command, quote it")
+    parser.add_argument("--duration", type=float, help="seconds to watch, until interrupted by default")
+    parser.set_defaults(run=run_watch)
+
+
+def run_watch(args) -> int:
+    from hdwallet.core.watch import Watcher
+
+    def write_change(event):
+        sys.stdout.write(json.dumps({
+            "type": "change", "address": event.address, "previous_balance": event.previous_balance,
+            "balance": event.balance, "added": [unspent.to_dict() for unspent in event.added],
+            "removed": [unspent.to_dict() for unspent in event.removed]
+        }, default=str) + "\n")
+        sys.stdout.flush()
+
+    try:
+        wallet = open_wallet(parse_wallet(args.wallet))
+    except ValueError as e:
+        raise SystemExit(str(e))
+    try:
+        Watcher(wallet, write_change).run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def add_parser(commands):
+    parser = commands.add_parser("batch", help="refresh wallets read from a file or stdin, output JSON lines",
+                                 description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", nargs="?", default="-", help="file with one wallet per line, - for stdin (default)")
+    parser.add_argument("-j", "--jobs", type=int, default=BATCH_JOBS, help="wallets processed at the same time")
+    parser.add_argument("--records", default=",".join(RECORD_TYPES),
+                        help=f"comma separated record types to output besides the wallet summaries "
+                             f"(default {','.join(RECORD_TYPES)})")
+    parser.set_defaults(run=run)
+
+
+def run(args) -> int:
+    record_types = {record_type for record_type in args.records.split(",") if record_type}
+    if record_types - set(RECORD_TYPES):
+        raise SystemExit(f"unknown record types: {', '.join(record_types - set(RECORD_TYPES))}")
+    try:
+        source = sys.stdin if args.input == "-" else open(args.input)
+    except OSError as e:
+        raise SystemExit(f"cannot read {args.input}: {e.strerror}")
+    with source:
+        try:
+            failures = asyncio.run(run_batch(source, sys.stdout, args.jobs, record_types))
+        except UnicodeDecodeError:
+            raise SystemExit(f"cannot read {args.input}: not a text file")
+    return 1 if failures else 0
@@ -0,0 +1,80 @@
+"""
+BIP39 mnemonic <-> entropy conversion and seed stretching with the standard library only.
+"""
+import hashlib
+import unicodedata
+from typing import List
+
+from hdwallet.bips.bip_0039.words import BIP39_INDEX_EN, BIP39_WORDS_EN
+
+
+MNEMONIC_LENGTHS = (12, 15, 18, 21, 24)
+PBKDF2_ROUNDS = 2048
+
+
+def _normalize(string: str) -> str:
+    return unicodedata.normalize("NFKD", string)
+
+
+def _checksum(entropy: bytes, bits: int) -> int:
+    return hashlib.sha256(entropy).digest()[0] >> (8 - bits)
+
+
+def mnemonic_to_indices(mnemonic: str) -> List[int]:
+    """
+    raise KeyError on a word outside the list
+    """
+    return [BIP39_INDEX_EN[word] for word in _normalize(mnemonic).split()]
+
+
+def indices_to_entropy(indices: List[int]) -> bytes:
+    """
+    raise ValueError when the length or the checksum is wrong
+    """
+    if len(indices) not in MNEMONIC_LENGTHS:
+        raise ValueError(f"a mnemonic has {', '.join(map(str, MNEMONIC_LENGTHS))} words, got {len(indices)}")
+    packed = 0
+    for index in indices:
+        packed = packed << 11 | index
+    checksum_bits = len(indices) // 3
+    entropy = (packed >> checksum_bits).to_bytes(checksum_bits * 4, "big")
+    if packed & ((1 << checksum_bits) - 1) != _checksum(entropy, checksum_bits):
+        raise ValueError("mnemonic checksum mismatch")
+    return entropy
+
+
+def mnemonic_to_entropy(mnemonic: str) -> bytes:
+    """
+    raise ValueError on an unknown word, a wrong length or a wrong checksum
+    """
+    try:
+        indices = mnemonic_to_indices(mnemonic)
+    except KeyError as e:
+        raise ValueError(f"{e.args[0]!r} is not a BIP39 english word") from None
+    return indices_to_entropy(indices)
+
+
+def entropy_to_mnemonic(entropy: bytes) -> str:
+    if len(entropy) not in (16, 20, 24, 28, 32):
+        raise ValueError(f"entropy must be 16, 20, 24, 28 or 32 bytes, got {len(entropy)}")
+    checksum_bits = len(entropy) // 4
+    packed = int.from_bytes(entropy, "big") << checksum_bits | _checksum(entropy, checksum_bits)
+    n_words = (len(entropy) * 8 + checksum_bits) // 11
+    return " ".join(BIP39_WORDS_EN[packed >> (11 * i) & 0x7FF] for i in reversed(range(n_words)))
+
+
+def is_valid_checksum(mnemonic: str) -> bool:
+    try:
+        mnemonic_to_entropy(mnemonic)
+    except ValueError:
+        return False
+    return True
+
+
+def mnemonic_to_seed(mnemonic: str, passphrase: str = "") -> bytes:
+    return hashlib.pbkdf2_hmac(
+        "sha512",
+        _normalize(mnemonic).encode("utf-8"),
+        _normalize("mnemonic" + passphrase).encode("utf-8"),
+        PBKDF2_ROUNDS
+    )
@@ -1,12 +1,30 @@
+"""
+Word -> index lookup for the BIP39 english list.
+
+The table lives in the generated module english.py so that importing it is a single unmarshal of a
+cached constant instead of reading and splitting words/english.txt on every start. Regenerate it after
+touching the text file with `python -m hdwallet.bips.bip_0039.words`.
+"""
 import os
 
+from hdwallet.bips.bip_0039.english import BIP39_INDEX_EN
+
+
+BIP39_WORDS_EN = tuple(BIP39_INDEX_EN)
 
-BIP39_WORDS_EN = set()
 
-with open(f"{os.path.dirname(__file__)}/words/english.txt", "r") as words:
-    for line in words:
-        BIP39_WORDS_EN.add(line.strip())
+def _generate():
+    directory = os.path.dirname(__file__)
+    with open(f"{directory}/words/english.txt", "r") as source:
+        words = [line.strip() for line in source if line.strip()]
+    assert len(words) == 2048, f"a BIP39 list has 2048 words, got {len(words)}"
+    with open(f"{directory}/english.py", "w") as target:
+        target.write("# Generated from words/english.txt by `python -m hdwallet.bips.bip_0039.words`, do not edit.\n")
+        target.write("BIP39_INDEX_EN = {\n")
+        for index, word in enumerate(words):
+            target.write(f"    {word!r}: {index},\n")
+        target.write("}\n")
 
 
 if __name__ == "__main__":
-    print(os.path.dirname(__file__))
+    _generate()
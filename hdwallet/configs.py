@@ -1,7 +1,51 @@
 import os
 
 
-DERIVATION_ADDRESS_NUMBER = int(os.environ.get("DERIVATION_ADDRESS_NUMBER", "10"))
+GAP_LIMIT = int(os.environ.get("GAP_LIMIT", "20"))
+DISCOVERY_BATCH_SIZE = int(os.environ.get("DISCOVERY_BATCH_SIZE", "20"))
+DISCOVERY_PATHS = os.environ.get("DISCOVERY_PATHS", "m/44'/236'/{account}',m/44'/0'/{account}',m/44'/145'/{account}'").split(",")
+DISCOVERY_MAX_ACCOUNTS = int(os.environ.get("DISCOVERY_MAX_ACCOUNTS", "10"))
+CONFIRMATION_DEPTH = int(os.environ.get("CONFIRMATION_DEPTH", "6"))
+# seconds a key trusts its stored unspents before sending, its own payments are chained locally meanwhile
+UNSPENTS_MAX_AGE = float(os.environ.get("UNSPENTS_MAX_AGE", "60"))
+DERIVATION_BATCH_SIZE = int(os.environ.get("DERIVATION_BATCH_SIZE", "500"))
+SIGNING_BATCH_SIZE = int(os.environ.get("SIGNING_BATCH_SIZE", "250"))
+# data publishing: bytes per OP_RETURN output and data bytes per transaction, larger payloads span a chain of them
+PUBLISH_CHUNK_SIZE = int(os.environ.get("PUBLISH_CHUNK_SIZE", "100000"))
+PUBLISH_TX_DATA_SIZE = int(os.environ.get("PUBLISH_TX_DATA_SIZE", "1000000"))
 
-TRX_CACHE_DIR = os.environ.get("TRX_CACHE_DIR", "cache/trx/")
-USP_CACHE_DIR = os.environ.get("USP_CACHE_DIR", "cache/usp/")
+# watch mode: seconds between polls of active addresses, the longest back off of dormant ones,
+# the unused addresses per chain polled like active ones and the addresses polled per round
+WATCH_MIN_INTERVAL = float(os.environ.get("WATCH_MIN_INTERVAL", "15"))
+WATCH_MAX_INTERVAL = float(os.environ.get("WATCH_MAX_INTERVAL", "3600"))
+WATCH_FRESH_ADDRESSES = int(os.environ.get("WATCH_FRESH_ADDRESSES", "3"))
+WATCH_BATCH_SIZE = int(os.environ.get("WATCH_BATCH_SIZE", "20"))
+
+# mnemonic recovery: candidate phrases per process pool task and receive addresses derived per candidate and path
+RECOVERY_BATCH_SIZE = int(os.environ.get("RECOVERY_BATCH_SIZE", "64"))
+RECOVERY_ADDRESSES = int(os.environ.get("RECOVERY_ADDRESSES", "5"))
+
+# transactions shown per page of the history
+HISTORY_PAGE_SIZE = int(os.environ.get("HISTORY_PAGE_SIZE", "20"))
+
+PROCESS_WORKERS = int(os.environ.get("PROCESS_WORKERS", str(os.cpu_count() or 1)))
+
+NETWORK_API_URL = os.environ.get("NETWORK_API_URL", "https://api.whatsonchain.com/v1/bsv/main")
+NETWORK_CONNECTIONS = int(os.environ.get("NETWORK_CONNECTIONS", "4"))
+NETWORK_TIMEOUT = float(os.environ.get("NETWORK_TIMEOUT", "30"))
+
+WORKER_THREADS = int(os.environ.get("WORKER_THREADS", "8"))
+# wallets refreshed at the same time by the batch command
+BATCH_JOBS = int(os.environ.get("BATCH_JOBS", "4"))
+RATE_LIMIT = float(os.environ.get("RATE_LIMIT", "3"))
+RATE_BURST = float(os.environ.get("RATE_BURST", "3"))
+TASK_RETRIES = int(os.environ.get("TASK_RETRIES", "3"))
+RETRY_BACKOFF = float(os.environ.get("RETRY_BACKOFF", "0.5"))
+
+# "prometheus" or "jsonl", empty disables metrics, METRICS_PATH defaults to metrics.prom or metrics.jsonl
+METRICS_EXPORTER = os.environ.get("METRICS_EXPORTER", "")
+METRICS_PATH = os.environ.get("METRICS_PATH", "")
+
+DRV_CACHE_DIR = os.environ.get("DRV_CACHE_DIR", "cache/drv/")
+TRX_CACHE_PATH = os.environ.get("TRX_CACHE_PATH", "cache/trx.sqlite3")
+USP_CACHE_PATH = os.environ.get("USP_CACHE_PATH", "cache/usp.sqlite3")
@@ -0,0 +1,53 @@
+import asyncio
+from typing import List, NamedTuple, Optional, Sequence
+
+from hdwallet.configs import DISCOVERY_MAX_ACCOUNTS, DISCOVERY_PATHS
+from hdwallet.core.wallet import Wallet
+
+
+class AccountReport(NamedTuple):
+    path: str
+    used_addresses: int
+    balance: int
+    # what stopped the search on this path, the account and the ones after it may be used nonetheless
+    error: Optional[Exception] = None
+
+
+async def _scan_template(api, seed: bytes, template: str, max_accounts: int) -> List[AccountReport]:
+    reports = []
+    for account in range(max_accounts):
+        path = template.format(account=account)
+        wallet = Wallet.from_seed(seed, path)
+        try:
+            used = await wallet.async_discover(api)
+            if used:
+                await wallet.async_refresh_unspents(api)
+        except Exception as e:
+            reports.append(AccountReport(path, 0, 0, e))
+            break
+        # BIP44: accounts are used in order, the first empty one ends the search
+        if not used:
+            break
+        reports.append(AccountReport(path, used, wallet.balance))
+        if "{account}" not in template:
+            break
+    return reports
+
+
+async def async_discover_accounts(seed: bytes, path_templates: Sequence[str] = DISCOVERY_PATHS,
+                                  max_accounts: int = DISCOVERY_MAX_ACCOUNTS) -> List[AccountReport]:
+    """
+    Scans the accounts of every path template (with an ``{account}`` placeholder) concurrently,
+    sharing one network session and the derivation/unspent caches, and reports the used ones,
+    along with the account of every path whose search failed, its error set
+    """
+    from hdwallet.core.async_network import AsyncWhatsOnChain
+
+    async with AsyncWhatsOnChain() as api:
+        reports = await asyncio.gather(*(_scan_template(api, seed, template, max_accounts) for template in path_templates))
+    return [report for template_reports in reports for report in template_reports]
+
+
+def discover_accounts(seed: bytes, path_templates: Sequence[str] = DISCOVERY_PATHS,
+                      max_accounts: int = DISCOVERY_MAX_ACCOUNTS) -> List[AccountReport]:
+    return asyncio.run(async_discover_accounts(seed, path_templates, max_accounts))
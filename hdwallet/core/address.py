@@ -0,0 +1,64 @@
+import hashlib
+from hashlib import sha256
+from typing import Iterable, List, Tuple
+
+from bitsv.transaction import OP_CHECKSIG, OP_DUP, OP_EQUALVERIFY, OP_HASH160, OP_PUSH_20
+
+
+MAIN_PUBKEY_HASH = b"\x00"
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# every two digit base58 string, so that a division yields two characters at once
+_BASE58_PAIRS = [high + low for high in BASE58_ALPHABET for low in BASE58_ALPHABET]
+# the largest power of 58 with an even exponent below 2 ** 63: big integer divisions by it leave machine size chunks
+_BASE58_CHUNK = 58 ** 10
+_PAIRS_PER_CHUNK = 5
+
+_RIPEMD160 = hashlib.new("ripemd160")
+
+
+def base58_encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    pairs = []
+    while number:
+        number, chunk = divmod(number, _BASE58_CHUNK)
+        for _ in range(_PAIRS_PER_CHUNK):
+            chunk, pair = divmod(chunk, 3364)
+            pairs.append(_BASE58_PAIRS[pair])
+    # the last chunk is padded with zero digits, leading zero bytes are written as "1" each
+    encoded = "".join(reversed(pairs)).lstrip("1")
+    return "1" * (len(data) - len(data.lstrip(b"\x00"))) + encoded
+
+
+def hash160_many(public_keys: Iterable[bytes]) -> List[bytes]:
+    """
+    ripemd160(sha256(public key)) of every key, starting each ripemd160 from a copy instead of a lookup by name
+    """
+    new_ripemd160 = _RIPEMD160.copy
+    hashes = []
+    for public_key in public_keys:
+        ripemd160 = new_ripemd160()
+        ripemd160.update(sha256(public_key).digest())
+        hashes.append(ripemd160.digest())
+    return hashes
+
+
+def hash160_to_address(public_key_hash: bytes, version: bytes = MAIN_PUBKEY_HASH) -> str:
+    payload = version + public_key_hash
+    return base58_encode(payload + sha256(sha256(payload).digest()).digest()[:4])
+
+
+def hash160s_to_addresses(public_key_hashes: Iterable[bytes], version: bytes = MAIN_PUBKEY_HASH) -> List[str]:
+    return [hash160_to_address(public_key_hash, version) for public_key_hash in public_key_hashes]
+
+
+def public_keys_to_addresses(public_keys: Iterable[bytes]) -> Tuple[List[bytes], List[str]]:
+    """
+    The hash160s and the P2PKH addresses of many public keys, each key hashed once
+    """
+    hashes = hash160_many(public_keys)
+    return hashes, hash160s_to_addresses(hashes)
+
+
+def hash160_to_scriptcode(public_key_hash: bytes) -> bytes:
+    return OP_DUP + OP_HASH160 + OP_PUSH_20 + public_key_hash + OP_EQUALVERIFY + OP_CHECKSIG
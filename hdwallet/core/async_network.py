@@ -0,0 +1,99 @@
+import asyncio
+import json
+import random
+from decimal import Decimal
+from typing import Dict, Iterable, List
+
+import aiohttp
+from bitsv.network.meta import Unspent
+from bitsv.network.services.whatsonchain import woc_tx_to_transaction, woc_utxos_to_unspents
+from bitsv.network.transaction import Transaction
+
+from hdwallet.configs import NETWORK_API_URL, NETWORK_CONNECTIONS, NETWORK_TIMEOUT, RETRY_BACKOFF, TASK_RETRIES
+from hdwallet.core.network import BULK_LIMIT, instrumented
+from hdwallet.utils import RATE_LIMITER
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    return (items[first:first + size] for first in range(0, len(items), size))
+
+
+class AsyncWhatsOnChain:
+    """
+    Asyncio WhatsOnChain client, all requests go through one session with at most `connections`
+    keep-alive connections, multi-address and multi-txid queries use the bulk endpoints.
+    Use as ``async with AsyncWhatsOnChain() as api: ...``
+    """
+
+    def __init__(self, url: str = NETWORK_API_URL, connections: int = NETWORK_CONNECTIONS):
+        self._url = url.rstrip("/")
+        self._connections = connections
+        self._session = None
+        self._chain_height = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self._connections, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=NETWORK_TIMEOUT),
+            headers={"Accept": "application/json"}
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    async def _request(self, method, path, payload=None):
+        for attempt in range(TASK_RETRIES + 1):
+            await asyncio.sleep(RATE_LIMITER.reserve())
+            try:
+                async with self._session.request(method, self._url + path, json=payload) as response:
+                    response.raise_for_status()
+                    return json.loads(await response.text(), parse_float=Decimal)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == TASK_RETRIES:
+                    raise
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt * (1 + random.random()))
+
+    @instrumented("async")
+    async def get_chain_height(self) -> int:
+        if self._chain_height is None:
+            self._chain_height = (await self._request("GET", "/chain/info"))["blocks"]
+        return self._chain_height
+
+    @instrumented("async")
+    async def get_history(self, address: str) -> List[dict]:
+        return await self._request("GET", f"/address/{address}/history")
+
+    @instrumented("async")
+    async def get_transactions(self, address: str) -> List[str]:
+        return [entry["tx_hash"] for entry in await self.get_history(address)]
+
+    @instrumented("async")
+    async def get_transaction(self, txid: str) -> Transaction:
+        return woc_tx_to_transaction(await self._request("GET", f"/tx/hash/{txid}"))
+
+    @instrumented("async")
+    async def get_transactions_bulk(self, txids: List[str]) -> Dict[str, Transaction]:
+        responses = await asyncio.gather(
+            *(self._request("POST", "/txs", {"txids": chunk}) for chunk in _chunks(txids, BULK_LIMIT))
+        )
+        return {tx["txid"]: woc_tx_to_transaction(tx)
+                for response in responses for tx in response if not tx.get("error")}
+
+    @instrumented("async")
+    async def get_unspents(self, address: str) -> List[Unspent]:
+        utxos = await self._request("GET", f"/address/{address}/unspent")
+        return woc_utxos_to_unspents(utxos, await self.get_chain_height())
+
+    @instrumented("async")
+    async def get_unspents_bulk(self, addresses: List[str]) -> Dict[str, List[Unspent]]:
+        height = await self.get_chain_height()
+        responses = await asyncio.gather(
+            *(self._request("POST", "/addresses/unspent", {"addresses": chunk}) for chunk in _chunks(addresses, BULK_LIMIT))
+        )
+        return {entry["address"]: woc_utxos_to_unspents(entry["unspent"], height)
+                for response in responses for entry in response if not entry.get("error")}
+
+    @instrumented("async")
+    async def broadcast_tx(self, tx_hex: str) -> str:
+        return await self._request("POST", "/tx/raw", {"txhex": tx_hex})
@@ -0,0 +1,103 @@
+import hmac
+import itertools
+from hashlib import sha512
+from typing import List, Optional, Tuple
+
+from bip_utils import Bip32Secp256k1
+from coincurve import PublicKey
+
+from hdwallet import metrics
+from hdwallet.configs import DERIVATION_BATCH_SIZE, PROCESS_WORKERS
+from hdwallet.core.address import public_keys_to_addresses
+from hdwallet.core.key import Key
+from hdwallet.storage.derivations import open_derivation_cache
+from hdwallet.utils import get_process_pool
+
+
+CURVE_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# (compressed public key, private key or None for watch-only chains)
+ChildKeyBytes = Tuple[bytes, Optional[bytes]]
+
+
+def _tweak(chain_code: bytes, parent_pub: bytes, index: int) -> bytes:
+    tweak = hmac.new(chain_code, parent_pub + index.to_bytes(4, "big"), sha512).digest()[:32]
+    if int.from_bytes(tweak, "big") >= CURVE_ORDER:
+        raise ValueError(f"Invalid child key at index {index}")
+    return tweak
+
+
+def _child_secret(tweak: bytes, parent_prv: int) -> bytes:
+    secret = (int.from_bytes(tweak, "big") + parent_prv) % CURVE_ORDER
+    if secret == 0:
+        raise ValueError("Invalid child key")
+    return secret.to_bytes(32, "big")
+
+
+def _derive_range(chain_code: bytes, parent_pub: bytes, parent_prv: Optional[int], start: int, stop: int) -> List[ChildKeyBytes]:
+    """
+    Non-hardened BIP32 CKD for indices [start, stop) of one parent.
+    Watch-only parents use public derivation (a single point tweak per child),
+    private parents a scalar addition plus one base point multiplication.
+    """
+    parent = PublicKey(parent_pub)
+    children = []
+    for index in range(start, stop):
+        tweak = _tweak(chain_code, parent_pub, index)
+        if parent_prv is None:
+            children.append((parent.add(tweak).format(), None))
+        else:
+            secret = _child_secret(tweak, parent_prv)
+            children.append((PublicKey.from_secret(secret).format(), secret))
+    return children
+
+
+def _parent_material(chain_key: Bip32Secp256k1) -> Tuple[bytes, bytes, Optional[int]]:
+    chain_code = chain_key.ChainCode().m_data_bytes
+    parent_pub = chain_key.PublicKey().RawCompressed().m_data_bytes
+    parent_prv = None if chain_key.IsPublicOnly() else int.from_bytes(chain_key.PrivateKey().Raw().m_data_bytes, "big")
+    return chain_code, parent_pub, parent_prv
+
+
+def derive_children(chain_key: Bip32Secp256k1, start: int, stop: int) -> List[ChildKeyBytes]:
+    """
+    Derive the children [start, stop) of a chain key in one call.
+    Ranges larger than DERIVATION_BATCH_SIZE are split into batches and spread across the process pool.
+    """
+    chain_code, parent_pub, parent_prv = _parent_material(chain_key)
+    if stop - start <= DERIVATION_BATCH_SIZE or PROCESS_WORKERS <= 1:
+        return _derive_range(chain_code, parent_pub, parent_prv, start, stop)
+    starts = range(start, stop, DERIVATION_BATCH_SIZE)
+    stops = [min(s + DERIVATION_BATCH_SIZE, stop) for s in starts]
+    batches = get_process_pool().map(
+        _derive_range,
+        itertools.repeat(chain_code), itertools.repeat(parent_pub), itertools.repeat(parent_prv), starts, stops
+    )
+    return list(itertools.chain.from_iterable(batches))
+
+
+@metrics.timed("hdwallet_derivation_seconds")
+def derive_keys(chain_key: Bip32Secp256k1, start: int, stop: int) -> List[Key]:
+    """
+    Keys [start, stop) of a chain key, served from the derivation cache where possible.
+    Cached children need no EC work, the private keys of a spending chain are recomputed from
+    the parent with one HMAC and a scalar addition each. Newly derived children are appended to the cache.
+    """
+    cache = open_derivation_cache(chain_key)
+    cached = cache.records(start, stop)
+    keys = []
+    if cached:
+        chain_code, parent_pub, parent_prv = _parent_material(chain_key)
+        for index, (pub_key_bytes, address) in enumerate(cached, start):
+            prv_key_bytes = None if parent_prv is None else _child_secret(_tweak(chain_code, parent_pub, index), parent_prv)
+            keys.append(Key(pub_key_bytes, prv_key_bytes, address))
+        metrics.count("hdwallet_derived_keys_total", len(keys), source="cache")
+    if start + len(keys) < stop:
+        children = derive_children(chain_key, start + len(keys), stop)
+        hashes, addresses = public_keys_to_addresses(pub_key_bytes for pub_key_bytes, _ in children)
+        derived = [Key(pub_key_bytes, prv_key_bytes, address, hash160)
+                   for (pub_key_bytes, prv_key_bytes), hash160, address in zip(children, hashes, addresses)]
+        cache.extend(start + len(keys), [(key.public_key, key.address) for key in derived])
+        metrics.count("hdwallet_derived_keys_total", len(derived), source="derived")
+        keys.extend(derived)
+    return keys
@@ -0,0 +1,71 @@
+import asyncio
+import itertools
+from typing import Awaitable, Callable, Iterable, Iterator, List, Tuple
+
+from bip_utils import Bip32Secp256k1
+
+from hdwallet.configs import DISCOVERY_BATCH_SIZE, GAP_LIMIT
+from hdwallet.core.derivation import derive_keys
+from hdwallet.core.key import Key
+from hdwallet.utils import multithreading_execute
+
+
+def derive_batches(chain_key: Bip32Secp256k1, start: int, batch_size: int) -> Iterator[List[Key]]:
+    for first in itertools.count(start, batch_size):
+        yield derive_keys(chain_key, first, first + batch_size)
+
+
+def known_then_derived(known_keys: List[Key], chain_key: Bip32Secp256k1, batch_size: int) -> Iterator[List[Key]]:
+    for first in range(0, len(known_keys), batch_size):
+        yield known_keys[first:first + batch_size]
+    yield from derive_batches(chain_key, len(known_keys), batch_size)
+
+
+def query_batches(batches: Iterable[List[Key]], is_used: Callable[[Key], bool]) -> Iterator[Tuple[Key, bool]]:
+    for batch in batches:
+        results = multithreading_execute([lambda key=key: is_used(key) for key in batch])
+        for key, result in zip(batch, results):
+            # already retried by the executor, counting the address as unused would end the scan before its funds
+            if not result.ok:
+                raise result.error
+            yield key, result.value
+
+
+def until_gap(results: Iterable[Tuple[Key, bool]], gap_limit: int) -> Iterator[Tuple[Key, bool]]:
+    gap = 0
+    for key, used in results:
+        yield key, used
+        gap = 0 if used else gap + 1
+        if gap >= gap_limit:
+            return
+
+
+def scan_chain(known_keys: List[Key], chain_key: Bip32Secp256k1, is_used: Callable[[Key], bool],
+               gap_limit: int = GAP_LIMIT, batch_size: int = DISCOVERY_BATCH_SIZE) -> Iterator[Tuple[Key, bool]]:
+    """
+    BIP44 style address discovery of one chain: keys are taken from known_keys first and derived afterwards,
+    queried batch by batch, and the scan stops after gap_limit consecutive unused addresses.
+    A query still failing after its retries is raised.
+    """
+    return until_gap(query_batches(known_then_derived(known_keys, chain_key, batch_size), is_used), gap_limit)
+
+
+async def async_scan_chain(known_keys: List[Key], chain_key: Bip32Secp256k1, is_used: Callable[[Key], Awaitable[bool]],
+                           gap_limit: int = GAP_LIMIT, batch_size: int = DISCOVERY_BATCH_SIZE) -> List[Tuple[Key, bool]]:
+    """
+    Asyncio counterpart of scan_chain, each batch is queried concurrently on the event loop
+    """
+    scanned = []
+    gap = 0
+    for batch in known_then_derived(known_keys, chain_key, batch_size):
+        # the whole batch is awaited before a failure is raised, the requests themselves are retried
+        results = await asyncio.gather(*(is_used(key) for key in batch), return_exceptions=True)
+        for key, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                raise result
+            used = bool(result)
+            scanned.append((key, used))
+            gap = 0 if used else gap + 1
+            if gap >= gap_limit:
+                return scanned
+    return scanned
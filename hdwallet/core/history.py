@@ -0,0 +1,151 @@
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from bitsv.network.transaction import Transaction
+
+from hdwallet.configs import HISTORY_PAGE_SIZE
+from hdwallet.core.network import NETWORK_API
+from hdwallet.storage.transactions import TRX_STORE
+
+
+class HistoryEntry(NamedTuple):
+    txid: str
+    # 0 or below while unconfirmed
+    height: int
+    # satoshis received by the wallet minus the ones it spent, negative for payments
+    amount: int
+    transaction: Transaction
+
+
+def _order(entry: Tuple[str, int]):
+    # TRX_STORE.history_entries order: unconfirmed first, then from the highest block down
+    txid, height = entry
+    return height > 0, -height, txid
+
+
+def first_block_at(timestamp: int, tip: int) -> int:
+    """
+    The lowest height whose block time is at or after timestamp, tip + 1 if there is none.
+    A binary search over block times, a couple of dozen requests whatever the chain length. Block times are not
+    monotonic, a block may be stamped up to two hours off its neighbours, so the height found is approximate
+    for timestamps within a couple of hours of it.
+    """
+    low, high = 0, tip + 1
+    while low < high:
+        middle = (low + high) // 2
+        if NETWORK_API.get_block_time(middle) >= timestamp:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _timestamp(moment: Union[datetime, float]) -> int:
+    return int(moment.timestamp() if isinstance(moment, datetime) else moment)
+
+
+class History:
+    """
+    The wallet's transactions newest first, merged lazily from the stored per-address histories.
+    Transactions are read from the store a batch at a time as the history is iterated, so that a page near the top
+    costs as much in a wallet with a long history as in a short one. Filters: the addresses whose histories are
+    merged (any stored address, all of the wallet's by default), block heights, dates (datetimes or unix times,
+    looked up as heights once per iteration, approximate by a couple of hours since block times are not
+    monotonic) and the net amount, all bounds inclusive. Unconfirmed transactions are listed unless an upper
+    height or date bound is given.
+    """
+
+    def __init__(self, wallet, addresses: Optional[Iterable[str]] = None,
+                 min_height: Optional[int] = None, max_height: Optional[int] = None,
+                 since: Union[datetime, float, None] = None, until: Union[datetime, float, None] = None,
+                 min_amount: Optional[int] = None, max_amount: Optional[int] = None,
+                 batch_size: int = HISTORY_PAGE_SIZE):
+        keys = wallet.receive_keys + wallet.change_keys
+        # output scripts are hex in bitsv transactions
+        self.__scripts: Set[str] = {key.scriptcode.hex() for key in keys}
+        self.__addresses = [key.address for key in keys] if addresses is None else list(addresses)
+        self.__min_height = min_height
+        self.__max_height = max_height
+        self.__since = since
+        self.__until = until
+        self.__min_amount = min_amount
+        self.__max_amount = max_amount
+        self.__batch_size = batch_size
+
+    def __height_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        min_height, max_height = self.__min_height, self.__max_height
+        if self.__since is not None or self.__until is not None:
+            tip = NETWORK_API.get_chain_height()
+            if self.__since is not None:
+                height = first_block_at(_timestamp(self.__since), tip)
+                min_height = height if min_height is None else max(min_height, height)
+            if self.__until is not None:
+                height = first_block_at(_timestamp(self.__until) + 1, tip) - 1
+                max_height = height if max_height is None else min(max_height, height)
+        return min_height, max_height
+
+    def __merged(self) -> Iterator[Tuple[str, int]]:
+        merged = heapq.merge(*map(TRX_STORE.history_entries, self.__addresses), key=_order)
+        unconfirmed = []
+        for entry in merged:
+            if entry[1] > 0:
+                merged = itertools.chain([entry], merged)
+                break
+            unconfirmed.append(entry)
+        # unconfirmed entries come first, one may be stale while another history lists the transaction confirmed
+        heights = TRX_STORE.confirmed_heights({txid for txid, _ in unconfirmed})
+        confirmed = sorted(((txid, heights[txid]) for txid, _ in unconfirmed if txid in heights), key=_order)
+        yield from (entry for entry in unconfirmed if entry[0] not in heights)
+        yield from heapq.merge(merged, confirmed, key=_order)
+
+    def __entries(self) -> Iterator[Tuple[str, int]]:
+        min_height, max_height = self.__height_bounds()
+        seen = set()
+        for txid, height in self.__merged():
+            # a transaction touching several of our addresses is listed by each of them
+            if txid in seen:
+                continue
+            seen.add(txid)
+            if height <= 0:
+                if max_height is not None:
+                    continue
+            elif min_height is not None and height < min_height:
+                break
+            elif max_height is not None and height > max_height:
+                continue
+            yield txid, height
+
+    def __amount(self, transaction: Transaction, previous: Dict[str, Transaction]) -> int:
+        received = sum(tx_out.amount for tx_out in transaction.outputs if tx_out.scriptpubkey in self.__scripts)
+        spent = 0
+        for tx_in in transaction.inputs:
+            # the transactions that paid the wallet are in its history and thus in the store
+            if tx_in.txid in previous:
+                tx_out = previous[tx_in.txid].outputs[tx_in.index]
+                if tx_out.scriptpubkey in self.__scripts:
+                    spent += tx_out.amount
+        return received - spent
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        entries = self.__entries()
+        while batch := list(itertools.islice(entries, self.__batch_size)):
+            transactions = TRX_STORE.get_many(txid for txid, _ in batch)
+            previous = TRX_STORE.get_many({tx_in.txid for tx in transactions.values() for tx_in in tx.inputs})
+            for txid, height in batch:
+                # listed in a history but not fetched yet
+                if txid not in transactions:
+                    continue
+                amount = self.__amount(transactions[txid], previous)
+                if self.__min_amount is not None and amount < self.__min_amount:
+                    continue
+                if self.__max_amount is not None and amount > self.__max_amount:
+                    continue
+                yield HistoryEntry(txid, height, amount, transactions[txid])
+
+    def page(self, number: int, size: int = HISTORY_PAGE_SIZE) -> List[HistoryEntry]:
+        """
+        The entries of one page, counted from 0
+        """
+        return list(itertools.islice(self, number * size, (number + 1) * size))
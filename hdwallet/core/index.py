@@ -0,0 +1,62 @@
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from bitsv.network.meta import Unspent
+
+
+Outpoint = Tuple[str, int]
+
+
+class UtxoIndex:
+    """
+    Wallet-wide unspents keyed by outpoint with running per-address and total balances,
+    maintained incrementally as the unspents of single addresses are replaced
+    """
+
+    def __init__(self):
+        self._utxos: Dict[Outpoint, Tuple[str, Unspent]] = {}
+        self._outpoints: Dict[str, Set[Outpoint]] = {}
+        self._balances: Dict[str, int] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._utxos)
+
+    def __contains__(self, address: str):
+        return address in self._outpoints
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def balance(self, address: str) -> int:
+        return self._balances.get(address, 0)
+
+    def owner(self, outpoint: Outpoint) -> Optional[str]:
+        entry = self._utxos.get(outpoint)
+        return entry[0] if entry else None
+
+    def unspents(self, address: Optional[str] = None) -> List[Unspent]:
+        if address is None:
+            return [unspent for _, unspent in self._utxos.values()]
+        return [self._utxos[outpoint][1] for outpoint in self._outpoints.get(address, ())]
+
+    def replace(self, address: str, unspents: List[Unspent]) -> Tuple[List[Unspent], List[Unspent]]:
+        """
+        Replace the unspents of one address, the cost depends on that address only.
+        Returns the (added, removed) unspents.
+        """
+        new = {(unspent.txid, unspent.txindex): unspent for unspent in unspents}
+        with self._lock:
+            old = self._outpoints.get(address, set())
+            removed = [self._utxos.pop(outpoint)[1] for outpoint in old - new.keys()]
+            added = [unspent for outpoint, unspent in new.items() if outpoint not in old]
+            for outpoint, unspent in new.items():
+                # known outpoints are replaced as well to pick up new confirmation counts
+                self._utxos[outpoint] = (address, unspent)
+            self._outpoints[address] = set(new)
+            delta = sum(unspent.amount for unspent in added) - sum(unspent.amount for unspent in removed)
+            self._balances[address] = self._balances.get(address, 0) + delta
+            self._total += delta
+        return added, removed
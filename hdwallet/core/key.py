@@ -1,89 +1,177 @@
-import json
-import os
-from typing import Union, List
+import time
+from typing import Dict, List, Optional, Tuple
 
-from bitsv.format import public_key_to_address, address_to_public_key_hash
 from bitsv.network.meta import Unspent
 from bitsv.network.transaction import Transaction
-from bitsv.transaction import OP_DUP, OP_HASH160, OP_PUSH_20, OP_EQUALVERIFY, OP_CHECKSIG, \
-    calc_txid, create_p2pkh_transaction, sanitize_tx_data
+from bitsv.transaction import calc_txid, sanitize_tx_data
 from coincurve import PublicKey, PrivateKey
 
-from hdwallet.configs import USP_CACHE_DIR
+from hdwallet.configs import CONFIRMATION_DEPTH, UNSPENTS_MAX_AGE
 from hdwallet.errors import PubKeyUsedAsPrvKeyError
+from hdwallet.core.address import hash160_many, hash160_to_address, hash160_to_scriptcode
 from hdwallet.core.network import NETWORK_API
+from hdwallet.core.payment import chained_unspents
+from hdwallet.core.signing import create_p2pkh_transaction, sign_many, verify_many
+from hdwallet.storage.transactions import TRX_STORE
+from hdwallet.storage.unspents import USP_STORE
+from hdwallet.utils import multithreading_execute
 
 
 def ensure_private(method):
     def method_with_check(self, *args, **kwargs):
-        if self._prv_key:
+        if self._prv_key_bytes:
             return method(self, *args, **kwargs)
         else:
             raise PubKeyUsedAsPrvKeyError
     return method_with_check
 
 
+def fetch_transactions(txids: List[str], progress=None) -> Dict[str, Transaction]:
+    """
+    The transactions of txids by txid, only the ones the transaction store has never seen are requested
+    """
+    results = multithreading_execute(
+        [lambda txid=txid: NETWORK_API.get_transaction(txid) for txid in TRX_STORE.missing(txids)], progress
+    )
+    TRX_STORE.put_many(result.value for result in results if result.ok)
+    return TRX_STORE.get_many(txids)
+
+
 class Key:
-    def __init__(self, key_bytes: bytes, is_public=False):
-        self._prv_key: Union[PrivateKey, None]
-        self._pub_key: PublicKey
-        self._address: str
-        if is_public:
-            self._prv_key = None
-            self._pub_key = PublicKey(key_bytes)
-            self._address = public_key_to_address(key_bytes)
-        else:
-            self._prv_key = PrivateKey(key_bytes)
-            self._pub_key = self._prv_key.public_key
-            self._address = public_key_to_address(self._pub_key.format())
-        self._scriptcode: bytes = (OP_DUP + OP_HASH160 + OP_PUSH_20 + address_to_public_key_hash(self.address) + OP_EQUALVERIFY + OP_CHECKSIG)
-        self._transactions: List[Transaction] = self._load_transactions()
-        self._unspents: List[Unspent] = self._load_unspents()
+    """
+    A compact record holding only the raw key bytes,
+    the address, scriptcode, coincurve objects and cached state are computed on first access
+    """
+
+    __slots__ = (
+        "_pub_key_bytes", "_prv_key_bytes",
+        "_pub_key", "_prv_key", "_hash160", "_address", "_scriptcode",
+        "_transactions", "_unspents"
+    )
+
+    def __init__(self, pub_key_bytes: bytes, prv_key_bytes: Optional[bytes] = None, address: Optional[str] = None,
+                 hash160: Optional[bytes] = None):
+        self._pub_key_bytes: bytes = pub_key_bytes
+        self._prv_key_bytes: Optional[bytes] = prv_key_bytes
+        self._pub_key: Optional[PublicKey] = None
+        self._prv_key: Optional[PrivateKey] = None
+        self._hash160: Optional[bytes] = hash160
+        self._address: Optional[str] = address
+        self._scriptcode: Optional[bytes] = None
+        self._transactions: Optional[List[Transaction]] = None
+        self._unspents: Optional[List[Unspent]] = None
 
     @property
     def is_private(self):
-        return self._prv_key is not None
+        return self._prv_key_bytes is not None
 
     @property
     def is_public(self):
-        return self._prv_key is None
+        return self._prv_key_bytes is None
 
     @property
     def public_key(self):
         # todo: temp inconsistent interface and return type for adaption with bitsv create_p2pkh_transaction function
-        return self._pub_key.format()
+        return self._pub_key_bytes
+
+    @property
+    @ensure_private
+    def private_key_bytes(self):
+        return self._prv_key_bytes
+
+    @property
+    def hash160(self) -> bytes:
+        if self._hash160 is None:
+            self._hash160 = hash160_many([self._pub_key_bytes])[0]
+        return self._hash160
 
     @property
     def address(self):
+        if self._address is None:
+            self._address = hash160_to_address(self.hash160)
         return self._address
 
     @property
     def scriptcode(self):
+        # built from the hash160 directly, decoding the address back would hash and divide it all over again
+        if self._scriptcode is None:
+            self._scriptcode = hash160_to_scriptcode(self.hash160)
         return self._scriptcode
 
     @property
     def balance(self):
-        return sum(unspent.amount for unspent in self._unspents)
+        return sum(unspent.amount for unspent in self.unspents)
+
+    @property
+    def has_unspents_loaded(self):
+        return self._unspents is not None
 
     @property
     def unspents(self):
+        if self._unspents is None:
+            self._unspents = self._load_unspents()
         return self._unspents
 
     @property
     def transactions(self):
+        if self._transactions is None:
+            self._transactions = self._load_transactions()
         return self._transactions
 
+    @property
+    def _ec_public_key(self) -> PublicKey:
+        if self._pub_key is None:
+            self._pub_key = PublicKey(self._pub_key_bytes)
+        return self._pub_key
+
+    @property
+    def _ec_private_key(self) -> PrivateKey:
+        if self._prv_key is None:
+            self._prv_key = PrivateKey(self._prv_key_bytes)
+        return self._prv_key
+
+    def update_unspents(self, unspents: List[Unspent]):
+        self._unspents = unspents
+
+    def fetch_unspents(self) -> List[Unspent]:
+        print(f"querying {self.address} unspents")
+        return NETWORK_API.get_unspents(self.address)
+
     def refresh_unspents(self):
-        print(f"querying {self._address} unspents")
-        self._unspents = NETWORK_API.get_unspents(self._address)
-        if self._unspents:
-            self._dump_unspents()
+        self._unspents = self.fetch_unspents()
+        self._dump_unspents()
 
-    def refresh_transactions(self):
-        print(f"querying {self._address} transactions")
-        self._transactions = [NETWORK_API.get_transaction(_id) for _id in NETWORK_API.get_transactions(self._address)]
-        if self._transactions:
-            self._dump_transactions()
+    @property
+    def has_fresh_unspents(self) -> bool:
+        refreshed_at = USP_STORE.refreshed_at(self.address)
+        return refreshed_at is not None and time.time() - refreshed_at < UNSPENTS_MAX_AGE
+
+    def apply_spend(self, txid: str, spent: List[Unspent], outputs: List[tuple]):
+        """
+        Drop the unspents a broadcast transaction spent and add its outputs paying this address as unconfirmed,
+        so that the next payment can chain off them without querying the network
+        """
+        outpoints = {(unspent.txid, unspent.txindex) for unspent in spent}
+        created = chained_unspents(txid, outputs, {self.address})
+        self._unspents = [
+            unspent for unspent in self.unspents if (unspent.txid, unspent.txindex) not in outpoints
+        ] + created.get(self.address, [])
+        USP_STORE.apply_spend(outpoints, created)
+
+    def update_transactions(self, transactions: List[Transaction]):
+        self._transactions = transactions
+
+    def fetch_history(self) -> List[Tuple[str, int]]:
+        print(f"querying {self.address} transactions")
+        return [(entry["tx_hash"], entry["height"]) for entry in NETWORK_API.get_history(self.address)]
+
+    def refresh_transactions(self, full=False):
+        TRX_STORE.sync_histories(
+            {self.address: self.fetch_history()}, NETWORK_API.get_chain_height() - CONFIRMATION_DEPTH, full
+        )
+        txids = TRX_STORE.history(self.address)
+        transactions = fetch_transactions(txids)
+        self._transactions = [transactions[txid] for txid in txids if txid in transactions]
 
     def verify(self, signature, data):
         """Verifies some data was signed by this private key.
@@ -94,7 +182,7 @@ class Key:
         :type data: ``bytes``
         :rtype: ``bool``
         """
-        return self._pub_key.verify(signature, data)
+        return self._ec_public_key.verify(signature, data)
 
     @ensure_private
     def sign(self, data):
@@ -106,7 +194,29 @@ class Key:
         :returns: A signature compliant with BIP-62.
         :rtype: ``bytes``
         """
-        return self._prv_key.sign(data)
+        return self._ec_private_key.sign(data)
+
+    def verify_many(self, signatures, data_list):
+        """Verifies many signatures at once, large batches are verified in parallel.
+
+        :param signatures: The signatures to verify.
+        :type signatures: ``list`` of ``bytes``
+        :param data_list: The data that was supposedly signed, one per signature.
+        :type data_list: ``list`` of ``bytes``
+        :rtype: ``list`` of ``bool``
+        """
+        return verify_many([(self._pub_key_bytes, signature, data) for signature, data in zip(signatures, data_list)])
+
+    @ensure_private
+    def sign_many(self, data_list):
+        """Signs many messages at once, large batches are signed in parallel.
+
+        :param data_list: The messages to sign.
+        :type data_list: ``list`` of ``bytes``
+        :returns: Signatures compliant with BIP-62, in the order of data_list.
+        :rtype: ``list`` of ``bytes``
+        """
+        return sign_many([(self._prv_key_bytes, data) for data in data_list])
 
     @ensure_private
     def send(self, outputs, fee=None, leftover=None, combine=True,
@@ -147,15 +257,19 @@ class Key:
         :returns: The transaction ID.
         :rtype: ``str``
         """
-        self.refresh_unspents()
-        tx_hex = self._create_transaction(
+        # unspents refreshed moments ago already include the change of this key's previous payments
+        if not self.has_fresh_unspents:
+            self.refresh_unspents()
+        spent, outputs, tx_hex = self._create_transaction(
             outputs, fee=fee, leftover=leftover, combine=combine,
             message=message, unspents=unspents, custom_pushdata=custom_pushdata
         )
 
         NETWORK_API.broadcast_tx(tx_hex)
 
-        return calc_txid(tx_hex)
+        txid = calc_txid(tx_hex)
+        self.apply_spend(txid, spent, outputs)
+        return txid
 
     def _create_transaction(self, outputs, fee=None, leftover=None, combine=True,
                             message=None, unspents=None, custom_pushdata=False):  # pragma: no cover
@@ -190,8 +304,8 @@ class Key:
                                 :func:`~bitsv.PrivateKey.send` function and the
                                 :func:`~bitsv.PrivateKey.create_transaction` functions.
         :type custom_pushdata: ``bool``
-        :returns: The signed transaction as hex.
-        :rtype: ``str``
+        :returns: The unspents spent, the outputs paid and the signed transaction as hex.
+        :rtype: ``tuple``
         """
 
         unspents, outputs = sanitize_tx_data(
@@ -204,22 +318,18 @@ class Key:
             custom_pushdata=custom_pushdata
         )
 
-        return create_p2pkh_transaction(self, unspents, outputs, custom_pushdata=custom_pushdata)
+        tx_hex = create_p2pkh_transaction(
+            [(self, unspent) for unspent in unspents], outputs, custom_pushdata=custom_pushdata
+        )
+        return unspents, outputs, tx_hex
 
     def _load_transactions(self):
-        return []
-
-    def _dump_transactions(self):
-        pass
+        txids = TRX_STORE.history(self.address)
+        transactions = TRX_STORE.get_many(txids)
+        return [transactions[txid] for txid in txids if txid in transactions]
 
     def _load_unspents(self):
-        try:
-            with open(USP_CACHE_DIR + self._address, "r") as usp_cache:
-                return [Unspent.from_dict(usp_dict) for usp_dict in json.load(usp_cache)]
-        except FileNotFoundError:
-            return []
+        return USP_STORE.load(self.address)
 
     def _dump_unspents(self):
-        os.makedirs(USP_CACHE_DIR, exist_ok=True)
-        with open(USP_CACHE_DIR + self._address, "w") as usp_cache:
-            json.dump([usp.to_dict() for usp in self._unspents], fp=usp_cache, indent=4)
+        USP_STORE.replace_many({self.address: self._unspents})
@@ -0,0 +1,94 @@
+import itertools
+from typing import Dict, Iterator, List
+
+from hdwallet.core.key import Key
+from hdwallet.core.wallet import Wallet
+from hdwallet.storage.unspents import USP_STORE
+from hdwallet.utils import multithreading_execute
+
+
+class WalletManager:
+    """
+    Many wallets refreshed together. An address found in several wallets (an xprv and its xpub, one account
+    opened twice) is queried once per refresh cycle however many wallets contain it. The derivation cache,
+    the unspent and transaction stores and the network session are the shared module level ones.
+    """
+
+    def __init__(self):
+        self.__wallets: Dict[str, Wallet] = {}
+
+    def add(self, name: str, wallet: Wallet):
+        if name in self.__wallets:
+            raise ValueError(f"a wallet named {name!r} is managed already")
+        self.__wallets[name] = wallet
+
+    def remove(self, name: str) -> Wallet:
+        return self.__wallets.pop(name)
+
+    def __getitem__(self, name: str) -> Wallet:
+        return self.__wallets[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__wallets)
+
+    def __len__(self):
+        return len(self.__wallets)
+
+    @property
+    def __keys_by_address(self) -> Dict[str, Key]:
+        # one key per distinct address, the first wallet holding it provides it
+        keys = {}
+        for wallet in self.__wallets.values():
+            for key in itertools.chain(wallet.receive_keys, wallet.change_keys):
+                keys.setdefault(key.address, key)
+        return keys
+
+    @property
+    def addresses(self) -> List[str]:
+        return list(self.__keys_by_address)
+
+    def wallets_of(self, address: str) -> List[str]:
+        return [name for name, wallet in self.__wallets.items() if wallet.has_address(address)]
+
+    @property
+    def balance(self) -> int:
+        # an unspent shared by overlapping wallets is counted once
+        amounts = {(usp.txid, usp.txindex): usp.amount for wallet in self.__wallets.values() for usp in wallet.unspents}
+        return sum(amounts.values())
+
+    def refresh_transactions(self, progress=None, full=False):
+        """
+        Every wallet scans its chains as usual, the histories queried for one wallet are reused by the others
+        and transactions already fetched for one are found in the shared store by the next
+        """
+        histories = {}
+
+        def fetch_history(key):
+            if key.address not in histories:
+                histories[key.address] = key.fetch_history()
+            return histories[key.address]
+
+        for wallet in self.__wallets.values():
+            wallet.refresh_transactions(progress, full, fetch_history)
+
+    def refresh_unspents(self, progress=None):
+        keys = self.__keys_by_address
+        results = multithreading_execute([key.fetch_unspents for key in keys.values()], progress)
+        fetched = {address: result.value for address, result in zip(keys, results) if result.ok}
+        USP_STORE.replace_many(fetched)
+        for wallet in self.__wallets.values():
+            wallet.apply_unspents(fetched)
+
+    async def async_refresh_unspents(self, api=None):
+        """
+        Asyncio counterpart of refresh_unspents, on the given AsyncWhatsOnChain or a session of its own
+        """
+        if api is None:
+            from hdwallet.core.async_network import AsyncWhatsOnChain
+            async with AsyncWhatsOnChain() as api:
+                return await self.async_refresh_unspents(api)
+
+        fetched = await api.get_unspents_bulk(self.addresses)
+        USP_STORE.replace_many(fetched)
+        for wallet in self.__wallets.values():
+            wallet.apply_unspents(fetched)
@@ -1,4 +1,89 @@
-from bitsv.network import NetworkAPI
+import json
+import time
+from decimal import Decimal
+from typing import List
 
+import requests
+from bitsv.network.meta import Unspent
+from bitsv.network.services.whatsonchain import woc_tx_to_transaction, woc_utxos_to_unspents
+from bitsv.network.transaction import Transaction
 
-NETWORK_API = NetworkAPI('main')
+from hdwallet import metrics
+from hdwallet.configs import NETWORK_API_URL, NETWORK_CONNECTIONS, NETWORK_TIMEOUT
+
+
+# maximum number of addresses or txids accepted by one WhatsOnChain bulk request
+BULK_LIMIT = 20
+CHAIN_HEIGHT_TTL = 30
+
+
+def instrumented(client: str):
+    """
+    Latency histogram and error counter of a network API method
+    """
+    def decorator(method):
+        return metrics.timed("hdwallet_network_request_seconds", "hdwallet_network_errors_total",
+                             client=client, method=method.__name__)(method)
+    return decorator
+
+
+class WhatsOnChain:
+    """
+    Blocking WhatsOnChain client with the bitsv NetworkAPI interface,
+    all requests share one session and thus a pool of keep-alive connections
+    """
+
+    def __init__(self, url: str = NETWORK_API_URL, connections: int = NETWORK_CONNECTIONS):
+        self._url = url.rstrip("/")
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._chain_height = (0, 0.0)
+
+    def _request(self, method, path, payload=None):
+        response = self._session.request(method, self._url + path, json=payload, timeout=NETWORK_TIMEOUT)
+        response.raise_for_status()
+        return json.loads(response.text, parse_float=Decimal)
+
+    @instrumented("blocking")
+    def get_chain_height(self) -> int:
+        # unspent confirmations are relative to the tip, which does not need a request per address
+        height, fetched_at = self._chain_height
+        if time.monotonic() - fetched_at > CHAIN_HEIGHT_TTL:
+            height = self._request("GET", "/chain/info")["blocks"]
+            self._chain_height = (height, time.monotonic())
+        return height
+
+    @instrumented("blocking")
+    def get_block_time(self, height: int) -> int:
+        return self._request("GET", f"/block/height/{height}")["time"]
+
+    @instrumented("blocking")
+    def get_balance(self, address: str) -> int:
+        balance = self._request("GET", f"/address/{address}/balance")
+        return balance["confirmed"] + balance["unconfirmed"]
+
+    @instrumented("blocking")
+    def get_history(self, address: str) -> List[dict]:
+        return self._request("GET", f"/address/{address}/history")
+
+    @instrumented("blocking")
+    def get_transactions(self, address: str) -> List[str]:
+        return [entry["tx_hash"] for entry in self.get_history(address)]
+
+    @instrumented("blocking")
+    def get_transaction(self, txid: str) -> Transaction:
+        return woc_tx_to_transaction(self._request("GET", f"/tx/hash/{txid}"))
+
+    @instrumented("blocking")
+    def get_unspents(self, address: str) -> List[Unspent]:
+        return woc_utxos_to_unspents(self._request("GET", f"/address/{address}/unspent"), self.get_chain_height())
+
+    @instrumented("blocking")
+    def broadcast_tx(self, tx_hex: str) -> str:
+        return self._request("POST", "/tx/raw", {"txhex": tx_hex})
+
+
+NETWORK_API = WhatsOnChain()
@@ -0,0 +1,152 @@
+import math
+import random
+from typing import Container, Dict, List, Optional, Sequence, Tuple
+
+from bitsv.exceptions import InsufficientFunds
+from bitsv.network.meta import Unspent
+from bitsv.transaction import DUST
+
+
+# serialized sizes in bytes: compressed P2PKH input, P2PKH output, version + locktime + in/out counts
+INPUT_SIZE = 148
+OUTPUT_SIZE = 34
+OVERHEAD_SIZE = 10
+
+BNB_MAX_TRIES = 100000
+KNAPSACK_ITERATIONS = 1000
+# candidates past the largest-first run covering the target, and the bound on iterations times candidates
+KNAPSACK_WINDOW = 256
+KNAPSACK_STEPS = 200000
+
+
+def _branch_and_bound(values: List[int], target: int, upper: int, max_tries: int) -> Optional[List[int]]:
+    """
+    Depth-first search over values (sorted descending) for a subset summing into [target, upper],
+    preferring the smallest excess and then the fewest inputs. Returns the chosen indices.
+    """
+    suffix = [0] * (len(values) + 1)
+    # the first index past the run of values equal to values[i]
+    next_different = [len(values)] * (len(values) + 1)
+    for i in range(len(values) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + values[i]
+        next_different[i] = next_different[i + 1] if i + 1 < len(values) and values[i + 1] == values[i] else i + 1
+    best, best_excess = None, None
+    included: List[int] = []
+    value, depth = 0, 0
+    for _ in range(max_tries):
+        if value + suffix[depth] < target or value > upper:
+            backtrack = True
+        elif value >= target:
+            excess = value - target
+            if best is None or (excess, len(included)) < (best_excess, len(best)):
+                best, best_excess = list(included), excess
+            if excess == 0:
+                break
+            backtrack = True
+        else:
+            backtrack = False
+        if backtrack:
+            if not included:
+                break
+            # exclude the last included value and skip its equals, those branches would be identical
+            last = included.pop()
+            value -= values[last]
+            depth = next_different[last]
+        else:
+            included.append(depth)
+            value += values[depth]
+            depth += 1
+    return best
+
+
+def _knapsack(values: List[int], target: int, rng: random.Random) -> Optional[List[int]]:
+    """
+    Bitcoin Core's knapsack solver over values (sorted descending): the smallest single value covering target,
+    unless a subset of the smaller values found by random approximation comes closer. Returns the chosen indices.
+    The approximation only looks at the largest-first run of smaller values covering target and the
+    KNAPSACK_WINDOW values after it, iterates less the more values that is, and stops within dust of target.
+    """
+    first_smaller = next((i for i, value in enumerate(values) if value < target), len(values))
+    lowest_larger = first_smaller - 1 if first_smaller else None
+    end, prefix_total = first_smaller, 0
+    while end < len(values) and prefix_total < target:
+        prefix_total += values[end]
+        end += 1
+    best, best_total = None, None
+    if prefix_total >= target:
+        window = range(first_smaller, min(end + KNAPSACK_WINDOW, len(values)))
+        best, best_total = list(range(first_smaller, end)), prefix_total
+        for _ in range(max(1, min(KNAPSACK_ITERATIONS, KNAPSACK_STEPS // len(window)))):
+            if best_total - target < DUST:
+                break
+            included, total = set(), 0
+            # the first pass includes each value at random, the second tries the ones left out
+            for first_pass in (True, False):
+                for i in window:
+                    if (rng.random() < 0.5) if first_pass else i not in included:
+                        included.add(i)
+                        total += values[i]
+                        if total >= target:
+                            if total < best_total:
+                                best, best_total = sorted(included), total
+                            included.discard(i)
+                            total -= values[i]
+    if lowest_larger is not None and (best is None or values[lowest_larger] <= best_total):
+        return [lowest_larger]
+    return best
+
+
+def select_unspents(unspents: Sequence[Unspent], amount: int, fee: float, n_outputs: int,
+                    rng: Optional[random.Random] = None) -> List[Unspent]:
+    """
+    Choose inputs paying amount to n_outputs outputs at fee satoshi per byte.
+    Branch and bound first looks for an input set needing no change output, otherwise the knapsack solver
+    looks for the input set leaving the smallest change above dust. Funds too short of that are taken largest
+    first, what is left over goes to the miners.
+    """
+    base = amount + fee * (OVERHEAD_SIZE + n_outputs * OUTPUT_SIZE)
+    candidates = sorted((u for u in unspents if u.amount > fee * INPUT_SIZE), key=lambda u: u.amount, reverse=True)
+    effective = [int(u.amount - fee * INPUT_SIZE) for u in candidates]
+    # any excess below the cost of a change output (or below dust) is simply left to the miners
+    cost_of_change = max(fee * (OUTPUT_SIZE + INPUT_SIZE), DUST)
+    if chosen := _branch_and_bound(effective, int(base + 0.5), int(base + cost_of_change), BNB_MAX_TRIES):
+        return [candidates[i] for i in chosen]
+
+    target = int(base + fee * OUTPUT_SIZE + 0.5)
+    if chosen := _knapsack(effective, target + DUST, rng or random.Random()):
+        return [candidates[i] for i in chosen]
+    # the knapsack found no set leaving dust, so all of them together leave less: the fewest inputs will do
+    total = 0
+    for i, value in enumerate(effective):
+        total += value
+        if total >= target:
+            return candidates[:i + 1]
+    raise InsufficientFunds(f"Balance {sum(u.amount for u in unspents)} is less than {target} (including fee).")
+
+
+def plan_payment(unspents: Sequence[Unspent], outputs: List[Tuple[str, int]], fee: float,
+                 leftover: str) -> Tuple[List[Unspent], List[Tuple[str, int]]]:
+    """
+    The inputs and the outputs ``(destination, satoshi)`` of a payment, with a change output to leftover
+    when the selected inputs leave more than dust. Sized like select_unspents sizes it, so that an input set
+    chosen to need no change output is built without one.
+    """
+    amount = sum(value for _, value in outputs)
+    selected = select_unspents(unspents, amount, fee, len(outputs))
+    size = OVERHEAD_SIZE + len(selected) * INPUT_SIZE + len(outputs) * OUTPUT_SIZE
+    change = sum(unspent.amount for unspent in selected) - amount - math.ceil(fee * (size + OUTPUT_SIZE))
+    if change > DUST:
+        outputs = outputs + [(leftover, change)]
+    return selected, outputs
+
+
+def chained_unspents(txid: str, outputs: Sequence[tuple], addresses: Container[str]) -> Dict[str, List[Unspent]]:
+    """
+    The outputs of a just broadcast transaction that pay any of addresses, as unconfirmed unspents by address.
+    outputs are ``(destination, satoshi)`` as the transaction was built from, OP_RETURN outputs are skipped.
+    """
+    unspents = {}
+    for txindex, (destination, amount) in enumerate(outputs):
+        if isinstance(destination, str) and destination in addresses:
+            unspents.setdefault(destination, []).append(Unspent(amount, 0, txid, txindex))
+    return unspents
@@ -0,0 +1,187 @@
+"""
+Publishing data files on chain in OP_RETURN outputs without loading them into memory.
+
+A file is memory-mapped and cut into memoryview chunks, one pushdata per output. Each transaction's outputs
+are hashed for signing and then written out piece by piece, so memory use stays flat whatever the payload size.
+Payloads above PUBLISH_TX_DATA_SIZE span a chain of transactions, each funded by the change of the one before.
+"""
+import math
+import mmap
+import os
+from contextlib import contextmanager
+from hashlib import sha256
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from bitsv.exceptions import InsufficientFunds
+from bitsv.network.meta import Unspent
+from bitsv.transaction import DUST, LOCK_TIME, OP_FALSE, OP_PUSHDATA1, OP_PUSHDATA2, OP_PUSHDATA4, OP_RETURN, \
+    VERSION_1, construct_input_block
+from bitsv.utils import int_to_varint
+
+from hdwallet.configs import PUBLISH_CHUNK_SIZE, PUBLISH_TX_DATA_SIZE
+from hdwallet.core.payment import INPUT_SIZE, OUTPUT_SIZE
+from hdwallet.core.signing import sign_inputs
+
+if TYPE_CHECKING:
+    from hdwallet.core.key import Key
+
+
+ZERO_AMOUNT = bytes(8)
+
+
+class PublishedTransaction(NamedTuple):
+    txid: str
+    size: int
+    fee: int
+    # what the next transaction spends, None for a last transaction whose remainder went to the miners
+    change: Optional[Unspent]
+
+
+@contextmanager
+def open_payload(source) -> Iterator[memoryview]:
+    """
+    A read-only byte view of a file path, memory-mapped, or of a bytes-like buffer
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        with memoryview(source) as view:
+            yield view if view.format == "B" and view.ndim == 1 else view.cast("B")
+        return
+    with open(source, "rb") as file:
+        # an empty file cannot be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            yield view
+
+
+def pushdata_code(length: int) -> bytes:
+    if length < OP_PUSHDATA1[0]:
+        return length.to_bytes(1, byteorder="little")
+    elif length <= 0xff:
+        return OP_PUSHDATA1 + length.to_bytes(1, byteorder="little")
+    elif length <= 0xffff:
+        return OP_PUSHDATA2 + length.to_bytes(2, byteorder="little")
+    return OP_PUSHDATA4 + length.to_bytes(4, byteorder="little")
+
+
+def _data_output_prefix(length: int) -> bytes:
+    # everything of an OP_RETURN output but the data itself
+    script_prefix = OP_FALSE + OP_RETURN + pushdata_code(length)
+    return ZERO_AMOUNT + int_to_varint(len(script_prefix) + length) + script_prefix
+
+
+def _chunk_lengths(length: int, chunk_size: int) -> List[int]:
+    return [min(chunk_size, length - start) for start in range(0, length, chunk_size)]
+
+
+def estimate_size(n_inputs: int, chunk_lengths: Sequence[int]) -> int:
+    """
+    The size of a transaction publishing chunks of the given lengths, with a change output
+    """
+    n_outputs = len(chunk_lengths) + 1
+    return (
+        len(VERSION_1) + len(int_to_varint(n_inputs)) + n_inputs * INPUT_SIZE +
+        len(int_to_varint(n_outputs)) + sum(len(_data_output_prefix(length)) + length for length in chunk_lengths) +
+        OUTPUT_SIZE + len(LOCK_TIME)
+    )
+
+
+class _HashingWriter:
+    """
+    Passes everything written on to output while hashing and counting it, giving the txid and size at the end
+    """
+
+    def __init__(self, output: BinaryIO):
+        self._output = output
+        self._hash = sha256()
+        self.size = 0
+
+    def write(self, data):
+        self._output.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    @property
+    def txid(self) -> str:
+        return sha256(self._hash.digest()).digest()[::-1].hex()
+
+
+def _write_transaction(key: "Key", unspents: List[Unspent], chunks: List[memoryview], change: int,
+                       output: BinaryIO) -> Tuple[str, int]:
+    pieces = [(_data_output_prefix(len(chunk)), chunk) for chunk in chunks]
+    if change:
+        pieces.append((change.to_bytes(8, byteorder="little") + int_to_varint(len(key.scriptcode)) + key.scriptcode,
+                       b""))
+
+    # hashOutputs is the only part of the sighash preimage covering the data, it is fed chunk by chunk
+    hash_outputs = sha256()
+    for prefix, data in pieces:
+        hash_outputs.update(prefix)
+        hash_outputs.update(data)
+    tx_ins = sign_inputs([(key, unspent) for unspent in unspents], sha256(hash_outputs.digest()).digest())
+
+    writer = _HashingWriter(output)
+    writer.write(VERSION_1 + int_to_varint(len(tx_ins)) + construct_input_block(tx_ins) + int_to_varint(len(pieces)))
+    for prefix, data in pieces:
+        writer.write(prefix)
+        writer.write(data)
+    writer.write(LOCK_TIME)
+    return writer.txid, writer.size
+
+
+def publish(key: "Key", source, output: BinaryIO, unspents: Optional[Sequence[Unspent]] = None, fee: float = 1,
+            chunk_size: int = PUBLISH_CHUNK_SIZE,
+            tx_data_size: int = PUBLISH_TX_DATA_SIZE) -> List[PublishedTransaction]:
+    """
+    Write the raw transactions publishing source, a file path or a bytes-like buffer, to the binary output one
+    after the other, their sizes tell where each ends. Inputs are chosen largest first among unspents, by default
+    the key's own, to pay fee satoshi per byte for the whole chain and leave every intermediate change at least
+    dust. Nothing is broadcast.
+    """
+    if unspents is None:
+        if not key.has_fresh_unspents:
+            key.refresh_unspents()
+        unspents = key.unspents
+    per_transaction = max(tx_data_size // chunk_size, 1) * chunk_size
+
+    with open_payload(source) as data:
+        if not data:
+            raise ValueError("nothing to publish")
+        spans = [(start, min(start + per_transaction, len(data))) for start in range(0, len(data), per_transaction)]
+        lengths = [_chunk_lengths(end - start, chunk_size) for start, end in spans]
+        # every transaction after the first spends a single input, the change of the one before
+        fees = [math.ceil(fee * estimate_size(1, chunk_lengths)) for chunk_lengths in lengths]
+
+        # the change of every transaction but the last funds the next one and may not fall below dust,
+        # the smallest of them is the last one's input: whatever the last fee leaves short of dust is added
+        shortfall = max(DUST - fees[-1], 0) if len(spans) > 1 else 0
+        candidates = sorted(unspents, key=lambda unspent: unspent.amount, reverse=True)
+        selected, total_in = [], 0
+        for unspent in candidates:
+            selected.append(unspent)
+            total_in += unspent.amount
+            fees[0] = math.ceil(fee * estimate_size(len(selected), lengths[0]))
+            if total_in >= sum(fees) + shortfall:
+                break
+        else:
+            raise InsufficientFunds(f"Balance {total_in} is less than {sum(fees) + shortfall} (including fee).")
+
+        published = []
+        inputs, remaining = selected, total_in
+        for (start, end), tx_fee in zip(spans, fees):
+            remaining -= tx_fee
+            is_last = end == len(data)
+            # a last change below dust is not worth an output, the miners take it
+            change = 0 if is_last and remaining <= DUST else remaining
+            chunks = [data[offset:min(offset + chunk_size, end)] for offset in range(start, end, chunk_size)]
+            try:
+                txid, size = _write_transaction(key, inputs, chunks, change, output)
+            finally:
+                # views left alive would keep the file mapped
+                for chunk in chunks:
+                    chunk.release()
+            change_unspent = Unspent(change, 0, txid, len(chunks)) if change else None
+            published.append(PublishedTransaction(txid, size, tx_fee + (remaining - change), change_unspent))
+            inputs = [change_unspent]
+    return published
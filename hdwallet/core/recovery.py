@@ -0,0 +1,207 @@
+"""
+Recovery of a BIP39 mnemonic with missing or mistyped words.
+
+Every word of the phrase stands for a set of candidates: a list word for itself, "?" for all 2048 words, a word
+outside the list or one followed by "?" for the list words it may have been meant as. A phrase one word short of
+a mnemonic length is tried with the word missing at every position. Candidate phrases are enumerated lazily and
+the BIP39 checksum rejects all but one in 16 (12 words) to 256 (24 words) of them in the calling process. Only
+the survivors are stretched into seeds and derived, in batches across the process pool, until an address matches
+one of the targets or, without targets, has on-chain activity.
+"""
+import itertools
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from bip_utils import Bip32Secp256k1
+
+from hdwallet.bips.bip_0039.codec import MNEMONIC_LENGTHS, indices_to_entropy, mnemonic_to_seed
+from hdwallet.bips.bip_0039.words import BIP39_INDEX_EN, BIP39_WORDS_EN
+from hdwallet.configs import DISCOVERY_PATHS, PROCESS_WORKERS, RECOVERY_ADDRESSES, RECOVERY_BATCH_SIZE
+from hdwallet.core.address import public_keys_to_addresses
+from hdwallet.core.derivation import derive_children
+from hdwallet.core.network import NETWORK_API
+from hdwallet.utils import get_process_pool, multithreading_execute
+
+
+ALL_WORDS = list(range(len(BIP39_WORDS_EN)))
+# BIP39 english words are told apart by their first four letters
+PREFIX_LENGTH = 4
+
+
+class RecoveredMnemonic(NamedTuple):
+    mnemonic: str
+    path: str
+    address: str
+
+
+class RecoveryIncomplete(Exception):
+    """
+    No candidate matched, but the activity of some could not be looked up even after retries
+    """
+
+    def __init__(self, unchecked: List[str], error: Exception):
+        super().__init__(f"the activity of {len(unchecked)} candidate mnemonics could not be looked up: {error!r}")
+        self.unchecked = unchecked
+        self.error = error
+
+
+def _edit_distance(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def similar_words(word: str, max_distance: int = 2) -> List[int]:
+    """
+    The indices of the list words a mistyped word may have been meant as: the word itself if listed, the ones sharing
+    its first four letters and the ones at the smallest edit distance found up to max_distance
+    """
+    distances = {index: _edit_distance(word, candidate) for candidate, index in BIP39_INDEX_EN.items()}
+    nearest = min((distance for distance in distances.values() if distance), default=0)
+    return [
+        index for index, distance in distances.items()
+        if distance == 0 or distance <= min(nearest, max_distance)
+        or len(word) >= PREFIX_LENGTH and BIP39_WORDS_EN[index].startswith(word[:PREFIX_LENGTH])
+    ]
+
+
+def _slot(token: str) -> List[int]:
+    if token == "?":
+        return ALL_WORDS
+    if token.endswith("?"):
+        return similar_words(token[:-1])
+    if token in BIP39_INDEX_EN:
+        return [BIP39_INDEX_EN[token]]
+    return similar_words(token)
+
+
+def candidate_patterns(phrase: str) -> List[List[List[int]]]:
+    """
+    The candidate word indices of every position, one pattern per way of reaching a mnemonic length.
+    raise ValueError when the phrase is too far from any mnemonic length
+    """
+    slots = [_slot(token) for token in phrase.lower().split()]
+    if len(slots) in MNEMONIC_LENGTHS:
+        return [slots]
+    if len(slots) + 1 in MNEMONIC_LENGTHS:
+        return [slots[:position] + [ALL_WORDS] + slots[position:] for position in range(len(slots) + 1)]
+    raise ValueError(f"a mnemonic has {', '.join(map(str, MNEMONIC_LENGTHS))} words, got {len(slots)}")
+
+
+def count_candidates(patterns: List[List[List[int]]]) -> int:
+    total = 0
+    for slots in patterns:
+        combinations = 1
+        for slot in slots:
+            combinations *= len(slot)
+        total += combinations
+    return total
+
+
+def checksum_survivors(patterns: List[List[List[int]]], enumerated: List[int]) -> Iterator[str]:
+    """
+    The candidate phrases passing the checksum, enumerated[0] counts the candidates tried so far
+    """
+    for slots in patterns:
+        for indices in itertools.product(*slots):
+            enumerated[0] += 1
+            try:
+                indices_to_entropy(indices)
+            except ValueError:
+                continue
+            yield " ".join(BIP39_WORDS_EN[index] for index in indices)
+
+
+def _derive_batch(mnemonics: List[str], passphrase: str, paths: Sequence[str],
+                  n_addresses: int) -> List[Tuple[str, Dict[str, List[str]]]]:
+    # runs in the process pool: the costly part, two thousand PBKDF2 rounds per phrase, then public derivation only
+    results = []
+    for mnemonic in mnemonics:
+        seed = mnemonic_to_seed(mnemonic, passphrase)
+        addresses = {}
+        for path in paths:
+            chain_key = Bip32Secp256k1.FromSeedAndPath(seed, path).ChildKey(0)
+            chain_key.ConvertToPublic()
+            public_keys = [public_key for public_key, _ in derive_children(chain_key, 0, n_addresses)]
+            addresses[path] = public_keys_to_addresses(public_keys)[1]
+        results.append((mnemonic, addresses))
+    return results
+
+
+def _find_target(results, targets) -> Optional[RecoveredMnemonic]:
+    for mnemonic, addresses in results:
+        for path, path_addresses in addresses.items():
+            for address in path_addresses:
+                if address in targets:
+                    return RecoveredMnemonic(mnemonic, path, address)
+    return None
+
+
+def _find_activity(results, failures: List[Tuple[str, Exception]]) -> Optional[RecoveredMnemonic]:
+    # the first receive address of a wallet ever used is the one to look at
+    candidates = [(mnemonic, path, path_addresses[0])
+                  for mnemonic, addresses in results for path, path_addresses in addresses.items()]
+    outcomes = multithreading_execute(
+        [lambda address=address: NETWORK_API.get_transactions(address) for _, _, address in candidates]
+    )
+    for candidate, outcome in zip(candidates, outcomes):
+        if outcome.ok and outcome.value:
+            return RecoveredMnemonic(*candidate)
+    # a lookup failing after its retries says nothing about the candidate, it is reported rather than dismissed
+    failures.extend((mnemonic, outcome.error) for (mnemonic, _, _), outcome in zip(candidates, outcomes)
+                    if not outcome.ok)
+    return None
+
+
+def recover_mnemonic(phrase: str, passphrase: str = "", targets: Iterable[str] = (),
+                     paths: Optional[Sequence[str]] = None, n_addresses: int = RECOVERY_ADDRESSES,
+                     progress=None) -> Optional[RecoveredMnemonic]:
+    """
+    Search the candidates of phrase for the mnemonic whose first n_addresses receive addresses on one of paths
+    (account 0 of every discovery path by default) include a target, or without targets, whose first receive address
+    has on-chain activity. progress(done, total) is called with the number of candidates tried.
+    raise ValueError when the phrase is too far from any mnemonic length
+    raise RecoveryIncomplete when nothing matched but the activity of some candidates could not be looked up
+    """
+    targets = set(targets)
+    paths = [template.format(account=0) for template in DISCOVERY_PATHS] if paths is None else list(paths)
+    patterns = candidate_patterns(phrase)
+    total = count_candidates(patterns)
+    enumerated = [0]
+    survivors = checksum_survivors(patterns, enumerated)
+
+    pool = get_process_pool()
+    # a few batches per worker in flight, the enumeration runs no further ahead than that
+    pending = {}
+    done = 0
+    failures: List[Tuple[str, Exception]] = []
+    try:
+        while True:
+            while len(pending) < 2 * PROCESS_WORKERS:
+                batch = list(itertools.islice(survivors, RECOVERY_BATCH_SIZE))
+                if not batch:
+                    break
+                pending[pool.submit(_derive_batch, batch, passphrase, paths, n_addresses)] = enumerated[0]
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done = max(done, pending.pop(future))
+                results = future.result()
+                found = _find_target(results, targets) if targets else _find_activity(results, failures)
+                if found:
+                    return found
+            if progress and done < total:
+                progress(done, total)
+    finally:
+        for future in pending:
+            future.cancel()
+    if progress:
+        progress(total, total)
+    if failures:
+        raise RecoveryIncomplete(list(dict.fromkeys(mnemonic for mnemonic, _ in failures)), failures[0][1])
+    return None
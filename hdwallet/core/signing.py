@@ -0,0 +1,121 @@
+import itertools
+from typing import TYPE_CHECKING, Callable, List, Sequence, Tuple
+
+from bitsv.crypto import double_sha256, sha256
+from bitsv.network.meta import Unspent
+from bitsv.transaction import HASH_TYPE, LOCK_TIME, SEQUENCE, VERSION_1, TxIn, \
+    construct_input_block, construct_output_block
+from bitsv.utils import bytes_to_hex, hex_to_bytes, int_to_varint
+from coincurve import PrivateKey, PublicKey
+
+from hdwallet.configs import PROCESS_WORKERS, SIGNING_BATCH_SIZE
+from hdwallet.utils import get_process_pool
+
+if TYPE_CHECKING:
+    from hdwallet.core.key import Key
+
+
+def _sign_batch(jobs: List[Tuple[bytes, bytes]]) -> List[bytes]:
+    keys = {}
+    signatures = []
+    for prv_key_bytes, data in jobs:
+        if prv_key_bytes not in keys:
+            keys[prv_key_bytes] = PrivateKey(prv_key_bytes)
+        signatures.append(keys[prv_key_bytes].sign(data))
+    return signatures
+
+
+def _verify_batch(jobs: List[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    keys = {}
+    results = []
+    for pub_key_bytes, signature, data in jobs:
+        if pub_key_bytes not in keys:
+            keys[pub_key_bytes] = PublicKey(pub_key_bytes)
+        try:
+            results.append(keys[pub_key_bytes].verify(signature, data))
+        except ValueError:
+            results.append(False)
+    return results
+
+
+def _run_batched(worker: Callable[[List], List], jobs: List) -> List:
+    # small workloads are not worth the round trip to other processes
+    if len(jobs) <= SIGNING_BATCH_SIZE or PROCESS_WORKERS <= 1:
+        return worker(jobs)
+    batches = [jobs[first:first + SIGNING_BATCH_SIZE] for first in range(0, len(jobs), SIGNING_BATCH_SIZE)]
+    return list(itertools.chain.from_iterable(get_process_pool().map(worker, batches)))
+
+
+def sign_many(jobs: List[Tuple[bytes, bytes]]) -> List[bytes]:
+    """
+    Sign (private key bytes, data) pairs, batches of SIGNING_BATCH_SIZE are spread across the process pool
+    """
+    return _run_batched(_sign_batch, jobs)
+
+
+def verify_many(jobs: List[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    """
+    Verify (public key bytes, signature, data) triples, batches of SIGNING_BATCH_SIZE are spread across the process pool
+    """
+    return _run_batched(_verify_batch, jobs)
+
+
+class SighashContext:
+    """
+    The BIP143 (forkid) preimage parts shared by all inputs of a transaction, computed once
+    """
+
+    def __init__(self, tx_ins: Sequence[TxIn], hash_outputs: bytes):
+        self._prefix = (
+            VERSION_1 +
+            double_sha256(b''.join(tx_in.txid + tx_in.txindex for tx_in in tx_ins)) +
+            double_sha256(SEQUENCE * len(tx_ins))
+        )
+        self._suffix = SEQUENCE + hash_outputs + LOCK_TIME + HASH_TYPE
+
+    def digest(self, tx_in: TxIn, scriptcode: bytes) -> bytes:
+        # signing hashes once more, giving the double sha256 sighash
+        return sha256(
+            self._prefix + tx_in.txid + tx_in.txindex + int_to_varint(len(scriptcode)) + scriptcode +
+            tx_in.amount + self._suffix
+        )
+
+
+def create_p2pkh_transaction(inputs: List[Tuple["Key", Unspent]], outputs, custom_pushdata=False) -> str:
+    """
+    Like bitsv's create_p2pkh_transaction, except that every input is signed by the key owning it,
+    and all inputs are signed together through sign_many
+    """
+    output_block = construct_output_block(outputs, custom_pushdata=custom_pushdata)
+    tx_ins = sign_inputs(inputs, double_sha256(output_block))
+    return bytes_to_hex(
+        VERSION_1 +
+        int_to_varint(len(tx_ins)) + construct_input_block(tx_ins) +
+        int_to_varint(len(outputs)) + output_block +
+        LOCK_TIME
+    )
+
+
+def sign_inputs(inputs: List[Tuple["Key", Unspent]], hash_outputs: bytes) -> List[TxIn]:
+    """
+    The P2PKH inputs spending the given unspents, signed by their keys for outputs hashing to hash_outputs
+    """
+    tx_ins = [
+        TxIn(b'', 0, hex_to_bytes(unspent.txid)[::-1], unspent.txindex.to_bytes(4, byteorder='little'),
+             unspent.amount.to_bytes(8, byteorder='little'))
+        for _, unspent in inputs
+    ]
+    context = SighashContext(tx_ins, hash_outputs)
+    signatures = sign_many([
+        (key.private_key_bytes, context.digest(tx_in, key.scriptcode)) for (key, _), tx_in in zip(inputs, tx_ins)
+    ])
+
+    for (key, _), tx_in, signature in zip(inputs, tx_ins, signatures):
+        signature += b'\x41'
+        script_sig = (
+            len(signature).to_bytes(1, byteorder='little') + signature +
+            len(key.public_key).to_bytes(1, byteorder='little') + key.public_key
+        )
+        tx_in.script = script_sig
+        tx_in.script_len = int_to_varint(len(script_sig))
+    return tx_ins
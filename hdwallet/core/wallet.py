@@ -1,35 +1,43 @@
 import itertools
-from typing import Dict
+from typing import Dict, List, Set, Tuple
 
 from bip_utils import Bip32Secp256k1
-from mnemonic import Mnemonic
+from bitsv.network.meta import Unspent
+from bitsv.network.rates import currency_to_satoshi_cached
+from bitsv.transaction import calc_txid
 
-from hdwallet.configs import DERIVATION_ADDRESS_NUMBER
-from hdwallet.core.key import Key
+from hdwallet.bips.bip_0039.codec import mnemonic_to_seed
+from hdwallet.configs import CONFIRMATION_DEPTH, GAP_LIMIT
+from hdwallet.core.derivation import derive_keys
+from hdwallet.core.discovery import async_scan_chain, scan_chain
+from hdwallet.core.history import History
+from hdwallet.core.index import UtxoIndex
+from hdwallet.core.key import Key, fetch_transactions
+from hdwallet.core.network import NETWORK_API
+from hdwallet.core.payment import chained_unspents, plan_payment
+from hdwallet.core.signing import create_p2pkh_transaction
+from hdwallet.storage.transactions import TRX_STORE
+from hdwallet.storage.unspents import USP_STORE
 from hdwallet.utils import multithreading_execute
 
 
-MNEMO = Mnemonic("english")
-
-
 class Wallet:
 
     def __init__(self, master_key: Bip32Secp256k1):
         self.__master_key: Bip32Secp256k1 = master_key
-        self.__receive_keys: Dict[str, Key] = {}
-        self.__change_keys: Dict[str, Key] = {}
-        for i, key_chain in enumerate([self.__receive_keys, self.__change_keys]):
-            derived_key = self.__master_key.ChildKey(i)
-            for j in range(DERIVATION_ADDRESS_NUMBER):
-                child_key = derived_key.ChildKey(j)
-                if child_key.IsPublicOnly():
-                    pub_key_bytes = child_key.PublicKey().RawCompressed().m_data_bytes
-                    pub_key = Key(pub_key_bytes, is_public=True)
-                    key_chain[pub_key.address] = pub_key
-                else:
-                    prv_key_bytes = child_key.PrivateKey().Raw().m_data_bytes
-                    prv_key = Key(prv_key_bytes, is_public=False)
-                    key_chain[prv_key.address] = prv_key
+        self.__receive_keys: List[Key] = []
+        self.__change_keys: List[Key] = []
+        # address -> key, filled on demand so that no address is encoded before it is needed
+        self.__keys_by_address: Dict[str, Key] = {}
+        self.__index = UtxoIndex()
+        # the number of receive and change keys load_unspents has indexed
+        self.__indexed = [0, 0]
+        # addresses paid by our own payments, used even before a refresh lists them in a history
+        self.__paid: Set[str] = set()
+        self.__chain_keys = [self.__master_key.ChildKey(0), self.__master_key.ChildKey(1)]
+        # start with one gap limit window per chain, discovery extends the chains as used addresses are found
+        for chain_key, key_chain in zip(self.__chain_keys, [self.__receive_keys, self.__change_keys]):
+            key_chain.extend(derive_keys(chain_key, 0, GAP_LIMIT))
 
     @property
     def is_watch_wallet(self):
@@ -43,33 +51,63 @@ class Wallet:
     def xpub(self):
         return self.__master_key.PublicKey().ToExtended()
 
+    @property
+    def receive_keys(self) -> List[Key]:
+        return list(self.__receive_keys)
+
+    @property
+    def change_keys(self) -> List[Key]:
+        return list(self.__change_keys)
+
     @property
     def receive_addresses(self):
-        return self.__receive_keys.keys()
+        return [key.address for key in self.__receive_keys]
 
     @property
     def receive_addresses_and_balances(self):
-        return ((addr, key.balance) for addr, key in self.__receive_keys.items())
+        self.load_unspents()
+        return ((key.address, self.__index.balance(key.address)) for key in self.__receive_keys)
 
     @property
     def change_addresses(self):
-        return self.__change_keys.keys()
+        return [key.address for key in self.__change_keys]
 
     @property
     def change_addresses_and_balances(self):
-        return ((addr, key.balance) for addr, key in self.__change_keys.items())
+        self.load_unspents()
+        return ((key.address, self.__index.balance(key.address)) for key in self.__change_keys)
 
     @property
     def __all_keys(self):
-        return itertools.chain(self.__receive_keys.values(), self.__change_keys.values())
+        return itertools.chain(self.__receive_keys, self.__change_keys)
 
     @property
     def transactions(self):
-        return sum([key.transactions for key in self.__all_keys], [])
+        return list({tx.txid: tx for key in self.__all_keys for tx in key.transactions}.values())
+
+    def history(self, **filters) -> History:
+        """
+        The stored transactions newest first, see History for the filters
+        """
+        return History(self, **filters)
 
     @property
     def unspents(self):
-        return sum([key.unspents for key in self.__all_keys], [])
+        self.load_unspents()
+        return self.__index.unspents()
+
+    @property
+    def balance(self):
+        self.load_unspents()
+        return self.__index.total
+
+    def has_address(self, address: str) -> bool:
+        return self.__key_of(address) is not None
+
+    def __key_of(self, address: str):
+        if len(self.__keys_by_address) != len(self.__receive_keys) + len(self.__change_keys):
+            self.__keys_by_address = {key.address: key for key in self.__all_keys}
+        return self.__keys_by_address.get(address)
 
     @classmethod
     def from_xpub(cls, valid_xpub: str):
@@ -85,17 +123,209 @@ class Wallet:
 
     @classmethod
     def from_mnemonic(cls, valid_mnemonic_words: str, valid_passphrase: str, valid_path: str):
-        seed = MNEMO.to_seed(mnemonic=valid_mnemonic_words, passphrase=valid_passphrase)
+        seed = mnemonic_to_seed(valid_mnemonic_words, valid_passphrase)
         return cls.from_seed(seed, valid_path)
 
-    def refresh_transactions(self):
-        multithreading_execute([key.refresh_transactions for key in self.__all_keys])
+    def discover(self) -> int:
+        """
+        Extends both chains up to GAP_LIMIT addresses past the last used one, returns the number of used addresses
+        """
+        return self.__scan(lambda key: bool(NETWORK_API.get_transactions(key.address)))
+
+    async def async_discover(self, api) -> int:
+        async def is_used(key):
+            return bool(await api.get_transactions(key.address))
+        return await self.__async_scan(is_used)
+
+    def __scan(self, is_used) -> int:
+        return sum(self.__extend_chain(key_chain, scan_chain(list(key_chain), chain_key, is_used))
+                   for chain_key, key_chain in zip(self.__chain_keys, [self.__receive_keys, self.__change_keys]))
+
+    async def __async_scan(self, is_used) -> int:
+        used = 0
+        for chain_key, key_chain in zip(self.__chain_keys, [self.__receive_keys, self.__change_keys]):
+            used += self.__extend_chain(key_chain, await async_scan_chain(list(key_chain), chain_key, is_used))
+        return used
+
+    @staticmethod
+    def __extend_chain(key_chain, scanned) -> int:
+        used = 0
+        for index, (key, is_used) in enumerate(scanned):
+            if index == len(key_chain):
+                key_chain.append(key)
+            used += is_used
+        return used
+
+    def refresh_transactions(self, progress=None, full=False, fetch_history=Key.fetch_history):
+        """
+        Incremental by default: only history entries above each address' checkpoint are rewritten
+        and only transactions never seen before are fetched, full rebuilds the stored histories.
+        fetch_history(key) queries the history of one key, a WalletManager passes one shared by its wallets.
+        """
+        histories = {}
 
-    def refresh_unspents(self):
-        multithreading_execute([key.refresh_unspents for key in self.__all_keys])
+        def scan_history(key):
+            histories[key] = fetch_history(key)
+            return bool(histories[key])
+
+        self.__scan(scan_history)
+        TRX_STORE.sync_histories(
+            {key.address: entries for key, entries in histories.items()},
+            NETWORK_API.get_chain_height() - CONFIRMATION_DEPTH, full
+        )
+        txids_by_key = {key: TRX_STORE.history(key.address) for key in histories}
+        # txids shared between our own addresses are requested once
+        transactions = fetch_transactions(list(itertools.chain.from_iterable(txids_by_key.values())), progress)
+        for key, txids in txids_by_key.items():
+            key.update_transactions([transactions[txid] for txid in txids if txid in transactions])
+
+    async def async_refresh_transactions(self, api=None):
+        """
+        Asyncio counterpart of refresh_transactions, on the given AsyncWhatsOnChain or a session of its own
+        """
+        if api is None:
+            # imported here so that aiohttp is only loaded by the async API
+            from hdwallet.core.async_network import AsyncWhatsOnChain
+            async with AsyncWhatsOnChain() as api:
+                return await self.async_refresh_transactions(api)
+
+        histories = {}
+
+        async def fetch_history(key):
+            histories[key] = [(entry["tx_hash"], entry["height"]) for entry in await api.get_history(key.address)]
+            return bool(histories[key])
+
+        await self.__async_scan(fetch_history)
+        TRX_STORE.sync_histories(
+            {key.address: entries for key, entries in histories.items()},
+            await api.get_chain_height() - CONFIRMATION_DEPTH
+        )
+        txids_by_key = {key: TRX_STORE.history(key.address) for key in histories}
+        TRX_STORE.put_many((await api.get_transactions_bulk(
+            TRX_STORE.missing(itertools.chain.from_iterable(txids_by_key.values()))
+        )).values())
+        transactions = TRX_STORE.get_many(itertools.chain.from_iterable(txids_by_key.values()))
+        for key, txids in txids_by_key.items():
+            key.update_transactions([transactions[txid] for txid in txids if txid in transactions])
+
+    async def async_refresh_unspents(self, api=None):
+        """
+        Asyncio counterpart of refresh_unspents, on the given AsyncWhatsOnChain or a session of its own
+        """
+        if api is None:
+            from hdwallet.core.async_network import AsyncWhatsOnChain
+            async with AsyncWhatsOnChain() as api:
+                return await self.async_refresh_unspents(api)
+
+        fetched = await api.get_unspents_bulk([key.address for key in self.__all_keys])
+        USP_STORE.replace_many(fetched)
+        self.apply_unspents(fetched)
+
+    def load_unspents(self):
+        """
+        Index the stored unspents of every key not indexed yet, with one query for those not loaded yet
+        """
+        # chains only grow, the keys past the ones indexed by the previous call are the only candidates
+        key_chains = [self.__receive_keys, self.__change_keys]
+        counts = [len(key_chain) for key_chain in key_chains]
+        new_keys = [key for key_chain, indexed, count in zip(key_chains, self.__indexed, counts)
+                    for key in key_chain[indexed:count]]
+        if not new_keys:
+            return
+        keys = [key for key in new_keys if key.address not in self.__index]
+        if keys:
+            loaded = USP_STORE.load_many(key.address for key in keys if not key.has_unspents_loaded)
+            for key in keys:
+                self.__set_unspents(key, key.unspents if key.has_unspents_loaded else loaded.get(key.address, []))
+        self.__indexed = counts
+
+    def __set_unspents(self, key, unspents):
+        key.update_unspents(unspents)
+        return self.__index.replace(key.address, unspents)
+
+    def refresh_unspents(self, progress=None):
+        keys = list(self.__all_keys)
+        results = multithreading_execute([key.fetch_unspents for key in keys], progress)
+        fetched = {key.address: result.value for key, result in zip(keys, results) if result.ok}
+        USP_STORE.replace_many(fetched)
+        self.apply_unspents(fetched)
+
+    def apply_unspents(self, unspents_by_address: Dict[str, List[Unspent]]) -> Dict[str, Tuple[List[Unspent], List[Unspent]]]:
+        """
+        Take over freshly fetched unspents of any of the wallet's addresses, others are ignored.
+        Returns the (added, removed) unspents of the addresses that changed.
+        """
+        changes = {}
+        for address, unspents in unspents_by_address.items():
+            key = self.__key_of(address)
+            if key is not None:
+                added, removed = self.__set_unspents(key, unspents)
+                if added or removed:
+                    changes[address] = (added, removed)
+        return changes
+
+    def extend_past(self, address: str) -> List[Key]:
+        """
+        Derive keys until GAP_LIMIT of them follow the given, newly used, address on its chain, returns the new keys
+        """
+        for chain_key, key_chain in zip(self.__chain_keys, [self.__receive_keys, self.__change_keys]):
+            for index, key in enumerate(key_chain):
+                if key.address == address:
+                    new_keys = derive_keys(chain_key, len(key_chain), max(len(key_chain), index + 1 + GAP_LIMIT))
+                    key_chain.extend(new_keys)
+                    return new_keys
+        return []
 
     def simple_send(self, src, dst, amount) -> str:
-        if key := self.__receive_keys.get(src, self.__change_keys.get(src)):
-            return key.send([(dst, amount, 'satoshi')])
+        if key := self.__key_of(src):
+            txid = key.send([(dst, amount, 'satoshi')])
+            # send refreshed the source key's unspents or chained its change locally
+            self.__set_unspents(key, key.unspents)
+            return txid
         else:
             raise KeyError(f"No corresponding key found for address: {src}")
+
+    def send(self, outputs, fee=None, leftover=None) -> str:
+        """
+        Pays all outputs ``(destination, amount, currency)`` in one transaction whose inputs
+        are selected across every key of the wallet, each input signed by the key owning it.
+        The selection works on the wallet's current view of its unspents.
+        Change goes to leftover, by default the first unused change address.
+        Once broadcast, the spent inputs are dropped from that view and outputs paying the wallet are added
+        as unconfirmed unspents, until the next refresh reconciles the view with the network.
+
+        :returns: The transaction ID.
+        """
+        fee = fee or 1
+        self.load_unspents()
+        outputs = [(destination, currency_to_satoshi_cached(value, currency)) for destination, value, currency in outputs]
+        unspents, outputs = plan_payment(
+            self.__index.unspents(), outputs, fee, leftover or self.__unused_change_address()
+        )
+        inputs = [(self.__key_of(self.__index.owner((unspent.txid, unspent.txindex))), unspent) for unspent in unspents]
+        tx_hex = create_p2pkh_transaction(inputs, outputs)
+        NETWORK_API.broadcast_tx(tx_hex)
+        txid = calc_txid(tx_hex)
+        self.__apply_spend(txid, inputs, outputs)
+        return txid
+
+    def __apply_spend(self, txid, inputs, outputs):
+        spent = {(unspent.txid, unspent.txindex) for _, unspent in inputs}
+        destinations = {destination for destination, _ in outputs if isinstance(destination, str)}
+        created = chained_unspents(txid, outputs, set(filter(self.has_address, destinations)))
+        self.__paid.update(created)
+        for address in {key.address for key, _ in inputs} | created.keys():
+            key = self.__key_of(address)
+            self.__set_unspents(key, [
+                unspent for unspent in key.unspents if (unspent.txid, unspent.txindex) not in spent
+            ] + created.get(address, []))
+        USP_STORE.apply_spend(spent, created)
+
+    def __unused_change_address(self):
+        for key in self.__change_keys:
+            if key.address not in self.__paid and not key.transactions and not self.__index.balance(key.address):
+                return key.address
+        # every change address is used, a new one is derived rather than one reused
+        count = len(self.__change_keys)
+        self.__change_keys.extend(derive_keys(self.__chain_keys[1], count, count + 1))
+        return self.__change_keys[-1].address
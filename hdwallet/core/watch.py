@@ -0,0 +1,142 @@
+import heapq
+import random
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from bitsv.network.meta import Unspent
+
+from hdwallet.configs import WATCH_BATCH_SIZE, WATCH_FRESH_ADDRESSES, WATCH_MAX_INTERVAL, WATCH_MIN_INTERVAL
+from hdwallet.core.key import Key
+from hdwallet.core.network import NETWORK_API
+from hdwallet.storage.unspents import USP_STORE
+from hdwallet.utils import multithreading_execute
+
+
+class WatchEvent(NamedTuple):
+    address: str
+    previous_balance: int
+    balance: int
+    added: List[Unspent]
+    removed: List[Unspent]
+
+
+class Watcher:
+    """
+    Polls the unspents of a wallet's addresses, each address at its own interval. Addresses that changed and
+    the next unused ones of each chain are polled every min_interval seconds, the interval of any other address
+    doubles with every poll that finds nothing new, up to max_interval. A failed poll leaves the interval as it is
+    and is retried on its own, shorter schedule. Polls go through the executor and so share the global request
+    budget: when it is tight the most overdue addresses are polled first.
+    """
+
+    def __init__(self, wallet, on_change: Callable[[WatchEvent], None], min_interval: float = WATCH_MIN_INTERVAL,
+                 max_interval: float = WATCH_MAX_INTERVAL, fresh_addresses: int = WATCH_FRESH_ADDRESSES,
+                 batch_size: int = WATCH_BATCH_SIZE, clock: Callable[[], float] = time.monotonic):
+        self.__wallet = wallet
+        self.__on_change = on_change
+        self.__min_interval = min_interval
+        self.__max_interval = max_interval
+        self.__fresh_addresses = fresh_addresses
+        self.__batch_size = batch_size
+        self.__clock = clock
+        self.__keys: Dict[str, Key] = {}
+        self.__intervals: Dict[str, float] = {}
+        # failed polls in a row per address
+        self.__failures: Dict[str, int] = {}
+        # (due time, interval, address), a shorter interval wins between equally due addresses
+        self.__queue: List[Tuple[float, float, str]] = []
+        self.__used: Set[str] = set()
+        self.__fresh: Set[str] = set()
+        self.__stop = threading.Event()
+
+        # index the stored unspents, the first polls then report what changed since the last refresh
+        wallet.load_unspents()
+        now = clock()
+        for key in wallet.receive_keys + wallet.change_keys:
+            if key.balance or key.transactions:
+                self.__used.add(key.address)
+        self.__update_fresh()
+        for key in wallet.receive_keys + wallet.change_keys:
+            if key.address in self.__fresh or key.balance:
+                self.__schedule(key, now, min_interval)
+            else:
+                # dormant addresses are spread over the longest interval instead of all polled at once
+                self.__schedule(key, now + random.uniform(0, max_interval), max_interval)
+
+    @property
+    def scheduled(self) -> int:
+        return len(self.__queue)
+
+    def __schedule(self, key: Key, due: float, interval: float):
+        self.__keys[key.address] = key
+        self.__intervals[key.address] = interval
+        heapq.heappush(self.__queue, (due, interval, key.address))
+
+    def __update_fresh(self):
+        # the next unused addresses after the last used one of each chain are where payments arrive first
+        self.__fresh = set()
+        for keys in (self.__wallet.receive_keys, self.__wallet.change_keys):
+            last_used = max((index for index, key in enumerate(keys) if key.address in self.__used), default=-1)
+            self.__fresh.update(key.address for key in keys[last_used + 1:last_used + 1 + self.__fresh_addresses])
+
+    def poll_due(self) -> int:
+        """
+        Poll up to batch_size addresses that are due, most overdue first, and return how many were polled
+        """
+        now = self.__clock()
+        due = []
+        while self.__queue and self.__queue[0][0] <= now and len(due) < self.__batch_size:
+            due.append(self.__keys[heapq.heappop(self.__queue)[2]])
+        if not due:
+            return 0
+
+        results = multithreading_execute([lambda key=key: NETWORK_API.get_unspents(key.address) for key in due])
+        fetched = {key.address: result.value for key, result in zip(due, results) if result.ok}
+        previous_balances = {key.address: key.balance for key in due}
+        USP_STORE.replace_many(fetched)
+        changes = self.__wallet.apply_unspents(fetched)
+
+        now = self.__clock()
+        new_keys = []
+        for address, (added, removed) in changes.items():
+            self.__used.add(address)
+            new_keys.extend(self.__wallet.extend_past(address))
+            self.__on_change(WatchEvent(
+                address, previous_balances[address], self.__keys[address].balance, added, removed
+            ))
+        if changes:
+            self.__update_fresh()
+        for key in due:
+            if key.address not in fetched:
+                # a failed poll found nothing out, it is retried after min_interval doubling with every failure
+                # in a row, though never later than the address's own schedule
+                failures = self.__failures[key.address] = self.__failures.get(key.address, 0) + 1
+                interval = self.__intervals[key.address]
+                self.__schedule(key, now + min(self.__min_interval * 2 ** (failures - 1), interval), interval)
+                continue
+            self.__failures.pop(key.address, None)
+            if key.address in changes or key.address in self.__fresh:
+                interval = self.__min_interval
+            else:
+                interval = min(self.__intervals[key.address] * 2, self.__max_interval)
+            self.__schedule(key, now + interval, interval)
+        for key in new_keys:
+            self.__schedule(key, now, self.__min_interval)
+        return len(due)
+
+    def run(self, duration: Optional[float] = None):
+        """
+        Poll until stop() is called or duration seconds have passed
+        """
+        self.__stop.clear()
+        deadline = None if duration is None else self.__clock() + duration
+        while not self.__stop.is_set() and (deadline is None or self.__clock() < deadline):
+            if not self.poll_due():
+                wait = self.__queue[0][0] - self.__clock() if self.__queue else self.__min_interval
+                if deadline is not None:
+                    wait = min(wait, deadline - self.__clock())
+                self.__stop.wait(max(wait, 0))
+
+    def stop(self):
+        self.__stop.set()
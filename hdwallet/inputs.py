@@ -1,19 +1,11 @@
 from enum import Enum
 import re
 
-from hdwallet.bips.bip_0039.words import BIP39_WORDS_EN
+from hdwallet.bips.bip_0039.codec import is_valid_checksum
 
 
 def is_valid_mnemonic(string):
-    word_list = string.split()
-    if len(word_list) == 12 or len(word_list) == 24:
-        for word in word_list:
-            if word not in BIP39_WORDS_EN:
-                return False
-        else:
-            return True
-    else:
-        return False
+    return is_valid_checksum(string)
 
 
 class Inputs(Enum):
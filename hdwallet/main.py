@@ -1,7 +1,22 @@
+import sys
+
 from hdwallet.terminal import TerminalFSM as Machine
 
 
-def main():
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        # the commands are only set up when asked for, the interactive start stays fast
+        import argparse
+        from hdwallet import batch
+
+        parser = argparse.ArgumentParser(prog="hdwallet", description="HD wallet, interactive without arguments")
+        commands = parser.add_subparsers(dest="command", required=True)
+        batch.add_parser(commands)
+        batch.add_watch_parser(commands)
+        args = parser.parse_args(argv)
+        sys.exit(args.run(args))
+
     fsm = Machine()
     while fsm.current:
         fsm.run()
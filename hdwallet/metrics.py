@@ -0,0 +1,260 @@
+"""
+Counters, latency histograms and spans, exported through a pluggable exporter.
+
+Everything is off unless METRICS_EXPORTER names an exporter ("prometheus" or "jsonl"). When off, `timed`
+hands back the undecorated function and the other calls return immediately, so the instrumented code
+paths cost nothing worth measuring.
+"""
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Dict, List, Tuple
+
+from hdwallet.configs import METRICS_EXPORTER, METRICS_PATH
+
+
+ENABLED = bool(METRICS_EXPORTER)
+
+# seconds, wide enough for a single request as well as for a user sitting in a terminal state
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, float("inf"))
+
+DESCRIPTIONS = {
+    "hdwallet_network_request_seconds": "Latency of network API calls by method",
+    "hdwallet_network_errors_total": "Network API calls that raised, by method",
+    "hdwallet_cache_requests_total": "Cache lookups by cache and result (hit or miss)",
+    "hdwallet_derived_keys_total": "Keys handed out by derive_keys, by source (cache or derived)",
+    "hdwallet_derivation_seconds": "Time spent in derive_keys",
+    "hdwallet_terminal_state_seconds": "Time spent in each terminal state, user input included",
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self):
+        self.values: Dict[Labels, float] = {}
+
+    def add(self, labels: Labels, value: float):
+        self.values[labels] = self.values.get(labels, 0) + value
+
+    def samples(self, name: str):
+        for labels, value in self.values.items():
+            yield name, labels, value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self):
+        # labels -> [count per bucket, sum, count]
+        self.values: Dict[Labels, list] = {}
+
+    def add(self, labels: Labels, value: float):
+        if labels not in self.values:
+            self.values[labels] = [[0] * len(BUCKETS), 0.0, 0]
+        buckets, _, _ = entry = self.values[labels]
+        buckets[bisect_left(BUCKETS, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def samples(self, name: str):
+        for labels, (buckets, total, count) in self.values.items():
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS, buckets):
+                cumulative += bucket
+                yield f"{name}_bucket", labels + (("le", "+Inf" if bound == float("inf") else repr(bound)),), cumulative
+            yield f"{name}_sum", labels, total
+            yield f"{name}_count", labels, count
+
+
+class Registry:
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind, name: str, labels: Dict[str, str], value: float):
+        key = tuple(sorted((label, str(label_value)) for label, label_value in labels.items()))
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = kind()
+            self._metrics[name].add(key, value)
+
+    def collect(self) -> List[Tuple[str, str, list]]:
+        """
+        [(name, kind, [(sample name, labels, value)])] of everything recorded so far
+        """
+        with self._lock:
+            return [(name, metric.kind, list(metric.samples(name))) for name, metric in sorted(self._metrics.items())]
+
+
+REGISTRY = Registry()
+
+
+class Exporter:
+
+    def span(self, name: str, labels: Dict[str, str], start: float, seconds: float):
+        """
+        Called as every span ends, exporters of snapshots only ignore it
+        """
+
+    def export(self, registry: Registry):
+        raise NotImplementedError
+
+
+class PrometheusExporter(Exporter):
+    """
+    Rewrites METRICS_PATH (default metrics.prom) in the Prometheus text format,
+    for the node exporter's textfile collector
+    """
+
+    def __init__(self, path: str = METRICS_PATH or "metrics.prom"):
+        self._path = path
+
+    @staticmethod
+    def _format_labels(labels: Labels) -> str:
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{label}="{value}"' for label, value in labels) + "}"
+
+    def export(self, registry: Registry):
+        lines = []
+        for name, kind, samples in registry.collect():
+            lines.append(f"# HELP {name} {DESCRIPTIONS.get(name, name)}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{sample}{self._format_labels(labels)} {value}" for sample, labels, value in samples)
+        # written aside and renamed so that a scrape never sees half a file
+        with open(self._path + ".tmp", "w") as output:
+            output.write("\n".join(lines) + "\n")
+        os.replace(self._path + ".tmp", self._path)
+
+
+class JsonLinesExporter(Exporter):
+    """
+    Appends to METRICS_PATH (default metrics.jsonl) one line per finished span and one line per sample on export
+    """
+
+    def __init__(self, path: str = METRICS_PATH or "metrics.jsonl"):
+        self._path = path
+        self._lock = threading.Lock()
+
+    def _write(self, records):
+        with self._lock, open(self._path, "a") as output:
+            output.writelines(json.dumps(record) + "\n" for record in records)
+
+    def span(self, name: str, labels: Dict[str, str], start: float, seconds: float):
+        self._write([{"type": "span", "name": name, "labels": labels, "start": start, "seconds": seconds}])
+
+    def export(self, registry: Registry):
+        now = time.time()
+        self._write({"type": kind, "name": sample, "labels": dict(labels), "value": value, "time": now}
+                    for name, kind, samples in registry.collect() for sample, labels, value in samples)
+
+
+EXPORTERS = {
+    "prometheus": PrometheusExporter,
+    "jsonl": JsonLinesExporter,
+}
+
+if ENABLED and METRICS_EXPORTER not in EXPORTERS:
+    raise ValueError(f"unknown METRICS_EXPORTER {METRICS_EXPORTER!r}, expected one of {', '.join(EXPORTERS)}")
+
+EXPORTER: Exporter = EXPORTERS[METRICS_EXPORTER]() if ENABLED else None
+
+
+def count(name: str, value: float = 1, **labels):
+    if ENABLED:
+        REGISTRY.record(Counter, name, labels, value)
+
+
+def observe(name: str, value: float, **labels):
+    if ENABLED:
+        REGISTRY.record(Histogram, name, labels, value)
+
+
+@contextmanager
+def _span(name: str, **labels):
+    start, started = time.time(), time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        observe(name, seconds, **labels)
+        EXPORTER.span(name, labels, start, seconds)
+
+
+def span(name: str, **labels):
+    """
+    Context manager observing the time spent in its block into the histogram name
+    """
+    return _span(name, **labels) if ENABLED else nullcontext()
+
+
+# the histograms observing a call further up the stack (or up the task that spawned this one)
+_observing: ContextVar[frozenset] = ContextVar("observing", default=frozenset())
+
+
+def timed(name: str, errors: str = None, **labels):
+    """
+    Decorator observing the latency of every call into the histogram name and counting the calls that raise
+    into the counter errors, works for coroutine functions too. A call made from within another call observed
+    into the same histogram is left to the outer one, so that its time is not counted twice.
+    The function is returned as is when disabled.
+    """
+    def decorator(function):
+        if not ENABLED:
+            return function
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                observing = _observing.get()
+                if name in observing:
+                    return await function(*args, **kwargs)
+                token = _observing.set(observing | {name})
+                started = time.perf_counter()
+                try:
+                    return await function(*args, **kwargs)
+                except Exception:
+                    if errors:
+                        count(errors, **labels)
+                    raise
+                finally:
+                    _observing.reset(token)
+                    observe(name, time.perf_counter() - started, **labels)
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                observing = _observing.get()
+                if name in observing:
+                    return function(*args, **kwargs)
+                token = _observing.set(observing | {name})
+                started = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                except Exception:
+                    if errors:
+                        count(errors, **labels)
+                    raise
+                finally:
+                    _observing.reset(token)
+                    observe(name, time.perf_counter() - started, **labels)
+        return wrapper
+    return decorator
+
+
+def export():
+    if ENABLED:
+        EXPORTER.export(REGISTRY)
+
+
+atexit.register(export)
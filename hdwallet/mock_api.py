@@ -0,0 +1,312 @@
+"""
+A local stand-in for the WhatsOnChain endpoints the wallet uses, for load testing refresh and send offline.
+
+It serves fixtures from a JSON file, synthesized for the addresses of an xpub, or recorded from the live service,
+and injects latency, errors and rate limiting:
+
+    python -m hdwallet.mock_api --xpub xpub... --used 5000 --txs 2 --latency 50 --error-rate 0.01 --rate-limit 20
+    NETWORK_API_URL=http://127.0.0.1:8080/v1/bsv/main python hdwallet.py
+
+    python -m hdwallet.mock_api --record https://api.whatsonchain.com/v1/bsv/main --fixtures wallet.json
+
+GET /stats returns the number of requests served, failed on purpose and rate limited per endpoint.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from hdwallet.utils import TokenBucket
+
+
+SATOSHIS_PER_BSV = 100000000
+SYNTHETIC_HEIGHT = 800000
+# synthetic blocks are ten minutes apart from the genesis block time on
+GENESIS_TIME = 1231006505
+
+
+class Fixtures:
+    """
+    Chain data by address and txid in the WhatsOnChain response format, saved to and loaded from one JSON file.
+    With an upstream URL, lookups missing from the fixtures are fetched from it and kept.
+    """
+
+    KINDS = ("histories", "unspents", "transactions")
+
+    def __init__(self, height: int = SYNTHETIC_HEIGHT, upstream: Optional[str] = None):
+        self.height = height
+        self.histories: Dict[str, List[dict]] = {}
+        self.unspents: Dict[str, List[dict]] = {}
+        self.transactions: Dict[str, dict] = {}
+        self.blocks: Dict[str, dict] = {}
+        self._upstream = upstream.rstrip("/") if upstream else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, upstream: Optional[str] = None) -> "Fixtures":
+        fixtures = cls(upstream=upstream)
+        with open(path) as file:
+            data = json.load(file)
+        fixtures.height = data["height"]
+        for kind in cls.KINDS:
+            setattr(fixtures, kind, data[kind])
+        return fixtures
+
+    def save(self, path: str):
+        with self._lock, open(path, "w") as file:
+            json.dump({"height": self.height, **{kind: getattr(self, kind) for kind in self.KINDS}}, file)
+
+    def _fetch(self, path: str):
+        with urllib.request.urlopen(self._upstream + path, timeout=30) as response:
+            return json.load(response)
+
+    def _lookup(self, table: Dict, key: str, path: str, default):
+        if key in table or not self._upstream:
+            return table.get(key, default)
+        value = self._fetch(path)
+        with self._lock:
+            table[key] = value
+        return value
+
+    def history(self, address: str) -> List[dict]:
+        return self._lookup(self.histories, address, f"/address/{address}/history", [])
+
+    def unspent(self, address: str) -> List[dict]:
+        return self._lookup(self.unspents, address, f"/address/{address}/unspent", [])
+
+    def transaction(self, txid: str) -> Optional[dict]:
+        return self._lookup(self.transactions, txid, f"/tx/hash/{txid}", None)
+
+    def block(self, height: int) -> dict:
+        # block headers are not part of the fixtures, without upstream they are made up on the fly
+        if not self._upstream:
+            return {"height": height, "time": GENESIS_TIME + height * 600}
+        return self._lookup(self.blocks, str(height), f"/block/height/{height}", None)
+
+    def synthesize(self, addresses: List[str], txs_per_address: int):
+        """
+        Give every address txs_per_address transactions paying it one unspent output each
+        """
+        from bitsv.format import address_to_public_key_hash
+
+        for number, address in enumerate(addresses):
+            script = "76a914" + address_to_public_key_hash(address).hex() + "88ac"
+            for position in range(txs_per_address):
+                txid = hashlib.sha256(f"{address}:{position}".encode()).hexdigest()
+                height = self.height - (number * txs_per_address + position) % 1000
+                value = 1000 * (position + 1)
+                self.transactions[txid] = {
+                    "txid": txid,
+                    "vin": [{"txid": hashlib.sha256(txid.encode()).hexdigest(), "vout": 0}],
+                    "vout": [{"n": 0, "value": value / SATOSHIS_PER_BSV, "scriptPubKey": {"hex": script}}],
+                }
+                self.histories.setdefault(address, []).append({"tx_hash": txid, "height": height})
+                self.unspents.setdefault(address, []).append(
+                    {"height": height, "tx_pos": 0, "tx_hash": txid, "value": value}
+                )
+
+
+def xpub_addresses(xpub: str, used: int) -> List[str]:
+    """
+    The first `used` receive and change addresses of an account level xpub, as Wallet.from_xpub derives them
+    """
+    from bip_utils import Bip32Secp256k1
+
+    from hdwallet.core.derivation import derive_keys
+
+    account = Bip32Secp256k1.FromExtendedKey(xpub)
+    return [key.address for change in (0, 1) for key in derive_keys(account.ChildKey(change), 0, used)]
+
+
+class Faults:
+    """
+    What goes wrong on purpose: latency (seconds) plus up to jitter, a share of failing requests
+    and a rate limit answered with 429
+    """
+
+    def __init__(self, latency: float = 0, jitter: float = 0, error_rate: float = 0, rate_limit: float = 0,
+                 burst: float = 1):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.bucket = TokenBucket(rate_limit, max(burst, 1))
+
+    def apply(self) -> Optional[int]:
+        """
+        Sleep the latency and return the status code to fail the request with, if any
+        """
+        if not self.bucket.try_acquire():
+            return 429
+        time.sleep(self.latency + random.uniform(0, self.jitter))
+        if random.random() < self.error_rate:
+            return 503
+        return None
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fixtures: Fixtures = None
+    faults: Faults = None
+    stats: Dict[str, Dict[str, int]] = {}
+    stats_lock = threading.Lock()
+
+    ROUTES = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _count(self, endpoint: str, outcome: str):
+        with self.stats_lock:
+            counters = self.stats.setdefault(endpoint, {"served": 0, "failed": 0, "limited": 0})
+            counters[outcome] += 1
+
+    def _handle(self, method: str):
+        path = self.path.split("?")[0]
+        if method == "GET" and path.endswith("/stats"):
+            with self.stats_lock:
+                return self._send(200, self.stats)
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length)) if length else None
+        for route_method, pattern, endpoint, handler in self.ROUTES:
+            match = pattern.search(path)
+            if route_method == method and match:
+                break
+        else:
+            return self._send(404, {"error": "unknown endpoint"})
+        status = self.faults.apply()
+        if status:
+            self._count(endpoint, "limited" if status == 429 else "failed")
+            return self._send(status, {"error": "injected"})
+        try:
+            body = handler(self, *match.groups(), payload)
+        except OSError as e:
+            # the upstream of a recording failed, or does not know what was asked for either
+            self._count(endpoint, "failed")
+            return self._send(404 if getattr(e, "code", None) == 404 else 502, {"error": str(e)})
+        self._count(endpoint, "served")
+        if body is None:
+            # like the real API, an unknown transaction is not found rather than null
+            return self._send(404, {"error": "not found"})
+        self._send(200, body)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def chain_info(self, payload):
+        return {"blocks": self.fixtures.height}
+
+    def block(self, height, payload):
+        return self.fixtures.block(int(height))
+
+    def balance(self, address, payload):
+        confirmed = sum(utxo["value"] for utxo in self.fixtures.unspent(address) if utxo["height"] > 0)
+        unconfirmed = sum(utxo["value"] for utxo in self.fixtures.unspent(address) if utxo["height"] <= 0)
+        return {"confirmed": confirmed, "unconfirmed": unconfirmed}
+
+    def history(self, address, payload):
+        return self.fixtures.history(address)
+
+    def unspent(self, address, payload):
+        return self.fixtures.unspent(address)
+
+    def transaction(self, txid, payload):
+        return self.fixtures.transaction(txid)
+
+    def transactions_bulk(self, payload):
+        return [self.fixtures.transaction(txid) or {"txid": txid, "error": "unknown"} for txid in payload["txids"]]
+
+    def unspents_bulk(self, payload):
+        return [{"address": address, "unspent": self.fixtures.unspent(address), "error": ""}
+                for address in payload["addresses"]]
+
+    def broadcast(self, payload):
+        # accepted and answered with its txid, the fixtures are left as they are
+        return hashlib.sha256(hashlib.sha256(bytes.fromhex(payload["txhex"])).digest()).digest()[::-1].hex()
+
+
+# matched against the end of the path so that any base path (/v1/bsv/main, /v1/bsv/test, ...) works
+MockHandler.ROUTES = [
+    ("GET", re.compile(r"/chain/info$"), "chain_info", MockHandler.chain_info),
+    ("GET", re.compile(r"/block/height/(\d+)$"), "block", MockHandler.block),
+    ("GET", re.compile(r"/address/(\w+)/balance$"), "balance", MockHandler.balance),
+    ("GET", re.compile(r"/address/(\w+)/history$"), "history", MockHandler.history),
+    ("GET", re.compile(r"/address/(\w+)/unspent$"), "unspent", MockHandler.unspent),
+    ("GET", re.compile(r"/tx/hash/(\w+)$"), "transaction", MockHandler.transaction),
+    ("POST", re.compile(r"/txs$"), "transactions_bulk", MockHandler.transactions_bulk),
+    ("POST", re.compile(r"/addresses/unspent$"), "unspents_bulk", MockHandler.unspents_bulk),
+    ("POST", re.compile(r"/tx/raw$"), "broadcast", MockHandler.broadcast),
+]
+
+
+def serve(fixtures: Fixtures, faults: Faults, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+    """
+    Start serving in a daemon thread and return the server, port 0 picks a free port
+    """
+    handler = type("Handler", (MockHandler,), {"fixtures": fixtures, "faults": faults, "stats": {}})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="local stand-in for the WhatsOnChain API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixtures", help="JSON fixtures to serve, written back on exit when recording")
+    parser.add_argument("--record", metavar="URL", help="fetch what the fixtures miss from this API and keep it")
+    parser.add_argument("--xpub", help="synthesize fixtures for the addresses of this account xpub")
+    parser.add_argument("--used", type=int, default=100, help="used addresses per chain of the xpub")
+    parser.add_argument("--txs", type=int, default=1, help="transactions (and unspents) per used address")
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0, help="up to this many more milliseconds, at random")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of requests answered with 503")
+    parser.add_argument("--rate-limit", type=float, default=0, help="requests per second before 429, 0 is unlimited")
+    parser.add_argument("--burst", type=float, default=1, help="requests allowed at once by the rate limit")
+    args = parser.parse_args(argv)
+
+    if args.fixtures and os.path.exists(args.fixtures):
+        # a recording goes on where the previous one stopped
+        fixtures = Fixtures.load(args.fixtures, upstream=args.record)
+    else:
+        fixtures = Fixtures(upstream=args.record)
+        if args.record:
+            fixtures.height = fixtures._fetch("/chain/info")["blocks"]
+    if args.xpub:
+        fixtures.synthesize(xpub_addresses(args.xpub, args.used), args.txs)
+
+    faults = Faults(args.latency / 1000, args.jitter / 1000, args.error_rate, args.rate_limit, args.burst)
+    server = serve(fixtures, faults, args.host, args.port)
+    print(f"Serving {len(fixtures.histories)} addresses and {len(fixtures.transactions)} transactions, "
+          f"point the wallet at it with NETWORK_API_URL=http://{args.host}:{server.server_port}/v1/bsv/main")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        if args.record and args.fixtures:
+            fixtures.save(args.fixtures)
+            print(f"Recorded fixtures saved to {args.fixtures}")
+
+
+if __name__ == "__main__":
+    main()
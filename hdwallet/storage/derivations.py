@@ -0,0 +1,134 @@
+import hashlib
+import hmac
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, List, Tuple
+
+from bip_utils import Bip32Secp256k1
+
+from hdwallet.configs import DRV_CACHE_DIR
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: writers of other processes are not kept apart, a record they garble fails its MAC and is rewritten
+    fcntl = None
+
+
+PUB_KEY_SIZE = 33
+ADDRESS_SIZE = 34
+MAC_SIZE = 16
+RECORD_SIZE = PUB_KEY_SIZE + ADDRESS_SIZE + MAC_SIZE
+
+
+def key_fingerprint(key: Bip32Secp256k1) -> str:
+    # the serialized xpub commits to depth, parent fingerprint, child index, chain code and public key,
+    # so it identifies the key together with its derivation path, for private and watch-only wallets alike
+    return hashlib.sha256(key.PublicKey().ToExtended().encode()).hexdigest()
+
+
+@contextmanager
+def _exclusive(file: BinaryIO):
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class DerivationCache:
+    """
+    Append-only file of fixed size (compressed public key, address, MAC) records of one chain key,
+    record i holds child i and the file is memory-mapped for reading.
+    Every record carries an HMAC of its index and content keyed by the chain code, a record failing it is
+    served as missing and overwritten once derived again. Private key material is never written.
+    """
+
+    def __init__(self, path: str, mac_key: bytes):
+        self._path = path
+        self._mac_key = mac_key
+        self._lock = threading.Lock()
+        self._map = None
+        self._count = 0
+        self._remap()
+
+    def __len__(self):
+        return self._count
+
+    def _mac(self, index: int, content: bytes) -> bytes:
+        return hmac.new(self._mac_key, index.to_bytes(4, "big") + content, hashlib.sha256).digest()[:MAC_SIZE]
+
+    def _is_valid(self, index: int, record: bytes) -> bool:
+        return hmac.compare_digest(record[-MAC_SIZE:], self._mac(index, record[:-MAC_SIZE]))
+
+    def records(self, start: int, stop: int) -> List[Tuple[bytes, str]]:
+        """
+        The records from start on up to stop, or up to the first one missing or failing its MAC
+        """
+        records = []
+        # extend remaps the file, the map is only read under the lock
+        with self._lock:
+            for index in range(start, min(stop, self._count)):
+                record = self._map[index * RECORD_SIZE:(index + 1) * RECORD_SIZE]
+                if not self._is_valid(index, record):
+                    break
+                records.append((record[:PUB_KEY_SIZE], record[PUB_KEY_SIZE:-MAC_SIZE].rstrip(b"\0").decode()))
+        return records
+
+    def _encode(self, index: int, pub_key: bytes, address: str) -> bytes:
+        content = pub_key + address.encode().ljust(ADDRESS_SIZE, b"\0")
+        return content + self._mac(index, content)
+
+    def extend(self, start: int, records: List[Tuple[bytes, str]]):
+        with self._lock:
+            with os.fdopen(os.open(self._path, os.O_RDWR | os.O_CREAT), "r+b") as cache, _exclusive(cache):
+                # another process may have written meanwhile, write from the first record missing or failing its MAC
+                count = os.fstat(cache.fileno()).st_size // RECORD_SIZE
+                if start > count:
+                    return
+                first = start
+                cache.seek(start * RECORD_SIZE)
+                while first < min(count, start + len(records)) and self._is_valid(first, cache.read(RECORD_SIZE)):
+                    first += 1
+                if first < start + len(records):
+                    cache.seek(first * RECORD_SIZE)
+                    cache.write(b"".join(
+                        self._encode(index, *record) for index, record in enumerate(records[first - start:], first)
+                    ))
+                    # a partial record left at the end by an interrupted write is cut off
+                    if start + len(records) >= count:
+                        cache.truncate()
+            self._remap()
+
+    def _remap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._count = 0
+        try:
+            with open(self._path, "rb") as cache:
+                size = os.fstat(cache.fileno()).st_size
+                if size >= RECORD_SIZE:
+                    self._map = mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._count = size // RECORD_SIZE
+        except FileNotFoundError:
+            pass
+
+
+_caches: Dict[str, DerivationCache] = {}
+_caches_lock = threading.Lock()
+
+
+def open_derivation_cache(chain_key: Bip32Secp256k1) -> DerivationCache:
+    os.makedirs(DRV_CACHE_DIR, exist_ok=True)
+    path = os.path.join(DRV_CACHE_DIR, key_fingerprint(chain_key))
+    with _caches_lock:
+        if path not in _caches:
+            # the chain code is only known to holders of the key, the cache cannot be forged without it
+            _caches[path] = DerivationCache(path, chain_key.ChainCode().ToBytes())
+        return _caches[path]
@@ -0,0 +1,36 @@
+import os
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+
+class SQLiteStore:
+    """
+    A lazily opened SQLite database shared by all threads, SCHEMA is executed on first use.
+    MIGRATIONS are scripts run once each before it, the database's user_version counts the ones already run
+    """
+
+    SCHEMA = ""
+    MIGRATIONS: Tuple[str, ...] = ()
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if os.path.dirname(self._path):
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version < len(self.MIGRATIONS):
+                connection.executescript(
+                    "BEGIN IMMEDIATE;" + "".join(self.MIGRATIONS[version:]) +
+                    f"PRAGMA user_version = {len(self.MIGRATIONS)}; COMMIT;"
+                )
+            connection.executescript(self.SCHEMA)
+            self._connection = connection
+        return self._connection
@@ -0,0 +1,152 @@
+import json
+from typing import Dict, Iterable, List, Tuple
+
+from bitsv.network.transaction import Transaction, TxInput, TxOutput
+
+from hdwallet import metrics
+from hdwallet.configs import TRX_CACHE_PATH
+from hdwallet.storage.sqlite import SQLiteStore
+
+
+def _encode(transaction: Transaction) -> str:
+    return json.dumps([
+        [[tx_in.txid, tx_in.index] for tx_in in transaction.inputs],
+        [[tx_out.scriptpubkey, tx_out.amount] for tx_out in transaction.outputs],
+    ], separators=(",", ":"))
+
+
+def _decode(txid: str, data: str) -> Transaction:
+    inputs, outputs = json.loads(data)
+    return Transaction(txid, [TxInput(*tx_in) for tx_in in inputs], [TxOutput(*tx_out) for tx_out in outputs])
+
+
+class TransactionStore(SQLiteStore):
+    """
+    Content-addressed transaction cache shared by all keys and wallets:
+    every transaction is stored once under its txid as JSON inputs and outputs, addresses only reference txids.
+    Each address also keeps a checkpoint, the block height up to which its history is considered settled
+    """
+
+    MIGRATIONS = (
+        # the txid lists of the first store version, superseded by address_history
+        "DROP TABLE IF EXISTS histories;",
+        # transactions were pickled, a tampered cache could run code on load; they are fetched again as JSON
+        "DROP TABLE IF EXISTS transactions;",
+    )
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS transactions (
+            txid TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS address_history (
+            address TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            txid TEXT NOT NULL,
+            height INTEGER NOT NULL,
+            PRIMARY KEY (address, txid)
+        );
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            address TEXT PRIMARY KEY,
+            height INTEGER NOT NULL
+        );
+    """
+
+    def get_many(self, txids: Iterable[str]) -> Dict[str, Transaction]:
+        txids = list(txids)
+        transactions = {}
+        with self._lock:
+            # chunked to stay below SQLite's host parameter limit
+            for first in range(0, len(txids), 500):
+                chunk = txids[first:first + 500]
+                rows = self._db.execute(
+                    f"SELECT txid, data FROM transactions WHERE txid IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                transactions.update((txid, _decode(txid, data)) for txid, data in rows)
+        return transactions
+
+    def missing(self, txids: Iterable[str]) -> List[str]:
+        txids = list(dict.fromkeys(txids))
+        known = set()
+        with self._lock:
+            for first in range(0, len(txids), 500):
+                chunk = txids[first:first + 500]
+                known.update(row[0] for row in self._db.execute(
+                    f"SELECT txid FROM transactions WHERE txid IN ({','.join('?' * len(chunk))})", chunk
+                ))
+        metrics.count("hdwallet_cache_requests_total", len(known), cache="transactions", result="hit")
+        metrics.count("hdwallet_cache_requests_total", len(txids) - len(known), cache="transactions", result="miss")
+        return [txid for txid in txids if txid not in known]
+
+    def put_many(self, transactions: Iterable[Transaction]):
+        with self._lock, self._db as db:
+            db.executemany(
+                "INSERT OR IGNORE INTO transactions VALUES (?, ?)",
+                ((tx.txid, _encode(tx)) for tx in transactions)
+            )
+
+    def history(self, address: str) -> List[str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT txid FROM address_history WHERE address = ? ORDER BY position", (address,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def history_entries(self, address: str) -> List[Tuple[str, int]]:
+        """
+        The (txid, height) history entries of an address, unconfirmed first, then from the highest block down
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT txid, height FROM address_history WHERE address = ? "
+                "ORDER BY height <= 0 DESC, height DESC, txid", (address,)
+            ).fetchall()
+
+    def confirmed_heights(self, txids: Iterable[str]) -> Dict[str, int]:
+        """
+        The block height of those of txids that a stored history of any address lists as confirmed
+        """
+        txids = list(txids)
+        heights = {}
+        with self._lock:
+            for first in range(0, len(txids), 500):
+                chunk = txids[first:first + 500]
+                heights.update(self._db.execute(
+                    f"SELECT txid, MAX(height) FROM address_history WHERE height > 0 "
+                    f"AND txid IN ({','.join('?' * len(chunk))}) GROUP BY txid", chunk
+                ).fetchall())
+        return heights
+
+    def checkpoint(self, address: str) -> int:
+        with self._lock:
+            row = self._db.execute("SELECT height FROM checkpoints WHERE address = ?", (address,)).fetchone()
+        return row[0] if row else -1
+
+    def sync_histories(self, entries_by_address: Dict[str, List[Tuple[str, int]]], settled_height: int, full=False):
+        """
+        Merge freshly listed (txid, height) history entries, unconfirmed entries have a height <= 0.
+        Entries at or below an address' checkpoint are settled and left untouched, only the ones above it
+        and unconfirmed ones are (re)written, after which the checkpoint advances to settled_height.
+        With full the stored history of the addresses is rebuilt from scratch.
+        """
+        with self._lock, self._db as db:
+            for address, entries in entries_by_address.items():
+                row = None if full else db.execute(
+                    "SELECT height FROM checkpoints WHERE address = ?", (address,)
+                ).fetchone()
+                checkpoint = row[0] if row else -1
+                db.execute(
+                    "DELETE FROM address_history WHERE address = ? AND (height <= 0 OR height > ?)",
+                    (address, checkpoint)
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO address_history VALUES (?, ?, ?, ?)",
+                    ((address, position, txid, height) for position, (txid, height) in enumerate(entries)
+                     if height <= 0 or height > checkpoint)
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)", (address, max(checkpoint, settled_height))
+                )
+
+
+TRX_STORE = TransactionStore(TRX_CACHE_PATH)
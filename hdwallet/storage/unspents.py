@@ -0,0 +1,96 @@
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bitsv.network.meta import Unspent
+
+from hdwallet import metrics
+from hdwallet.configs import USP_CACHE_PATH
+from hdwallet.storage.sqlite import SQLiteStore
+
+
+class UnspentStore(SQLiteStore):
+    """
+    One SQLite database holding the unspents of every address of every wallet,
+    each address carries the time its unspents were last refreshed
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS unspents (
+            address TEXT NOT NULL,
+            txid TEXT NOT NULL,
+            txindex INTEGER NOT NULL,
+            amount INTEGER NOT NULL,
+            confirmations INTEGER NOT NULL,
+            PRIMARY KEY (txid, txindex)
+        );
+        CREATE INDEX IF NOT EXISTS unspents_address ON unspents (address);
+        CREATE TABLE IF NOT EXISTS refreshes (
+            address TEXT PRIMARY KEY,
+            refreshed_at REAL NOT NULL
+        );
+    """
+
+    def load(self, address: str) -> List[Unspent]:
+        return self.load_many([address]).get(address, [])
+
+    def load_many(self, addresses: Iterable[str]) -> Dict[str, List[Unspent]]:
+        with self._lock:
+            db = self._db
+            db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (address TEXT PRIMARY KEY)")
+            db.execute("DELETE FROM wanted")
+            db.executemany("INSERT OR IGNORE INTO wanted VALUES (?)", ((address,) for address in addresses))
+            rows = db.execute(
+                "SELECT address, amount, confirmations, txid, txindex FROM unspents "
+                "WHERE address IN (SELECT address FROM wanted)"
+            ).fetchall()
+            if metrics.ENABLED:
+                # an address never refreshed is a miss, one refreshed without unspents is still a hit
+                wanted, hits = db.execute(
+                    "SELECT COUNT(*), COUNT(refreshes.address) FROM wanted LEFT JOIN refreshes USING (address)"
+                ).fetchone()
+                metrics.count("hdwallet_cache_requests_total", hits, cache="unspents", result="hit")
+                metrics.count("hdwallet_cache_requests_total", wanted - hits, cache="unspents", result="miss")
+            db.execute("DELETE FROM wanted")
+            db.commit()
+        unspents = {}
+        for address, amount, confirmations, txid, txindex in rows:
+            unspents.setdefault(address, []).append(Unspent(amount, confirmations, txid, txindex))
+        return unspents
+
+    def refreshed_at(self, address: str) -> Optional[float]:
+        with self._lock:
+            row = self._db.execute("SELECT refreshed_at FROM refreshes WHERE address = ?", (address,)).fetchone()
+        return row[0] if row else None
+
+    def replace_many(self, unspents_by_address: Dict[str, List[Unspent]], refreshed_at: Optional[float] = None):
+        """
+        Replace the unspents of all given addresses in a single transaction
+        """
+        refreshed_at = time.time() if refreshed_at is None else refreshed_at
+        with self._lock, self._db as db:
+            db.executemany("DELETE FROM unspents WHERE address = ?", ((address,) for address in unspents_by_address))
+            db.executemany(
+                "INSERT OR REPLACE INTO unspents VALUES (?, ?, ?, ?, ?)",
+                ((address, usp.txid, usp.txindex, usp.amount, usp.confirmations)
+                 for address, unspents in unspents_by_address.items() for usp in unspents)
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO refreshes VALUES (?, ?)",
+                ((address, refreshed_at) for address in unspents_by_address)
+            )
+
+    def apply_spend(self, spent: Iterable[Tuple[str, int]], created: Dict[str, List[Unspent]]):
+        """
+        Remove the outpoints spent by a broadcast transaction and add its outputs paying known addresses,
+        the refresh times are left alone so that the next refresh still reconciles with the network
+        """
+        with self._lock, self._db as db:
+            db.executemany("DELETE FROM unspents WHERE txid = ? AND txindex = ?", spent)
+            db.executemany(
+                "INSERT OR REPLACE INTO unspents VALUES (?, ?, ?, ?, ?)",
+                ((address, usp.txid, usp.txindex, usp.amount, usp.confirmations)
+                 for address, unspents in created.items() for usp in unspents)
+            )
+
+
+USP_STORE = UnspentStore(USP_CACHE_PATH)
@@ -1,8 +1,14 @@
-from typing import Union
-from bitsv.exceptions import InsufficientFunds
+import itertools
+from typing import TYPE_CHECKING, Union
 
-from hdwallet.core.wallet import Wallet
+from hdwallet import metrics
+from hdwallet.bips.bip_0039.codec import mnemonic_to_seed
+from hdwallet.configs import DISCOVERY_PATHS, HISTORY_PAGE_SIZE
 from hdwallet.inputs import Inputs
+from hdwallet.utils import print_progress
+
+if TYPE_CHECKING:
+    from hdwallet.core.wallet import Wallet
 
 
 def check_wallet_type(method):
@@ -18,18 +24,24 @@ def check_wallet_type(method):
 class TerminalFSM:
     """
     The interaction program (Finite State Machine) between User and Wallet in terminal
+
+    The wallet modules pull in bip_utils, bitsv and coincurve, they are imported by the states that need them
+    so the start menu shows up without paying for them
     """
 
     def __init__(self):
         self._current = self._start
-        self._wallet: Union[Wallet, None] = None
+        self._wallet: Union["Wallet", None] = None
 
     @property
     def current(self):
         return self._current
 
     def run(self):
-        self._current()
+        with metrics.span("hdwallet_terminal_state_seconds", state=self._current.__name__.lstrip("_")):
+            self._current()
+        # keeps the exported metrics current during a long interactive session
+        metrics.export()
 
     def _start(self):
         self._wallet = None
@@ -39,6 +51,8 @@ class TerminalFSM:
             "Enter 2 to generate wallet from a seed (in hex format)\n"
             "Enter 3 to generate wallet from extended private key\n"
             "Enter 4 to generate wallet from extended public key (create a watch wallet)\n"
+            "Enter 5 to recover wallet from mnemonic by searching the common derivation paths\n"
+            "Enter 6 to recover a mnemonic with missing or mistyped words\n"
             "Enter 0 to exit"
         )
         choices = {
@@ -46,6 +60,8 @@ class TerminalFSM:
             '2': self._from_seed,
             '3': self._from_xprv,
             '4': self._from_xpub,
+            '5': self._discover_from_mnemonic,
+            '6': self._recover_mnemonic,
             '0': None
         }
         choice = self.__ask_for(
@@ -61,6 +77,7 @@ class TerminalFSM:
         )
         valid_passphrase = self.__ask_for("Please input your passphrase: \n")
         valid_path = self.__ask_for_path()
+        from hdwallet.core.wallet import Wallet
         self._wallet = Wallet.from_mnemonic(valid_mnemonic_words, valid_passphrase, valid_path)
         print("Wallet Created! ")
         self._current = self._main_menu
@@ -72,6 +89,7 @@ class TerminalFSM:
             criterion=Inputs.SEED.criterion
         )
         valid_path = self.__ask_for_path()
+        from hdwallet.core.wallet import Wallet
         self._wallet = Wallet.from_seed(bytes.fromhex(valid_seed), valid_path)
         print("Wallet Created! ")
         self._current = self._main_menu
@@ -82,6 +100,7 @@ class TerminalFSM:
             error_message="Invalid xprv, please input again: \n",
             criterion=Inputs.XPRV.criterion
         )
+        from hdwallet.core.wallet import Wallet
         self._wallet = Wallet.from_xprv(valid_xprv)
         print("Wallet Created! ")
         self._current = self._main_menu
@@ -92,10 +111,76 @@ class TerminalFSM:
             error_message="Invalid xpub, please input again: \n",
             criterion=Inputs.XPUB.criterion
         )
+        from hdwallet.core.wallet import Wallet
         self._wallet = Wallet.from_xpub(valid_xpub)
         print("Wallet Created! ")
         self._current = self._main_menu
 
+    def _discover_from_mnemonic(self):
+        valid_mnemonic_words = self.__ask_for(
+            query_message="Please input your BIP39 mnemonic words: \n",
+            error_message="Invalid word list, please input again: \n",
+            criterion=Inputs.MNEMONIC.criterion
+        )
+        valid_passphrase = self.__ask_for("Please input your passphrase: \n")
+        from hdwallet.core.accounts import discover_accounts
+        from hdwallet.core.wallet import Wallet
+        seed = mnemonic_to_seed(valid_mnemonic_words, valid_passphrase)
+        print("Searching accounts on: ", ", ".join(DISCOVERY_PATHS))
+        try:
+            reports = discover_accounts(seed)
+        except Exception as e:
+            print(f"Account search failed: {e!r} ")
+            self._current = self._start
+            return
+        for report in reports:
+            if report.error is not None:
+                print(f"Searching {report.path} failed, it and the accounts after it are unknown: {report.error!r} ")
+        reports = [report for report in reports if report.error is None]
+        if not reports:
+            print("No used account found. ")
+            self._current = self._start
+            return
+        for i, report in enumerate(reports, 1):
+            print(f"{i}: {report.path} with {report.used_addresses} used addresses and balance {report.balance}")
+        choice = self.__ask_for(
+            query_message="Enter the number of the account to open or 0 to go back: \n",
+            error_message="Invalid choice, please input again: \n",
+            criterion=lambda c: c.isdigit() and int(c) <= len(reports)
+        )
+        if choice == "0":
+            self._current = self._start
+        else:
+            self._wallet = Wallet.from_seed(seed, reports[int(choice) - 1].path)
+            print("Wallet Created! ")
+            self._current = self._main_menu
+
+    def _recover_mnemonic(self):
+        print("Type ? for each forgotten word and add ? to any word you are unsure of, mistyped words are corrected, "
+              "a phrase one word short is tried with the word missing at every position. ")
+        phrase = self.__ask_for("Please input your BIP39 mnemonic words: \n")
+        passphrase = self.__ask_for("Please input your passphrase: \n")
+        target = self.__ask_for(
+            "Please input an address of the wallet, or press Enter to look for on-chain activity instead: \n"
+        )
+        from hdwallet.core.recovery import RecoveryIncomplete, recover_mnemonic
+        from hdwallet.core.wallet import Wallet
+        try:
+            found = recover_mnemonic(phrase, passphrase, [target] if target else (), progress=print_progress)
+        except (ValueError, RecoveryIncomplete) as e:
+            print(e)
+            self._current = self._start
+            return
+        if found is None:
+            print("No candidate mnemonic matched. ")
+            self._current = self._start
+            return
+        print(f"\nRecovered mnemonic: {found.mnemonic}")
+        print(f"Found {found.address} on {found.path}")
+        self._wallet = Wallet.from_mnemonic(found.mnemonic, passphrase, found.path)
+        print("Wallet Created! ")
+        self._current = self._main_menu
+
     def _main_menu(self):
         print("Enter 0 to go back")
         print("Enter 1 to get xprv")
@@ -103,10 +188,11 @@ class TerminalFSM:
         print("Enter 3 to get transactions")
         print("Enter 4 to get unspent transactions")
         print("Enter 5 to get addresses and balances")
-        print("Enter 6 to refresh transactions")
+        print("Enter 6 to refresh transactions and discover used addresses")
         print("Enter 7 to refresh unspent transactions")
         print("Enter 8 for simple payment")
         print("Enter 9 for combination payment")
+        print("Enter 10 to watch for balance changes")
         choices = {
             "0": self._start,
             "1": self._get_xprv,
@@ -117,7 +203,8 @@ class TerminalFSM:
             "6": self._refresh_transactions,
             "7": self._refresh_unspents,
             "8": self._simple_pay,
-            "9": self._combination_pay
+            "9": self._combination_pay,
+            "10": self._watch
         }
         choice = self.__ask_for(
             error_message="Invalid choice, please input again: \n",
@@ -144,11 +231,18 @@ class TerminalFSM:
         print("Change addresses: ")
         for address, balance in self._wallet.change_addresses_and_balances:
             print(address, balance)
+        print("Total balance: ", self._wallet.balance)
         self.__press_any_key_to_return_to_main()
 
     def _get_transactions(self):
-        for tx in self._wallet.transactions:
-            print(tx)
+        # newest first, a page at a time instead of the whole history at once
+        entries = iter(self._wallet.history())
+        while page := list(itertools.islice(entries, HISTORY_PAGE_SIZE)):
+            for entry in page:
+                height = entry.height if entry.height > 0 else "unconfirmed"
+                print(f"{height:>11}  {entry.txid}  {entry.amount:+} satoshi")
+            if len(page) < HISTORY_PAGE_SIZE or input("Press Enter for more, or 0 to stop: ") == "0":
+                break
         self.__press_any_key_to_return_to_main()
 
     def _get_unspents(self):
@@ -157,23 +251,33 @@ class TerminalFSM:
         self.__press_any_key_to_return_to_main()
 
     def _refresh_transactions(self):
-        self._wallet.refresh_transactions()
-        print("Transactions refreshed. ")
+        from requests import RequestException
+        try:
+            self._wallet.refresh_transactions(progress=print_progress)
+            print("Transactions refreshed. ")
+        except (RequestException, OSError) as e:
+            print(f"Refreshing transactions failed: {e!r} ")
         self.__press_any_key_to_return_to_main()
 
     def _refresh_unspents(self):
-        self._wallet.refresh_unspents()
-        print("Unspents refreshed. ")
+        from requests import RequestException
+        try:
+            self._wallet.refresh_unspents(progress=print_progress)
+            print("Unspents refreshed. ")
+        except (RequestException, OSError) as e:
+            print(f"Refreshing unspents failed: {e!r} ")
         self.__press_any_key_to_return_to_main()
 
     @check_wallet_type
     def _simple_pay(self):
+        from bitsv.exceptions import InsufficientFunds
+        from requests import RequestException
         while True:
             dst_addr = self.__ask_for("Please input the destination address: \n")
             src_addr = self.__ask_for(
                 query_message="Please input your source address: \n",
                 error_message="This is not one of your address, please input again: \n",
-                criterion=lambda s: s in self._wallet.receive_addresses or s in self._wallet.change_addresses
+                criterion=self._wallet.has_address
             )
             amount = self.__ask_for(
                 "Please input the amount to send (Satoshi): \n",
@@ -196,10 +300,49 @@ class TerminalFSM:
                 if solution == "0":
                     self._current = self._main_menu
                     break
+            except (RequestException, OSError) as e:
+                print(f"Payment failed: {e!r} ")
+                self.__press_any_key_to_return_to_main()
+                break
 
     @check_wallet_type
     def _combination_pay(self):
-        print("combination payment is not implemented yet")
+        from bitsv.exceptions import InsufficientFunds
+        from requests import RequestException
+        print("Inputs are selected from all your addresses using the cached unspents, "
+              "refresh them first if they may be outdated. ")
+        outputs = []
+        while dst_addr := self.__ask_for("Please input a destination address (empty to finish): \n"):
+            amount = self.__ask_for(
+                "Please input the amount to send (Satoshi): \n",
+                "Amount should be a positive integer. Please input again: \n",
+                criterion=Inputs.AMOUNT.criterion,
+            )
+            outputs.append((dst_addr, int(amount), 'satoshi'))
+        if outputs:
+            try:
+                txid = self._wallet.send(outputs)
+                print(f"Successfully sent {sum(output[1] for output in outputs)} satoshi to {len(outputs)} outputs,\n"
+                      f"transaction id is: {txid}")
+            except InsufficientFunds as e:
+                print(e)
+            except (RequestException, OSError) as e:
+                print(f"Payment failed: {e!r} ")
+        self.__press_any_key_to_return_to_main()
+
+    def _watch(self):
+        from hdwallet.core.watch import Watcher
+
+        def print_change(event):
+            print(f"{event.address}: {event.previous_balance} -> {event.balance} satoshi "
+                  f"({len(event.added)} unspents received, {len(event.removed)} spent)")
+
+        watcher = Watcher(self._wallet, print_change)
+        print(f"Watching {watcher.scheduled} addresses, press Ctrl+C to stop. ")
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            print()
         self.__press_any_key_to_return_to_main()
 
     @staticmethod
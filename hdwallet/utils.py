@@ -1,11 +1,153 @@
+import random
+import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional
 
+from hdwallet.configs import PROCESS_WORKERS, RATE_BURST, RATE_LIMIT, RETRY_BACKOFF, TASK_RETRIES, WORKER_THREADS
 
-def multithreading_execute(list_of_task):
-    threads = []
-    for task in list_of_task:
-        threads.append(threading.Thread(target=task))
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+class TokenBucket:
+    """
+    Allows rate acquisitions per second on average and bursts of up to capacity, rate 0 means unlimited
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token and return the number of seconds the caller has to wait before using it
+        """
+        if not self._rate:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate) - 1
+            self._updated = now
+            return 0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def acquire(self):
+        time.sleep(self.reserve())
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token only if one is available right now
+        """
+        if not self._rate:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+# one request budget for everything talking to the network API, blocking or async
+RATE_LIMITER = TokenBucket(RATE_LIMIT, RATE_BURST)
+
+
+class TaskResult(NamedTuple):
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class BoundedExecutor:
+    """
+    A reusable thread pool with at most max_workers concurrent tasks, a shared token bucket
+    limiting how often tasks start, and retry with exponential backoff and jitter
+    """
+
+    def __init__(self, max_workers: int = WORKER_THREADS, bucket: TokenBucket = RATE_LIMITER,
+                 retries: int = TASK_RETRIES, backoff: float = RETRY_BACKOFF):
+        self._max_workers = max_workers
+        self._bucket = bucket
+        self._retries = retries
+        self._backoff = backoff
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._worker = threading.local()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="hdwallet")
+            return self._pool
+
+    def _attempt(self, task: Callable[[], Any]) -> TaskResult:
+        # restored rather than cleared, a task run inline by a nested map is still on one of our workers
+        previous = getattr(self._worker, "active", False)
+        self._worker.active = True
+        try:
+            for attempt in range(self._retries + 1):
+                self._bucket.acquire()
+                try:
+                    return TaskResult(value=task())
+                except Exception as e:
+                    if attempt == self._retries:
+                        return TaskResult(error=e)
+                    time.sleep(self._backoff * 2 ** attempt * (1 + random.random()))
+        finally:
+            self._worker.active = previous
+
+    def map(self, tasks: List[Callable[[], Any]],
+            progress: Optional[Callable[[int, int], None]] = None) -> List[TaskResult]:
+        """
+        Run all tasks and return their results in task order, exceptions are collected instead of raised
+        """
+        if getattr(self._worker, "active", False):
+            # called from one of our own workers, queueing would risk exhausting the pool
+            return [self._attempt(task) for task in tasks]
+        results: List[Optional[TaskResult]] = [None] * len(tasks)
+        futures = {self._get_pool().submit(self._attempt, task): i for i, task in enumerate(tasks)}
+        for done, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, len(tasks))
+        return results
+
+
+EXECUTOR = BoundedExecutor()
+
+
+_process_pool: Optional["ProcessPoolExecutor"] = None
+
+
+def get_process_pool() -> "ProcessPoolExecutor":
+    """
+    The process pool shared by the CPU bound batch work (derivation, signing), created on first use
+    (multiprocessing is imported here as well, it costs more than the rest of the start up)
+    """
+    global _process_pool
+    if _process_pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _process_pool = ProcessPoolExecutor(max_workers=PROCESS_WORKERS)
+    return _process_pool
+
+
+def print_progress(done: int, total: int):
+    print(f"\r{done}/{total}", end="\n" if done == total else "", flush=True)
+
+
+def multithreading_execute(list_of_task, progress=None) -> List[TaskResult]:
+    results = EXECUTOR.map(list_of_task, progress)
+    errors = [result.error for result in results if not result.ok]
+    if errors:
+        # on stderr, the batch and watch commands keep stdout for their JSON lines
+        print(f"{len(errors)} of {len(results)} tasks failed, first error: {errors[0]!r}", file=sys.stderr)
+    return results
@@ -0,0 +1,11 @@
+import os
+import tempfile
+
+# the configs are read on import, the caches of a test run go to a directory of their own
+_CACHE_DIR = tempfile.mkdtemp(prefix="hdwallet-tests-")
+os.environ.setdefault("DRV_CACHE_DIR", os.path.join(_CACHE_DIR, "drv/"))
+os.environ.setdefault("TRX_CACHE_PATH", os.path.join(_CACHE_DIR, "trx.sqlite3"))
+os.environ.setdefault("USP_CACHE_PATH", os.path.join(_CACHE_DIR, "usp.sqlite3"))
+os.environ.setdefault("RATE_LIMIT", "0")
+os.environ.setdefault("RETRY_BACKOFF", "0")
+os.environ.setdefault("METRICS_EXPORTER", "")
@@ -0,0 +1,34 @@
+import asyncio
+
+from hdwallet.core.accounts import _scan_template
+
+SEED = bytes(range(64))
+
+
+class FailingUnspentsAPI:
+    """
+    The first address of account 0 has a history, fetching the unspents fails
+    """
+
+    def __init__(self, used_address):
+        self.used_address = used_address
+
+    async def get_transactions(self, address):
+        return ["00" * 32] if address == self.used_address else []
+
+    async def get_unspents_bulk(self, addresses):
+        raise ConnectionError("backend down")
+
+
+def test_failed_account_is_reported_apart_from_empty_ones():
+    from hdwallet.core.wallet import Wallet
+
+    template = "m/44'/236'/{account}'"
+    used_address = Wallet.from_seed(SEED, template.format(account=0)).receive_addresses[0]
+    reports = asyncio.run(_scan_template(FailingUnspentsAPI(used_address), SEED, template, 3))
+    assert [(report.path, type(report.error)) for report in reports] == [(template.format(account=0), ConnectionError)]
+
+
+def test_empty_account_ends_the_search():
+    reports = asyncio.run(_scan_template(FailingUnspentsAPI(None), SEED, "m/44'/236'/{account}'", 3))
+    assert reports == []
@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import io
+import json
+
+import pytest
+
+from hdwallet import batch
+from hdwallet.core.wallet import Wallet
+
+SEED = bytes(range(64)).hex()
+PATH = "m/44'/236'/41'"
+MNEMONIC = " ".join(["abandon"] * 11 + ["about"])
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    # the wallets are opened and summarized as usual, only the refreshes are skipped, failing for one xpub
+    failing = Wallet.from_seed(bytes.fromhex(SEED), "m/44'/236'/42'").xpub
+
+    async def refresh(wallet, api=None):
+        if wallet.xpub == failing:
+            raise ConnectionError("unreachable")
+
+    monkeypatch.setattr(Wallet, "async_refresh_transactions", refresh)
+    monkeypatch.setattr(Wallet, "async_refresh_unspents", refresh)
+    return failing
+
+
+def test_parse_json_and_tab_separated_lines():
+    assert batch.parse_wallet(json.dumps({"seed": SEED, "path": PATH, "id": "a"})) == {
+        "seed": SEED, "path": PATH, "id": "a"
+    }
+    assert batch.parse_wallet(f"{SEED}\t{PATH}") == {"seed": SEED, "path": PATH}
+    assert batch.parse_wallet(f"{MNEMONIC}\t{PATH}\tsecret") == {
+        "mnemonic": MNEMONIC, "path": PATH, "passphrase": "secret"
+    }
+    xpub = Wallet.from_seed(bytes.fromhex(SEED), PATH).xpub
+    assert batch.parse_wallet(xpub) == {"xpub": xpub}
+
+
+@pytest.mark.parametrize("line, error", [
+    ('{"seed": ', "Expecting value"),
+    ("not a wallet", "neither an xpub, an xprv, a hex seed nor a valid mnemonic"),
+    (json.dumps({"seed": "00"}), "invalid seed"),
+    (f"{SEED}\tm/x", "invalid path"),
+])
+def test_parse_rejects_invalid_lines(line, error):
+    with pytest.raises(ValueError, match=error):
+        batch.parse_wallet(line)
+
+
+def test_run_batch_writes_records_and_error_per_line(offline):
+    source = io.StringIO("\n".join([
+        "# comment",
+        json.dumps({"seed": SEED, "path": PATH, "id": "json"}),
+        f"{SEED}\t{PATH}",
+        "not a wallet",
+        "",
+        Wallet.from_seed(bytes.fromhex(SEED), "m/44'/236'/42'").xpub,
+    ]))
+    output = io.StringIO()
+    failures = asyncio.run(batch.run_batch(source, output, jobs=2, record_types={"address"}))
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert failures == 2
+    summaries = {record["wallet"]: record for record in records if record["type"] == "wallet"}
+    assert set(summaries) == {"json", 3}
+    assert summaries["json"]["xpub"] == summaries[3]["xpub"]
+    assert summaries["json"]["addresses"] == sum(
+        record["type"] == "address" for record in records if record["wallet"] == "json"
+    )
+    errors = {record["wallet"]: record["error"] for record in records if record["type"] == "error"}
+    assert errors == {4: "neither an xpub, an xprv, a hex seed nor a valid mnemonic",
+                      6: "ConnectionError: unreachable"}
+
+
+def run_args(path):
+    return argparse.Namespace(input=str(path), jobs=1, records="address")
+
+
+def test_run_exit_status(offline, tmp_path, capsys):
+    wallets = tmp_path / "wallets.txt"
+    wallets.write_text(f"{SEED}\t{PATH}\n")
+    assert batch.run(run_args(wallets)) == 0
+
+    wallets.write_text(f"{SEED}\t{PATH}\nnot a wallet\n")
+    assert batch.run(run_args(wallets)) == 1
+    assert '"type": "error"' in capsys.readouterr().out
+
+
+def test_run_rejects_unreadable_input(tmp_path):
+    with pytest.raises(SystemExit, match="cannot read .*missing.txt: No such file or directory"):
+        batch.run(run_args(tmp_path / "missing.txt"))
+    with pytest.raises(SystemExit, match="cannot read"):
+        batch.run(run_args(tmp_path))
+    binary = tmp_path / "wallets.bin"
+    binary.write_bytes(b"\xff\xfe\x00garbage\n")
+    with pytest.raises(SystemExit, match="not a text file"):
+        batch.run(run_args(binary))
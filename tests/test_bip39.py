@@ -0,0 +1,63 @@
+import pytest
+
+from hdwallet.bips.bip_0039.codec import entropy_to_mnemonic, is_valid_checksum, mnemonic_to_entropy, \
+    mnemonic_to_seed
+
+# from the official BIP39 test vectors (github.com/trezor/python-mnemonic, vectors.json), all with passphrase TREZOR
+VECTORS = [
+    (
+        "00000000000000000000000000000000",
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+        "c55257c360c07c72029aebc1b53c05ed0362ada38ead3e3e9efa3708e53495531f09a6987599d18264c1e1c92f2cf141630c7a3c4ab7c8"
+        "1b2f001698e7463b04",
+    ),
+    (
+        "7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f",
+        "legal winner thank year wave sausage worth useful legal winner thank yellow",
+        "2e8905819b8723fe2c1d161860e5ee1830318dbf49a83bd451cfb8440c28bd6fa457fe1296106559a3c80937a1c1069be3a3a5bd381ee6"
+        "260e8d9739fce1f607",
+    ),
+    (
+        "80808080808080808080808080808080",
+        "letter advice cage absurd amount doctor acoustic avoid letter advice cage above",
+        "d71de856f81a8acc65e6fc851a38d4d7ec216fd0796d0a6827a3ad6ed5511a30fa280f12eb2e47ed2ac03b5c462a0358d18d69fe4f985e"
+        "c81778c1b370b652a8",
+    ),
+    (
+        "ffffffffffffffffffffffffffffffff",
+        "zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo wrong",
+        "ac27495480225222079d7be181583751e86f571027b0497b5b5d11218e0a8a13332572917f0f8e5a589620c6f15b11c61dee327651a14c"
+        "34e18231052e48c069",
+    ),
+    (
+        "0000000000000000000000000000000000000000000000000000000000000000",
+        " ".join(["abandon"] * 23 + ["art"]),
+        "bda85446c68413707090a52022edd26a1c9462295029f2e60cd7c4f2bbd3097170af7a4d73245cafa9c3cca8d561a7c3de6f5d4a10be8e"
+        "d2a5e608d68f92fcc8",
+    ),
+]
+
+
+@pytest.mark.parametrize("entropy, mnemonic, seed", VECTORS)
+def test_official_vectors(entropy, mnemonic, seed):
+    assert entropy_to_mnemonic(bytes.fromhex(entropy)) == mnemonic
+    assert mnemonic_to_entropy(mnemonic).hex() == entropy
+    assert mnemonic_to_seed(mnemonic, "TREZOR").hex() == seed
+
+
+def test_checksum_and_words_are_checked():
+    assert not is_valid_checksum("abandon " * 11 + "abandon")
+    with pytest.raises(ValueError):
+        mnemonic_to_entropy("abandon " * 11 + "notaword")
+    with pytest.raises(ValueError):
+        entropy_to_mnemonic(bytes(15))
+
+
+@pytest.mark.parametrize("length", [16, 20, 24, 28, 32])
+def test_matches_bip_utils(length):
+    from bip_utils import Bip39MnemonicEncoder, Bip39SeedGenerator
+
+    entropy = bytes(range(7, 7 + length))
+    mnemonic = entropy_to_mnemonic(entropy)
+    assert mnemonic == Bip39MnemonicEncoder().Encode(entropy).ToStr()
+    assert mnemonic_to_seed(mnemonic, "pässphrase") == Bip39SeedGenerator(mnemonic).Generate("pässphrase")
@@ -0,0 +1,60 @@
+import pytest
+from bip_utils import Bip32Secp256k1, P2PKHAddrEncoder
+
+from hdwallet.core.derivation import derive_children, derive_keys
+from hdwallet.storage.derivations import PUB_KEY_SIZE, RECORD_SIZE, DerivationCache
+
+SEED = bytes(range(64))
+
+
+@pytest.fixture
+def chain_key():
+    return Bip32Secp256k1.FromSeedAndPath(SEED, "m/44'/236'/0'/0")
+
+
+def expected_child(chain_key, index):
+    child = chain_key.ChildKey(index)
+    public_key = child.PublicKey().RawCompressed().ToBytes()
+    private_key = None if child.IsPublicOnly() else child.PrivateKey().Raw().ToBytes()
+    return public_key, private_key
+
+
+def test_private_children_match_bip_utils(chain_key):
+    assert derive_children(chain_key, 0, 50) == [expected_child(chain_key, index) for index in range(50)]
+
+
+def test_public_children_match_bip_utils(chain_key):
+    chain_key.ConvertToPublic()
+    assert derive_children(chain_key, 10, 40) == [expected_child(chain_key, index) for index in range(10, 40)]
+
+
+def test_derive_keys_addresses_and_cache(chain_key):
+    derived = derive_keys(chain_key, 0, 8)
+    # the second call is served from the derivation cache
+    cached = derive_keys(chain_key, 0, 12)
+    for index, (first, second) in enumerate(zip(derived, cached)):
+        public_key, private_key = expected_child(chain_key, index)
+        assert first.public_key == second.public_key == public_key
+        assert first.private_key_bytes == second.private_key_bytes == private_key
+        assert first.address == second.address == P2PKHAddrEncoder.EncodeKey(public_key, net_ver=b"\x00")
+    assert [key.public_key for key in cached[8:]] == [expected_child(chain_key, i)[0] for i in range(8, 12)]
+
+
+def test_tampered_cache_records_are_derived_again(chain_key, tmp_path):
+    cache = DerivationCache(str(tmp_path / "cache"), chain_key.ChainCode().ToBytes())
+    keys = derive_children(chain_key, 0, 5)
+    records = [(public_key, P2PKHAddrEncoder.EncodeKey(public_key, net_ver=b"\x00")) for public_key, _ in keys]
+    cache.extend(0, records[:4])
+    assert cache.records(0, 4) == records[:4]
+
+    # the address of record 2 replaced by the one of record 0
+    with open(tmp_path / "cache", "r+b") as file:
+        file.seek(2 * RECORD_SIZE + PUB_KEY_SIZE)
+        file.write(records[0][1].encode())
+    cache = DerivationCache(str(tmp_path / "cache"), chain_key.ChainCode().ToBytes())
+    assert cache.records(0, 4) == records[:2]
+
+    cache.extend(2, records[2:])
+    assert cache.records(0, 5) == records
+    # a key with another chain code rejects every record
+    assert DerivationCache(str(tmp_path / "cache"), bytes(32)).records(0, 5) == []
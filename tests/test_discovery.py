@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from bip_utils import Bip32Secp256k1
+
+from hdwallet.core.derivation import derive_keys
+from hdwallet.core.discovery import async_scan_chain, scan_chain
+
+SEED = bytes(range(64))
+
+
+@pytest.fixture
+def chain_key():
+    return Bip32Secp256k1.FromSeedAndPath(SEED, "m/44'/236'/0'/0")
+
+
+@pytest.fixture
+def index_of(chain_key):
+    return {key.address: index for index, key in enumerate(derive_keys(chain_key, 0, 16))}.__getitem__
+
+
+def test_scan_stops_after_the_gap(chain_key, index_of):
+    scanned = list(scan_chain([], chain_key, lambda key: index_of(key.address) in (0, 3), gap_limit=5, batch_size=4))
+    assert [used for _, used in scanned] == [True, False, False, True] + [False] * 5
+
+
+def test_failed_query_is_raised(chain_key, index_of):
+    def is_used(key):
+        if index_of(key.address) == 2:
+            raise ConnectionError("backend down")
+        return False
+
+    with pytest.raises(ConnectionError):
+        list(scan_chain([], chain_key, is_used, gap_limit=5, batch_size=4))
+
+
+def test_async_failed_query_is_raised(chain_key, index_of):
+    async def is_used(key):
+        if index_of(key.address) == 2:
+            raise ConnectionError("backend down")
+        return False
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(async_scan_chain([], chain_key, is_used, gap_limit=5, batch_size=4))
+
+    async def second_used(key):
+        return index_of(key.address) == 1
+
+    scanned = asyncio.run(async_scan_chain([], chain_key, second_used, gap_limit=3, batch_size=4))
+    assert [used for _, used in scanned] == [False, True, False, False, False]
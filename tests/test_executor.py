@@ -0,0 +1,33 @@
+import threading
+
+from hdwallet.utils import BoundedExecutor, TokenBucket
+
+
+def test_nested_maps_run_inline_on_a_single_worker():
+    executor = BoundedExecutor(max_workers=1, bucket=TokenBucket(0, 0), retries=0)
+
+    def task():
+        # the second nested map used to be queued behind the very worker waiting for it
+        first = executor.map([lambda: 1, lambda: 2])
+        second = executor.map([lambda: 3])
+        return [result.value for result in first + second]
+
+    results = []
+    thread = threading.Thread(target=lambda: results.extend(executor.map([task, task])), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert [result.value for result in results] == [[1, 2, 3], [1, 2, 3]]
+
+
+def test_errors_are_collected_after_retries():
+    executor = BoundedExecutor(max_workers=2, bucket=TokenBucket(0, 0), retries=2, backoff=0)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise ValueError("boom")
+
+    result, = executor.map([failing])
+    assert not result.ok and isinstance(result.error, ValueError)
+    assert len(calls) == 3
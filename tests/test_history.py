@@ -0,0 +1,32 @@
+from bitsv.network.transaction import Transaction, TxInput, TxOutput
+
+from hdwallet.core.wallet import Wallet
+from hdwallet.storage.transactions import TRX_STORE
+
+SEED = bytes(range(64))
+EXTERNAL_SCRIPT = "76a914" + "ee" * 20 + "88ac"
+
+
+def test_history_is_merged_newest_first_with_net_amounts():
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/7'")
+    receive, other, change = wallet.receive_keys[0], wallet.receive_keys[1], wallet.change_keys[0]
+    funding = Transaction("01" * 32, [TxInput("ff" * 32, 0)], [TxOutput(receive.scriptcode.hex(), 10000)])
+    payment = Transaction("02" * 32, [TxInput(funding.txid, 0)],
+                          [TxOutput(EXTERNAL_SCRIPT, 3000), TxOutput(change.scriptcode.hex(), 6800)])
+    pending = Transaction("03" * 32, [TxInput("fe" * 32, 0)], [TxOutput(other.scriptcode.hex(), 500)])
+    TRX_STORE.put_many([funding, payment, pending])
+    TRX_STORE.sync_histories({
+        # the payment is still listed unconfirmed by the address it spent from, the change address saw it confirmed
+        receive.address: [(payment.txid, 0), (funding.txid, 100)],
+        change.address: [(payment.txid, 101)],
+        other.address: [(pending.txid, 0)],
+    }, 0, full=True)
+
+    history = list(wallet.history())
+    assert [(entry.txid, entry.height, entry.amount) for entry in history] == [
+        (pending.txid, 0, 500), (payment.txid, 101, -3200), (funding.txid, 100, 10000)
+    ]
+    assert [entry.txid for entry in wallet.history(addresses=[receive.address])] == [payment.txid, funding.txid]
+    assert [entry.txid for entry in wallet.history(min_height=101, max_height=200)] == [payment.txid]
+    assert [entry.txid for entry in wallet.history(max_amount=0)] == [payment.txid]
+    assert [entry.txid for entry in wallet.history().page(1, size=2)] == [funding.txid]
@@ -0,0 +1,51 @@
+from collections import Counter
+
+from bitsv.network.meta import Unspent
+
+from hdwallet.core.manager import WalletManager
+from hdwallet.core.network import NETWORK_API
+from hdwallet.core.wallet import Wallet
+
+SEED = bytes(range(64))
+
+
+def managed_wallets():
+    manager = WalletManager()
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/31'")
+    manager.add("xprv", wallet)
+    manager.add("xpub", Wallet.from_xpub(wallet.xpub))
+    manager.add("other", Wallet.from_seed(SEED, "m/44'/236'/32'"))
+    return manager, wallet
+
+
+def test_shared_addresses_are_fetched_once_per_refresh(monkeypatch):
+    manager, wallet = managed_wallets()
+    address = wallet.receive_addresses[0]
+    requests = Counter()
+    payment = Unspent(8000, 1, "66" * 32, 0)
+
+    def get_unspents(polled):
+        requests.update([polled])
+        return [payment] if polled == address else []
+
+    monkeypatch.setattr(NETWORK_API, "get_unspents", get_unspents)
+
+    manager.refresh_unspents()
+    assert manager.wallets_of(address) == ["xprv", "xpub"]
+    assert set(requests.values()) == {1}
+    assert len(requests) == len(manager.addresses) == 2 * len(wallet.receive_addresses + wallet.change_addresses)
+    assert manager["xprv"].balance == manager["xpub"].balance == manager.balance == 8000
+
+    manager.refresh_unspents()
+    assert set(requests.values()) == {2}
+
+
+def test_shared_histories_are_fetched_once_per_refresh(monkeypatch):
+    manager, wallet = managed_wallets()
+    requests = Counter()
+    monkeypatch.setattr(NETWORK_API, "get_history", lambda address: requests.update([address]) or [])
+    monkeypatch.setattr(NETWORK_API, "get_chain_height", lambda: 800000)
+
+    manager.refresh_transactions()
+    assert requests[wallet.receive_addresses[0]] == 1
+    assert set(requests.values()) == {1}
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from hdwallet import metrics
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.Registry()
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    return registry
+
+
+def counts(registry, name):
+    return {dict(labels)["method"]: value for sample, labels, value in registry._metrics[name].samples(name)
+            if sample == f"{name}_count"}
+
+
+def test_nested_calls_are_observed_once(registry):
+    @metrics.timed("requests", method="history")
+    def history():
+        return []
+
+    @metrics.timed("requests", method="transactions")
+    def transactions():
+        return history()
+
+    transactions()
+    history()
+    assert counts(registry, "requests") == {"transactions": 1, "history": 1}
+
+
+def test_nested_coroutines_are_observed_once(registry):
+    @metrics.timed("requests", "errors", method="history")
+    async def history():
+        raise ConnectionError
+
+    @metrics.timed("requests", "errors", method="transactions")
+    async def transactions():
+        results = await asyncio.gather(history(), history(), return_exceptions=True)
+        raise results[0]
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(transactions())
+    assert counts(registry, "requests") == {"transactions": 1}
+    assert list(registry._metrics["errors"].samples("errors")) == [("errors", (("method", "transactions"),), 1)]
@@ -0,0 +1,29 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from hdwallet.mock_api import Faults, Fixtures, serve
+
+TXID = "ab" * 32
+
+
+@pytest.fixture
+def url():
+    fixtures = Fixtures()
+    fixtures.transactions[TXID] = {"txid": TXID, "vin": [], "vout": []}
+    server = serve(fixtures, Faults(), port=0)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_known_transaction(url):
+    with urllib.request.urlopen(f"{url}/tx/hash/{TXID}") as response:
+        assert json.load(response)["txid"] == TXID
+
+
+def test_unknown_transaction_is_not_found(url):
+    with pytest.raises(urllib.error.HTTPError) as raised:
+        urllib.request.urlopen(f"{url}/tx/hash/{'cd' * 32}")
+    assert raised.value.code == 404
@@ -0,0 +1,64 @@
+import random
+import time
+
+import pytest
+from bitsv.exceptions import InsufficientFunds
+from bitsv.network.meta import Unspent
+from bitsv.transaction import DUST
+
+from hdwallet.core.payment import INPUT_SIZE, OUTPUT_SIZE, OVERHEAD_SIZE, plan_payment, select_unspents
+
+DESTINATION = "1BoatSLRHtKNngkdXEeobR76b53LETtpyT"
+CHANGE = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
+
+
+def unspents(*amounts):
+    return [Unspent(amount, 1, f"{index:064x}", 0) for index, amount in enumerate(amounts)]
+
+
+def test_exact_match_is_built_without_change():
+    # 5000 paid and 192 bytes at 1 sat/byte: one input, one output, no change
+    selected, outputs = plan_payment(unspents(10000, 5192), [(DESTINATION, 5000)], 1, CHANGE)
+    assert [unspent.amount for unspent in selected] == [5192]
+    assert outputs == [(DESTINATION, 5000)]
+    assert OVERHEAD_SIZE + INPUT_SIZE + OUTPUT_SIZE == 192
+
+
+def test_change_output_pays_the_fee_of_its_own_size():
+    selected, outputs = plan_payment(unspents(100000), [(DESTINATION, 5000)], 1, CHANGE)
+    assert outputs == [(DESTINATION, 5000), (CHANGE, 100000 - 5000 - 226)]
+    assert [unspent.amount for unspent in selected] == [100000]
+
+
+def test_knapsack_prefers_the_smallest_sufficient_subset():
+    # no changeless match, the two small unspents leave less change than the large one
+    amounts = (100000, 3000, 3100, 2900)
+    selected = select_unspents(unspents(*amounts), 5000, 1, 1, random.Random(0))
+    total = sum(unspent.amount for unspent in selected)
+    assert 100000 not in {unspent.amount for unspent in selected}
+    assert total - 5000 - (OVERHEAD_SIZE + len(selected) * INPUT_SIZE + 2 * OUTPUT_SIZE) >= DUST
+
+
+def test_insufficient_funds():
+    with pytest.raises(InsufficientFunds):
+        plan_payment(unspents(1000, 2000), [(DESTINATION, 5000)], 1, CHANGE)
+
+
+@pytest.mark.parametrize("amount", [123456, 10 ** 7, 180 * 10 ** 6])
+def test_selection_among_many_unspents_is_fast(amount):
+    # uniform amounts are the worst case of both searches, every subset of a size sums the same
+    many = unspents(*[10000] * 20000)
+    started = time.perf_counter()
+    selected = select_unspents(many, amount, 1, 1, random.Random(0))
+    assert time.perf_counter() - started < 2
+    change = sum(unspent.amount for unspent in selected) - amount - (
+        OVERHEAD_SIZE + len(selected) * INPUT_SIZE + 2 * OUTPUT_SIZE
+    )
+    assert DUST <= change < 10000
+
+
+def test_change_short_of_dust_goes_to_the_miners():
+    # 560 satoshis past a changeless payment: too much for branch and bound, too little for change above dust
+    selected, outputs = plan_payment(unspents(6000), [(DESTINATION, 5248)], 1, CHANGE)
+    assert [unspent.amount for unspent in selected] == [6000]
+    assert outputs == [(DESTINATION, 5248)]
@@ -0,0 +1,40 @@
+import io
+
+import pytest
+from bip_utils import Bip32Secp256k1
+from bitsv.exceptions import InsufficientFunds
+from bitsv.network.meta import Unspent
+from bitsv.transaction import DUST
+
+from hdwallet.core.derivation import derive_keys
+from hdwallet.core.publish import publish
+
+SEED = bytes(range(64))
+
+
+@pytest.fixture
+def key():
+    return derive_keys(Bip32Secp256k1.FromSeedAndPath(SEED, "m/44'/236'/0'/0"), 0, 1)[0]
+
+
+def test_chain_is_written_back_to_back(key):
+    output = io.BytesIO()
+    published = publish(key, bytes(2500), output, [Unspent(100000, 1, "00" * 32, 0)], chunk_size=500,
+                        tx_data_size=1000)
+    assert len(published) == 3
+    assert sum(tx.size for tx in published) == len(output.getvalue())
+    assert [tx.change.txid for tx in published[:-1]] == [tx.txid for tx in published[:-1]]
+    assert published[-1].change.amount == 100000 - sum(tx.fee for tx in published)
+
+
+def test_intermediate_change_is_at_least_dust(key):
+    # 1050 bytes in two transactions: funding the fees alone left 264 satoshis of change to the first one
+    funding = publish(key, bytes(1050), io.BytesIO(), [Unspent(10 ** 6, 1, "00" * 32, 0)], chunk_size=1000,
+                      tx_data_size=1000)
+    needed = sum(tx.fee for tx in funding) - funding[-1].fee + DUST
+    published = publish(key, bytes(1050), io.BytesIO(), [Unspent(needed, 1, "00" * 32, 0)], chunk_size=1000,
+                        tx_data_size=1000)
+    assert published[0].change.amount == DUST
+    with pytest.raises(InsufficientFunds):
+        publish(key, bytes(1050), io.BytesIO(), [Unspent(needed - 1, 1, "00" * 32, 0)], chunk_size=1000,
+                tx_data_size=1000)
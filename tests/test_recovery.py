@@ -0,0 +1,39 @@
+import pytest
+
+from hdwallet.bips.bip_0039.codec import entropy_to_mnemonic
+from hdwallet.core.network import NETWORK_API
+from hdwallet.core.recovery import RecoveryIncomplete, candidate_patterns, checksum_survivors, count_candidates, \
+    recover_mnemonic
+from hdwallet.core.wallet import Wallet
+
+MNEMONIC = entropy_to_mnemonic(bytes(range(16)))
+PATH = "m/44'/236'/0'"
+
+
+def test_candidate_counts():
+    words = MNEMONIC.split()
+    assert count_candidates(candidate_patterns(" ".join(["?"] + words[1:]))) == 2048
+    assert count_candidates(candidate_patterns(" ".join(["?", "?"] + words[2:]))) == 2048 ** 2
+    # one word short: the missing word at any of the twelve positions
+    assert count_candidates(candidate_patterns(" ".join(words[1:]))) == 12 * 2048
+
+
+def test_missing_and_mistyped_words_against_a_target():
+    words = MNEMONIC.split()
+    target = Wallet.from_mnemonic(MNEMONIC, "", PATH).receive_addresses[2]
+    phrase = " ".join(["?", words[1][:-1] + "x"] + words[2:])
+    found = recover_mnemonic(phrase, targets=[target], paths=[PATH])
+    assert (found.mnemonic, found.path, found.address) == (MNEMONIC, PATH, target)
+
+
+def test_failed_activity_lookups_are_reported(monkeypatch):
+    def get_transactions(address):
+        raise ConnectionError("backend down")
+
+    monkeypatch.setattr(NETWORK_API, "get_transactions", get_transactions)
+    phrase = " ".join(["?"] + MNEMONIC.split()[1:])
+    with pytest.raises(RecoveryIncomplete) as raised:
+        recover_mnemonic(phrase, paths=[PATH])
+    # every candidate passing the checksum is left unchecked, the right one among them
+    assert sorted(raised.value.unchecked) == sorted(checksum_survivors(candidate_patterns(phrase), [0]))
+    assert MNEMONIC in raised.value.unchecked
@@ -0,0 +1,53 @@
+from bip_utils import Bip32Secp256k1
+from bitsv import PrivateKey
+from bitsv.network.meta import Unspent
+from bitsv.transaction import create_p2pkh_transaction as bitsv_create_p2pkh_transaction
+
+from hdwallet.core.derivation import derive_keys
+from hdwallet.core.signing import create_p2pkh_transaction, sign_many, verify_many
+
+SEED = bytes(range(64))
+OUTPUTS = [("1BoatSLRHtKNngkdXEeobR76b53LETtpyT", 5000), ("1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa", 1234)]
+
+
+def unspents(count):
+    return [Unspent(10000 + index, 1, f"{index + 1:064x}", index % 3) for index in range(count)]
+
+
+def test_single_key_transaction_matches_bitsv():
+    key = derive_keys(Bip32Secp256k1.FromSeedAndPath(SEED, "m/44'/236'/0'/0"), 0, 1)[0]
+    spent = unspents(5)
+    # signatures are deterministic (RFC 6979), the raw transactions are identical
+    assert create_p2pkh_transaction([(key, unspent) for unspent in spent], OUTPUTS) == \
+        bitsv_create_p2pkh_transaction(PrivateKey.from_bytes(key.private_key_bytes), spent, OUTPUTS)
+
+
+def test_every_input_is_signed_by_its_own_key():
+    keys = derive_keys(Bip32Secp256k1.FromSeedAndPath(SEED, "m/44'/236'/0'/0"), 0, 3)
+    spent = unspents(6)
+    tx_hex = create_p2pkh_transaction([(keys[index % 3], unspent) for index, unspent in enumerate(spent)], OUTPUTS)
+    for index, unspent in enumerate(spent):
+        private_key = PrivateKey.from_bytes(keys[index % 3].private_key_bytes)
+        single = bitsv_create_p2pkh_transaction(private_key, spent, OUTPUTS)
+        # the input script of input index is the same whichever way the other inputs are signed
+        assert _input_scripts(tx_hex)[index] == _input_scripts(single)[index]
+
+
+def test_sign_and_verify_many():
+    private_keys = [bytes([index + 1]) * 32 for index in range(4)]
+    data = [bytes([index]) * 32 for index in range(4)]
+    signatures = sign_many(list(zip(private_keys, data)))
+    public_keys = [PrivateKey.from_bytes(private_key).public_key for private_key in private_keys]
+    assert verify_many(list(zip(public_keys, signatures, data))) == [True] * 4
+    assert verify_many(list(zip(public_keys, signatures, reversed(data)))) == [False] * 4
+
+
+def _input_scripts(tx_hex):
+    # version, input count below 0xfd, then per input: outpoint, script length below 0xfd, script, sequence
+    raw = bytes.fromhex(tx_hex)
+    offset, scripts = 5, []
+    for _ in range(raw[4]):
+        length = raw[offset + 36]
+        scripts.append(raw[offset + 37:offset + 37 + length])
+        offset += 37 + length + 4
+    return scripts
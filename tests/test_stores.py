@@ -0,0 +1,53 @@
+import sqlite3
+
+from bitsv.network.meta import Unspent
+from bitsv.network.transaction import Transaction, TxInput, TxOutput
+
+from hdwallet.storage.transactions import TransactionStore
+from hdwallet.storage.unspents import UnspentStore
+
+ADDRESS = "1BoatSLRHtKNngkdXEeobR76b53LETtpyT"
+CHANGE = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
+
+
+def test_legacy_histories_are_dropped_once(tmp_path):
+    path = str(tmp_path / "trx.sqlite3")
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE histories (address TEXT PRIMARY KEY, txids TEXT)")
+    TransactionStore(path).checkpoint(ADDRESS)
+    with sqlite3.connect(path) as db:
+        assert db.execute("PRAGMA user_version").fetchone()[0] == len(TransactionStore.MIGRATIONS)
+        assert not db.execute("SELECT name FROM sqlite_master WHERE name = 'histories'").fetchall()
+        # a table of that name created later is left alone by the next connections
+        db.execute("CREATE TABLE histories (address TEXT PRIMARY KEY)")
+    TransactionStore(path).checkpoint(ADDRESS)
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT name FROM sqlite_master WHERE name = 'histories'").fetchall()
+
+
+def test_transactions_round_trip_as_json(tmp_path):
+    store = TransactionStore(str(tmp_path / "trx.sqlite3"))
+    transaction = Transaction("ab" * 32, [TxInput("cd" * 32, 1)], [TxOutput("76a914" + "00" * 20 + "88ac", 5000)])
+    store.put_many([transaction])
+    assert store.missing(["ab" * 32, "ef" * 32]) == ["ef" * 32]
+    loaded = store.get_many(["ab" * 32])["ab" * 32]
+    assert loaded.txid == transaction.txid
+    assert [(tx_in.txid, tx_in.index) for tx_in in loaded.inputs] == [("cd" * 32, 1)]
+    assert [(tx_out.scriptpubkey, tx_out.amount) for tx_out in loaded.outputs] == [
+        ("76a914" + "00" * 20 + "88ac", 5000)
+    ]
+    with sqlite3.connect(store._path) as db:
+        data, = db.execute("SELECT data FROM transactions").fetchone()
+    assert isinstance(data, str)
+
+
+def test_unspents_are_replaced_and_spent(tmp_path):
+    store = UnspentStore(str(tmp_path / "usp.sqlite3"))
+    assert store.load(ADDRESS) == [] and store.refreshed_at(ADDRESS) is None
+    store.replace_many({ADDRESS: [Unspent(1000, 1, "aa" * 32, 0), Unspent(2000, 1, "aa" * 32, 1)]}, refreshed_at=5)
+    store.apply_spend([("aa" * 32, 0)], {CHANGE: [Unspent(900, 0, "bb" * 32, 1)]})
+    loaded = store.load_many([ADDRESS, CHANGE])
+    assert [(usp.txid, usp.txindex, usp.amount) for usp in loaded[ADDRESS]] == [("aa" * 32, 1, 2000)]
+    assert [(usp.txid, usp.txindex, usp.amount) for usp in loaded[CHANGE]] == [("bb" * 32, 1, 900)]
+    # a spend leaves the refresh times alone, the next refresh still reconciles with the network
+    assert store.refreshed_at(ADDRESS) == 5 and store.refreshed_at(CHANGE) is None
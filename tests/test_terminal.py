@@ -0,0 +1,43 @@
+import builtins
+
+import pytest
+from bitsv.network.meta import Unspent
+
+from hdwallet.core.network import NETWORK_API
+from hdwallet.core.wallet import Wallet
+from hdwallet.terminal import TerminalFSM
+
+SEED = bytes(range(64))
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    # nothing listens on the discard port, every request fails to connect
+    monkeypatch.setattr(NETWORK_API, "_url", "http://127.0.0.1:9/v1")
+    monkeypatch.setattr(NETWORK_API, "_chain_height", (0, 0.0))
+    terminal = TerminalFSM()
+    terminal._wallet = Wallet.from_seed(SEED, "m/44'/236'/0'")
+    return terminal
+
+
+@pytest.mark.parametrize("state", ["_refresh_transactions", "_refresh_unspents"])
+def test_network_failures_return_to_the_menu(terminal, monkeypatch, capsys, state):
+    monkeypatch.setattr(builtins, "input", lambda *_: "")
+    getattr(terminal, state)()
+    assert terminal.current == terminal._main_menu
+    # failed unspent queries are left out of the refresh and summed up on stderr
+    assert "failed" in "".join(capsys.readouterr())
+
+
+def test_failed_payment_returns_to_the_menu(terminal, monkeypatch, capsys):
+    answers = iter(["1BoatSLRHtKNngkdXEeobR76b53LETtpyT", "5000", "", ""])
+    monkeypatch.setattr(builtins, "input", lambda *_: next(answers))
+
+    def broadcast_tx(tx_hex):
+        raise ConnectionError("broadcast refused")
+
+    monkeypatch.setattr(NETWORK_API, "broadcast_tx", broadcast_tx)
+    terminal._wallet.apply_unspents({terminal._wallet.receive_addresses[0]: [Unspent(100000, 1, "ab" * 32, 0)]})
+    terminal._combination_pay()
+    assert terminal.current == terminal._main_menu
+    assert "Payment failed" in capsys.readouterr().out
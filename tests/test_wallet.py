@@ -0,0 +1,86 @@
+import pytest
+from bitsv.exceptions import InsufficientFunds
+from bitsv.network.meta import Unspent
+
+from hdwallet.configs import GAP_LIMIT
+from hdwallet.core.network import NETWORK_API
+from hdwallet.core.wallet import Wallet
+from hdwallet.storage.unspents import USP_STORE
+
+SEED = bytes(range(64))
+DESTINATION = "1BoatSLRHtKNngkdXEeobR76b53LETtpyT"
+
+
+def test_balance_indexes_keys_once(monkeypatch):
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/1'")
+    address = wallet.receive_addresses[3]
+    USP_STORE.replace_many({address: [Unspent(7000, 1, "11" * 32, 0)]})
+    loads = []
+    load_many = USP_STORE.load_many
+    monkeypatch.setattr(USP_STORE, "load_many", lambda addresses: loads.append(1) or load_many(addresses))
+
+    assert wallet.balance == 7000
+    assert wallet.balance == 7000
+    assert dict(wallet.receive_addresses_and_balances)[address] == 7000
+    assert len(loads) == 1
+
+
+def test_unspents_of_applied_addresses():
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/2'")
+    address = wallet.change_addresses[0]
+    wallet.apply_unspents({address: [Unspent(5000, 1, "22" * 32, 1)], "1BoatSLRHtKNngkdXEeobR76b53LETtpyT": []})
+    assert [unspent.amount for unspent in wallet.unspents] == [5000]
+    assert wallet.balance == 5000
+
+
+def spent_outpoints(tx_hex):
+    tx = bytes.fromhex(tx_hex)
+    position, outpoints = 5, []
+    for _ in range(tx[4]):
+        txid, txindex = tx[position:position + 32][::-1].hex(), tx[position + 32:position + 36]
+        outpoints.append((txid, int.from_bytes(txindex, "little")))
+        position += 36 + 1 + tx[position + 36] + 4
+    return outpoints
+
+
+def assert_index_agrees(wallet):
+    per_key = {(u.txid, u.txindex, u.amount) for key in wallet.receive_keys + wallet.change_keys for u in key.unspents}
+    assert {(u.txid, u.txindex, u.amount) for u in wallet.unspents} == per_key
+    assert wallet.balance == sum(amount for _, _, amount in per_key)
+
+
+def test_chained_sends_spend_unconfirmed_change(monkeypatch):
+    broadcast = []
+    monkeypatch.setattr(NETWORK_API, "broadcast_tx", broadcast.append)
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/3'")
+    funding = Unspent(100000, 1, "33" * 32, 0)
+    wallet.apply_unspents({wallet.receive_addresses[0]: [funding]})
+
+    first = wallet.send([(DESTINATION, 30000, "satoshi")])
+    change = [u for u in wallet.unspents if u.txid == first]
+    assert len(change) == 1 and change[0].confirmations == 0
+    assert_index_agrees(wallet)
+
+    second = wallet.send([(DESTINATION, 30000, "satoshi")])
+    assert spent_outpoints(broadcast[1]) == [(first, change[0].txindex)]
+    assert [u.txid for u in wallet.unspents] == [second]
+    assert_index_agrees(wallet)
+
+    with pytest.raises(InsufficientFunds):
+        wallet.send([(DESTINATION, wallet.balance, "satoshi")])
+    assert len(broadcast) == 2
+    assert (funding.txid, funding.txindex) not in {(u.txid, u.txindex) for u in wallet.unspents}
+
+
+def test_change_addresses_are_not_reused(monkeypatch):
+    monkeypatch.setattr(NETWORK_API, "broadcast_tx", lambda tx_hex: None)
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/4'")
+    wallet.apply_unspents({wallet.receive_addresses[0]: [Unspent(500000, 1, "44" * 32, 0)]})
+    change_addresses = []
+    for _ in range(GAP_LIMIT + 2):
+        txid = wallet.send([(DESTINATION, 1000, "satoshi")])
+        [change] = [u for u in wallet.unspents if u.txid == txid]
+        change_addresses.append(next(key.address for key in wallet.change_keys if change in key.unspents))
+    assert len(set(change_addresses)) == len(change_addresses)
+    assert change_addresses == wallet.change_addresses[:GAP_LIMIT + 2]
+    assert_index_agrees(wallet)
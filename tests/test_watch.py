@@ -0,0 +1,97 @@
+import random
+
+import pytest
+from bitsv.network.meta import Unspent
+
+from hdwallet.core.network import NETWORK_API
+from hdwallet.core.wallet import Wallet
+from hdwallet.core.watch import Watcher
+
+SEED = bytes(range(64))
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # dormant addresses are first due after the longest interval rather than somewhere within it
+    monkeypatch.setattr(random, "uniform", lambda low, high: high)
+    return Clock()
+
+
+def counting(clock, unspents_at, polls):
+    def get_unspents(address):
+        polls.setdefault(address, set()).add(clock.now)
+        return unspents_at(address)
+
+    return get_unspents
+
+
+def run_until(watcher, clock, end, step=10):
+    while clock.now <= end:
+        while watcher.poll_due():
+            pass
+        clock.now += step
+
+
+def test_most_overdue_addresses_are_polled_first(monkeypatch, clock):
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/21'")
+    order = []
+    monkeypatch.setattr(NETWORK_API, "get_unspents", lambda address: order.append(address) or [])
+    watcher = Watcher(wallet, lambda event: None, min_interval=10, max_interval=80, fresh_addresses=2,
+                      batch_size=3, clock=clock)
+    fresh = set(wallet.receive_addresses[:2] + wallet.change_addresses[:2])
+
+    assert [watcher.poll_due(), watcher.poll_due(), watcher.poll_due()] == [3, 1, 0]
+    assert set(order) == fresh
+
+    # the fresh addresses are due since 10, the dormant ones only since 80
+    order.clear()
+    clock.now = 80
+    assert watcher.poll_due() == 3
+    assert set(order) < fresh
+    assert watcher.poll_due() == 3
+    assert fresh < set(order)
+    assert watcher.poll_due() == 3
+    assert not fresh & set(order[6:])
+
+
+def test_quiet_addresses_back_off_and_activity_resets(monkeypatch, clock):
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/22'")
+    address = wallet.receive_addresses[10]
+    payment = Unspent(5000, 0, "55" * 32, 0)
+    polls, events = {}, []
+    unspents_at = lambda polled: [payment] if polled == address and 80 <= clock.now < 310 else []
+    monkeypatch.setattr(NETWORK_API, "get_unspents", counting(clock, unspents_at, polls))
+    watcher = Watcher(wallet, events.append, min_interval=10, max_interval=80, fresh_addresses=2,
+                      batch_size=100, clock=clock)
+
+    run_until(watcher, clock, 400)
+    assert sorted(polls[address]) == [80, 90, 110, 150, 230, 310, 320, 340, 380]
+    assert [(event.previous_balance, event.balance) for event in events if event.address == address] == [
+        (0, 5000), (5000, 0)
+    ]
+
+
+def test_failed_polls_are_retried_on_their_own_schedule(monkeypatch, clock):
+    wallet = Wallet.from_seed(SEED, "m/44'/236'/23'")
+    address = wallet.receive_addresses[10]
+    polls = {}
+
+    def unspents_at(polled):
+        if polled == address and clock.now < 150:
+            raise ConnectionError("unreachable")
+        return []
+
+    monkeypatch.setattr(NETWORK_API, "get_unspents", counting(clock, unspents_at, polls))
+    watcher = Watcher(wallet, lambda event: None, min_interval=10, max_interval=80, fresh_addresses=2,
+                      batch_size=100, clock=clock)
+
+    run_until(watcher, clock, 300)
+    assert sorted(polls[address]) == [80, 90, 110, 150, 230]